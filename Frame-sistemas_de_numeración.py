@@ -7,7 +7,18 @@ Autor: Experto en Desarrollo de Software Educativo
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+import argparse
+import decimal
+import functools
+import os
+import sys
+import time
+from tkinter import ttk, messagebox, filedialog
+
+try:
+    import numpy as np
+except ImportError:             # sin NumPy la conversión masiva usa solo Python
+    np = None
 
 # ============================================================================
 # CONFIGURACIÓN INICIAL Y PALETA DE COLORES
@@ -38,36 +49,27 @@ COLORES = {
 def decimal_a_binario(decimal_str):
     """Convierte un número decimal a binario"""
     try:
-        decimal_num = int(decimal_str)
-        if decimal_num == 0:
-            return "0"
+        decimal_num = decimal_a_entero(decimal_str)
         # Convertir a binario (sin el prefijo '0b')
-        binario = bin(decimal_num)[2:]
-        return binario
+        return format(decimal_num, "b")
     except ValueError:
         return "ERROR: No es decimal válido"
 
 def decimal_a_octal(decimal_str):
     """Convierte un número decimal a octal"""
     try:
-        decimal_num = int(decimal_str)
-        if decimal_num == 0:
-            return "0"
+        decimal_num = decimal_a_entero(decimal_str)
         # Convertir a octal (sin el prefijo '0o')
-        octal = oct(decimal_num)[2:]
-        return octal
+        return format(decimal_num, "o")
     except ValueError:
         return "ERROR: No es decimal válido"
 
 def decimal_a_hexadecimal(decimal_str):
     """Convierte un número decimal a hexadecimal"""
     try:
-        decimal_num = int(decimal_str)
-        if decimal_num == 0:
-            return "0"
+        decimal_num = decimal_a_entero(decimal_str)
         # Convertir a hexadecimal (sin el prefijo '0x')
-        hexadecimal = hex(decimal_num)[2:].upper()
-        return hexadecimal
+        return format(decimal_num, "X")
     except ValueError:
         return "ERROR: No es decimal válido"
 
@@ -79,7 +81,7 @@ def binario_a_decimal(binario_str):
             return "ERROR: No es binario válido"
         # Convertir a decimal (el segundo parámetro 2 indica base binaria)
         decimal = int(binario_str, 2)
-        return str(decimal)
+        return entero_a_decimal(decimal)
     except ValueError:
         return "ERROR: No es binario válido"
 
@@ -88,7 +90,7 @@ def octal_a_decimal(octal_str):
     try:
         # Convertir a decimal (el segundo parámetro 8 indica base octal)
         decimal = int(octal_str, 8)
-        return str(decimal)
+        return entero_a_decimal(decimal)
     except ValueError:
         return "ERROR: No es octal válido"
 
@@ -97,89 +99,479 @@ def hexadecimal_a_decimal(hex_str):
     try:
         # Convertir a decimal (el segundo parámetro 16 indica base hexadecimal)
         decimal = int(hex_str, 16)
-        return str(decimal)
+        return entero_a_decimal(decimal)
     except ValueError:
         return "ERROR: No es hexadecimal válido"
 
-def realizar_conversion():
-    """Función principal que ejecuta todas las conversiones"""
+# ============================================================================
+# MOTOR DE CONVERSIÓN DIRECTA ENTRE BASES
+# ============================================================================
+
+# Binario, octal y hexadecimal se convierten entre sí agrupando bits
+# (3 bits = 1 dígito octal, 4 bits = 1 dígito hexadecimal) sin pasar por el
+# decimal; el decimal solo se calcula cuando se pide.
+TIPOS = ("decimal", "binario", "octal", "hexadecimal")
+BASES = {"decimal": 10, "binario": 2, "octal": 8, "hexadecimal": 16}
+BITS_POR_DIGITO = {"binario": 1, "octal": 3, "hexadecimal": 4}
+
+DIGITOS_VALIDOS = {
+    "decimal": frozenset("0123456789"),
+    "binario": frozenset("01"),
+    "octal": frozenset("01234567"),
+    "hexadecimal": frozenset("0123456789abcdefABCDEF")
+}
+
+# Dígito -> grupo de bits (tabla para str.translate)
+_DIGITO_A_BITS = {
+    tipo: str.maketrans({
+        caracter: format(valor, f"0{bits}b")
+        for valor in range(1 << bits)
+        for caracter in {format(valor, "X"), format(valor, "x")}
+    })
+    for tipo, bits in BITS_POR_DIGITO.items() if bits > 1
+}
+
+# Grupo de 12 bits -> 3 dígitos hexadecimales o 4 octales (12 es múltiplo
+# de 3 y de 4, y agrupar de a 12 reduce las vueltas del bucle)
+BITS_POR_GRUPO = 12
+_BITS_A_DIGITOS = {
+    tipo: {
+        format(valor, f"0{BITS_POR_GRUPO}b"): format(valor, f"0{BITS_POR_GRUPO // bits}{'o' if bits == 3 else 'X'}")
+        for valor in range(1 << BITS_POR_GRUPO)
+    }
+    for tipo, bits in BITS_POR_DIGITO.items() if bits > 1
+}
+
+def a_binario(digitos, tipo):
+    """Pasa dígitos binarios, octales o hexadecimales a binario, dígito por dígito"""
+    if tipo != "binario":
+        digitos = digitos.translate(_DIGITO_A_BITS[tipo])
+    return digitos.lstrip("0") or "0"
+
+def desde_binario(binario, tipo):
+    """Pasa una cadena binaria a binario, octal o hexadecimal agrupando bits"""
+    if tipo == "binario":
+        return binario
+    binario = "0" * (-len(binario) % BITS_POR_GRUPO) + binario
+    tabla = _BITS_A_DIGITOS[tipo]
+    digitos = "".join([tabla[binario[i:i + BITS_POR_GRUPO]]
+                       for i in range(0, len(binario), BITS_POR_GRUPO)])
+    return digitos.lstrip("0") or "0"
+
+def es_numero_valido(texto, tipo):
+    """Indica si texto es un número válido del tipo dado (se admite signo -)"""
+    digitos = texto[1:] if texto.startswith("-") else texto
+    return bool(digitos) and set(digitos) <= DIGITOS_VALIDOS[tipo]
+
+def convertir_numero(texto, tipo, destinos=TIPOS):
+    """Convierte texto (del tipo dado) a cada tipo de destinos
+
+    Devuelve un diccionario {tipo: representación}. Lanza ValueError si el
+    texto no es un número válido de ese tipo.
+    """
+    if not es_numero_valido(texto, tipo):
+        raise ValueError(f"No es un número {tipo} válido: {texto!r}")
+    signo = "-" if texto.startswith("-") else ""
+    digitos = texto[len(signo):]
+
+    if tipo == "decimal":
+        binario = format(decimal_a_entero(digitos), "b")
+    else:
+        binario = a_binario(digitos, tipo)
+    if binario == "0":
+        signo = ""
+
+    resultados = {}
+    for destino in destinos:
+        if destino == "decimal":
+            representacion = (digitos.lstrip("0") or "0") if tipo == "decimal" else entero_a_decimal(int(binario, 2))
+        else:
+            representacion = desde_binario(binario, destino)
+        resultados[destino] = signo + representacion
+    return resultados
+
+# ============================================================================
+# CONVERSIÓN DECIMAL DE NÚMEROS ENORMES
+# ============================================================================
+
+# int(texto) y str(numero) son cuadráticos y, desde Python 3.11, fallan con
+# más de 4300 dígitos. Aquí el número se parte recursivamente en dos mitades
+# usando potencias de 10 (o de 2) que se calculan una sola vez.
+DIGITOS_CASO_BASE = 1000        # trozos que int() convierte directamente
+BITS_CASO_BASE = 3000           # trozos que str() convierte directamente
+
+_potencias_diez = {}            # k -> 10**k (int)
+_potencias_dos = {}             # k -> 2**k (decimal.Decimal exacto)
+
+def _corte(longitud, caso_base):
+    """Mayor caso_base * 2^j menor que longitud (así las potencias se repiten)"""
+    corte = caso_base
+    while corte * 2 < longitud:
+        corte *= 2
+    return corte
+
+def _potencia_diez(k):
+    """10**k con caché"""
+    if k not in _potencias_diez:
+        _potencias_diez[k] = 10 ** k if k <= DIGITOS_CASO_BASE else _potencia_diez(k // 2) ** 2
+    return _potencias_diez[k]
+
+def _potencia_dos(k):
+    """2**k como Decimal exacto, con caché (se llama dentro del contexto ilimitado)"""
+    if k not in _potencias_dos:
+        _potencias_dos[k] = decimal.Decimal(2) ** k if k <= BITS_CASO_BASE else _potencia_dos(k // 2) ** 2
+    return _potencias_dos[k]
+
+def decimal_a_entero(texto):
+    """Convierte una cadena decimal (con signo - opcional) de cualquier largo a int"""
+    signo = -1 if texto.startswith("-") else 1
+    digitos = texto[1:] if signo < 0 else texto
+    if not digitos or not set(digitos) <= DIGITOS_VALIDOS["decimal"]:
+        raise ValueError(f"No es un número decimal válido: {texto[:20]!r}")
+
+    def convertir(inicio, fin):
+        if fin - inicio <= DIGITOS_CASO_BASE:
+            return int(digitos[inicio:fin])
+        k = _corte(fin - inicio, DIGITOS_CASO_BASE)
+        return convertir(inicio, fin - k) * _potencia_diez(k) + convertir(fin - k, fin)
+
+    return signo * convertir(0, len(digitos))
+
+def entero_a_decimal(numero):
+    """Convierte un int de cualquier tamaño a su cadena decimal
+
+    Las mitades se combinan con decimal.Decimal, cuya multiplicación es
+    mucho más rápida que la de int para números grandes, y al final se
+    imprime el Decimal (lineal).
+    """
+    if numero < 0:
+        return "-" + entero_a_decimal(-numero)
+    if numero.bit_length() <= BITS_CASO_BASE:
+        return str(numero)
+
+    def convertir(n):
+        if n.bit_length() <= BITS_CASO_BASE:
+            return decimal.Decimal(n)
+        k = _corte(n.bit_length(), BITS_CASO_BASE)
+        return convertir(n >> k) * _potencia_dos(k) + convertir(n & ((1 << k) - 1))
+
+    with decimal.localcontext() as contexto:
+        contexto.prec = decimal.MAX_PREC
+        contexto.Emax = decimal.MAX_EMAX
+        contexto.Emin = decimal.MIN_EMIN
+        contexto.traps[decimal.Inexact] = True
+        return str(convertir(numero))
+
+# ============================================================================
+# CONVERSIÓN MASIVA DE ARCHIVOS
+# ============================================================================
+
+# El archivo se lee por bloques de líneas, así la memoria no crece con el
+# tamaño del archivo. Si NumPy está instalado, los números que caben en 64
+# bits se convierten de a miles a la vez; los demás (y todos, sin NumPy)
+# pasan por convertir_numero.
+BYTES_POR_BLOQUE = 1 << 18
+ENCABEZADO_CSV = "decimal,binario,octal,hexadecimal\n"
+FILA_ERROR = "ERROR,ERROR,ERROR,ERROR\n"
+
+# Dígitos que caben seguro en un entero sin signo de 64 bits
+DIGITOS_64_BITS = {"decimal": 19, "binario": 64, "octal": 21, "hexadecimal": 16}
+
+if np is not None:
+    # Carácter ASCII -> valor del dígito (255 = no es dígito)
+    _VALOR_DIGITO = np.full(256, 255, dtype=np.uint8)
+    for _valor, _caracter in enumerate("0123456789ABCDEF"):
+        _VALOR_DIGITO[ord(_caracter)] = _valor
+        _VALOR_DIGITO[ord(_caracter.lower())] = _valor
+    # Valor del dígito -> carácter ASCII
+    _CARACTER_DIGITO = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+    # Potencias de 10 y desplazamientos octales de cada posición de la salida
+    _POTENCIAS_DIEZ = np.array([10 ** k for k in range(19, -1, -1)], dtype=np.uint64)
+    _DESPLAZAMIENTOS_OCTAL = np.arange(63, -1, -3, dtype=np.uint64)
+
+def _digitos_64_bits(valores, tipo):
+    """Matriz con los dígitos de cada valor (20 decimales, 64 binarios, 22 octales o 16 hexadecimales)"""
+    if tipo == "decimal":
+        return ((valores[:, None] // _POTENCIAS_DIEZ) % np.uint64(10)).astype(np.uint8)
+    if tipo == "octal":
+        return ((valores[:, None] >> _DESPLAZAMIENTOS_OCTAL) & np.uint64(7)).astype(np.uint8)
+    # Binario y hexadecimal salen directo de los 8 bytes de cada valor
+    octetos = valores.astype(">u8").view(np.uint8).reshape(len(valores), 8)
+    if tipo == "binario":
+        return np.unpackbits(octetos, axis=1)
+    return np.stack((octetos >> 4, octetos & 15), axis=2).reshape(len(valores), 16)
+
+def _convertir_bloque_numpy(textos, tipo):
+    """Convierte con NumPy las filas de 64 bits de un bloque de textos (bytes)
+
+    Devuelve (filas CSV, máscara de filas que quedan para el camino general).
+    Las filas de la máscara traen basura y hay que reemplazarlas.
+    """
+    base = BASES[tipo]
+    cadenas = np.array(textos, dtype=f"S{DIGITOS_64_BITS[tipo] + 1}")
+    largos = np.array([len(texto) for texto in textos])
+    caracteres = cadenas.view(np.uint8).reshape(len(textos), -1)
+    negativos = caracteres[:, 0] == ord("-")
+
+    # Valor por Horner, columna por columna (cada paso procesa todas las filas)
+    valores = np.zeros(len(textos), dtype=np.uint64)
+    cifras = largos - negativos
+    invalidos = (cifras == 0) | (cifras > DIGITOS_64_BITS[tipo])
+    for columna in range(caracteres.shape[1]):
+        digitos = _VALOR_DIGITO[caracteres[:, columna]]
+        usar = (columna < largos) & ~((columna == 0) & negativos)
+        invalidos |= usar & (digitos >= base)
+        valores = np.where(usar, valores * np.uint64(base) + digitos.astype(np.uint64), valores)
+    negativos &= valores != 0
+
+    # Cada representación como matriz de dígitos; los ceros de la izquierda
+    # se vuelven el byte 0, que se descarta al final
+    columnas = []
+    for destino in TIPOS:
+        digitos = _digitos_64_bits(valores, destino)
+        matriz = _CARACTER_DIGITO[digitos]
+        relleno = np.cumsum(digitos != 0, axis=1) == 0
+        relleno[:, -1] = False
+        matriz[relleno] = 0
+        columnas.append(np.where(negativos, ord("-"), 0).astype(np.uint8)[:, None])
+        columnas.append(matriz)
+        columnas.append(np.full((len(textos), 1), ord("," if destino != TIPOS[-1] else "\n"), dtype=np.uint8))
+    filas = np.hstack(columnas)
+    return filas[filas != 0].tobytes().decode("ascii"), invalidos
+
+def _convertir_fila(texto, tipo):
+    """Fila CSV de un número de cualquier tamaño (o FILA_ERROR)"""
+    try:
+        resultados = convertir_numero(texto, tipo)
+    except ValueError:
+        return FILA_ERROR
+    return ",".join(resultados[destino] for destino in TIPOS) + "\n"
+
+def convertir_bloque(textos, tipo):
+    """Convierte una lista de números (bytes) al texto CSV de sus cuatro representaciones"""
+    if np is None:
+        return "".join([_convertir_fila(texto.decode("ascii", "replace"), tipo) for texto in textos])
+    filas, pendientes = _convertir_bloque_numpy(textos, tipo)
+    if not pendientes.any():
+        return filas
+    filas = filas.splitlines(keepends=True)
+    for indice in np.flatnonzero(pendientes):
+        filas[indice] = _convertir_fila(textos[indice].decode("ascii", "replace"), tipo)
+    return "".join(filas)
+
+def convertir_archivo(ruta_entrada, ruta_salida, tipo, columna=0):
+    """Convierte todos los números de un archivo y escribe un CSV con los cuatro sistemas
+
+    Es un generador: después de cada bloque entrega (números convertidos,
+    bytes leídos) para poder mostrar el avance. En archivos CSV se toma el
+    número de la columna indicada. Las líneas vacías dan una fila de error,
+    así la fila N de la salida siempre corresponde a la línea N de la entrada.
+    """
+    convertidos = 0
+    with open(ruta_entrada, "rb") as entrada, open(ruta_salida, "w", encoding="ascii", newline="") as salida:
+        salida.write(ENCABEZADO_CSV)
+        while True:
+            lineas = entrada.readlines(BYTES_POR_BLOQUE)
+            if not lineas:
+                break
+            if columna or ruta_entrada.lower().endswith(".csv"):
+                lineas = [linea.split(b",")[columna] if linea.count(b",") >= columna else b"" for linea in lineas]
+            textos = [linea.strip() for linea in lineas]
+            salida.write(convertir_bloque(textos, tipo))
+            convertidos += len(textos)
+            yield convertidos, entrada.tell()
+
+def convertir_archivo_en_ventana(ruta_entrada, ruta_salida, tipo):
+    """Convierte un archivo bloque a bloque con after() para no congelar la ventana"""
+    total = max(os.path.getsize(ruta_entrada), 1)
+    pasos = convertir_archivo(ruta_entrada, ruta_salida, tipo)
+    inicio = time.perf_counter()
+
+    def avanzar():
+        try:
+            convertidos, leidos = next(pasos)
+        except StopIteration:
+            segundos = time.perf_counter() - inicio
+            mostrar_mensaje_explicacion(
+                f"✅ Archivo convertido en {segundos:.1f} s.\n\nResultado guardado en:\n{ruta_salida}"
+            )
+            boton_archivo.config(state=tk.NORMAL)
+            return
+        except (OSError, UnicodeError) as error:
+            messagebox.showerror("Error", f"No se pudo convertir el archivo:\n{error}")
+            boton_archivo.config(state=tk.NORMAL)
+            return
+        mostrar_mensaje_explicacion(
+            f"⏳ Convirtiendo {os.path.basename(ruta_entrada)} ({tipo})...\n\n"
+            f"{convertidos:,} números convertidos ({leidos / total:.0%} del archivo)"
+        )
+        ventana.after(1, avanzar)
+
+    boton_archivo.config(state=tk.DISABLED)
+    avanzar()
+
+def seleccionar_archivo_para_convertir():
+    """Pide el archivo de entrada y el de salida y lanza la conversión masiva"""
+    tipo = tipo_entrada.get()
+    ruta_entrada = filedialog.askopenfilename(
+        title=f"Archivo con números en sistema {tipo}",
+        filetypes=[("Texto o CSV", "*.txt *.csv"), ("Todos los archivos", "*.*")]
+    )
+    if not ruta_entrada:
+        return
+    ruta_salida = filedialog.asksaveasfilename(
+        title="Guardar conversiones como",
+        defaultextension=".csv",
+        initialfile=os.path.splitext(os.path.basename(ruta_entrada))[0] + "_convertido.csv",
+        filetypes=[("CSV", "*.csv")]
+    )
+    if ruta_salida:
+        convertir_archivo_en_ventana(ruta_entrada, ruta_salida, tipo)
+
+def ejecutar_linea_de_comandos(argumentos):
+    """Punto de entrada sin ventana: python Frame-sistemas_de_numeración.py archivo numeros.txt ..."""
+    parser = argparse.ArgumentParser(
+        prog="Frame-sistemas_de_numeración.py",
+        description="Calculadora de sistemas numéricos: conversión masiva sin interfaz gráfica"
+    )
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    archivo = subcomandos.add_parser(
+        "archivo", aliases=["file"],
+        help="convierte un archivo con un número por línea (o una columna de un CSV)"
+    )
+    archivo.add_argument("entrada", help="archivo de texto o CSV con los números")
+    archivo.add_argument("--tipo", choices=TIPOS, default="decimal",
+                         help="sistema en que están escritos los números")
+    archivo.add_argument("--salida", "--out", dest="salida",
+                         help="CSV de salida (por defecto, <entrada>_convertido.csv)")
+    archivo.add_argument("--columna", type=int, default=0,
+                         help="columna del CSV que contiene los números (desde 0)")
+    opciones = parser.parse_args(argumentos)
+
+    salida = opciones.salida or os.path.splitext(opciones.entrada)[0] + "_convertido.csv"
+    inicio = time.perf_counter()
+    convertidos = 0
+    for convertidos, _ in convertir_archivo(opciones.entrada, salida, opciones.tipo, opciones.columna):
+        pass
+    segundos = time.perf_counter() - inicio
+    print(
+        f"{convertidos} números en {segundos:.2f} s "
+        f"({convertidos / max(segundos, 1e-9):,.0f} números/s) -> {salida}",
+        file=sys.stderr
+    )
+    return 0
+
+MENSAJE_INICIAL = "Ingresa un número y selecciona su tipo para ver las conversiones y explicaciones."
+
+MENSAJES_ERROR = {
+    "decimal": "¡Eso no es un número decimal válido!",
+    "binario": "¡Eso no es un número binario válido!\nUsa solo dígitos 0 y 1",
+    "octal": "¡Eso no es un número octal válido!\nUsa solo dígitos del 0 al 7",
+    "hexadecimal": "¡Eso no es un número hexadecimal válido!\nUsa solo 0-9 y A-F (mayúsculas o minúsculas)"
+}
+
+# Conversión mientras se escribe: espera tras la última tecla y conversiones recordadas
+RETARDO_CONVERSION_MS = 150
+CONVERSIONES_EN_CACHE = 256
+
+conversion_programada = None    # id del after() pendiente
+valores_mostrados = {}          # tipo -> texto que muestra hoy cada campo
+
+@functools.lru_cache(maxsize=CONVERSIONES_EN_CACHE)
+def convertir_con_cache(tipo, texto):
+    """convertir_numero hacia los otros tres sistemas, recordando los últimos resultados"""
+    destinos = [destino for destino in TIPOS if destino != tipo]
+    return tuple(convertir_numero(texto, tipo, destinos).items())
+
+def realizar_conversion(en_vivo=False):
+    """Función principal que ejecuta todas las conversiones
+
+    En vivo (mientras se escribe) no se abren ventanas de aviso: los errores
+    se explican en el cuadro de explicación.
+    """
     # Obtener el valor ingresado por el usuario
     entrada = entrada_numero.get().strip()
     
     if not entrada:
-        messagebox.showwarning("Entrada vacía", "Por favor, ingresa un número")
+        if en_vivo:
+            limpiar_resultados()
+            mostrar_mensaje_explicacion(MENSAJE_INICIAL)
+        else:
+            messagebox.showwarning("Entrada vacía", "Por favor, ingresa un número")
         return
     
     # Determinar el tipo de número ingresado
     tipo_ingresado = tipo_entrada.get()
     
-    # Inicializar variables para los resultados
-    decimal_result = ""
-    binario_result = ""
-    octal_result = ""
-    hexadecimal_result = ""
-    
-    # Procesar según el tipo ingresado
-    if tipo_ingresado == "decimal":
-        if entrada.isdigit() or (entrada[0] == '-' and entrada[1:].isdigit()):
-            decimal_result = entrada
-            binario_result = decimal_a_binario(entrada)
-            octal_result = decimal_a_octal(entrada)
-            hexadecimal_result = decimal_a_hexadecimal(entrada)
-        else:
-            messagebox.showerror("Error", "¡Eso no es un número decimal válido!")
-            return
-            
-    elif tipo_ingresado == "binario":
-        # Verificar si es binario válido (solo dígitos 0 y 1)
-        if all(c in '01' for c in entrada):
-            decimal_result = binario_a_decimal(entrada)
-            if "ERROR" in decimal_result:
-                messagebox.showerror("Error", "¡Número binario inválido!")
-                return
-            binario_result = entrada
-            octal_result = decimal_a_octal(decimal_result)
-            hexadecimal_result = decimal_a_hexadecimal(decimal_result)
+    # Los números enormes no se convierten en cada tecla ni se guardan en la caché
+    if en_vivo and len(entrada) > MAXIMO_CARACTERES_CAMPO:
+        limpiar_resultados()
+        mostrar_mensaje_explicacion("Número muy largo: presiona Enter o el botón de conversión para convertirlo.")
+        return
+    
+    # Convertir directamente a los otros tres sistemas
+    try:
+        if len(entrada) <= MAXIMO_CARACTERES_CAMPO:
+            resultados = dict(convertir_con_cache(tipo_ingresado, entrada))
         else:
-            messagebox.showerror("Error", "¡Eso no es un número binario válido!\nUsa solo dígitos 0 y 1")
-            return
-            
-    elif tipo_ingresado == "octal":
-        # Verificar si es octal válido (solo dígitos 0-7)
-        if all(c in '01234567' for c in entrada):
-            decimal_result = octal_a_decimal(entrada)
-            if "ERROR" in decimal_result:
-                messagebox.showerror("Error", "¡Número octal inválido!")
-                return
-            binario_result = decimal_a_binario(decimal_result)
-            octal_result = entrada
-            hexadecimal_result = decimal_a_hexadecimal(decimal_result)
+            destinos = [tipo for tipo in TIPOS if tipo != tipo_ingresado]
+            resultados = convertir_numero(entrada, tipo_ingresado, destinos)
+    except ValueError:
+        if en_vivo:
+            limpiar_resultados()
+            mostrar_mensaje_explicacion(MENSAJES_ERROR[tipo_ingresado])
         else:
-            messagebox.showerror("Error", "¡Eso no es un número octal válido!\nUsa solo dígitos del 0 al 7")
-            return
-            
-    elif tipo_ingresado == "hexadecimal":
-        # Verificar si es hexadecimal válido (solo dígitos 0-9 y letras A-F)
-        try:
-            decimal_result = hexadecimal_a_decimal(entrada)
-            if "ERROR" in decimal_result:
-                raise ValueError
-            binario_result = decimal_a_binario(decimal_result)
-            octal_result = decimal_a_octal(decimal_result)
-            hexadecimal_result = entrada.upper()
-        except:
-            messagebox.showerror("Error", "¡Eso no es un número hexadecimal válido!\nUsa solo 0-9 y A-F (mayúsculas o minúsculas)")
-            return
+            messagebox.showerror("Error", MENSAJES_ERROR[tipo_ingresado])
+        return
+    resultados[tipo_ingresado] = entrada.upper()
+    resultados_completos.clear()
+    resultados_completos.update(resultados)
     
-    # Actualizar los campos de resultado
-    resultado_decimal.set(decimal_result)
-    resultado_binario.set(binario_result)
-    resultado_octal.set(octal_result)
-    resultado_hexadecimal.set(hexadecimal_result)
+    # Actualizar los campos de resultado (abreviados si son muy largos)
+    resultados = {tipo: abreviar(valor) for tipo, valor in resultados.items()}
+    actualizar_resultados(resultados)
     
     # Mostrar explicación
-    mostrar_explicacion(tipo_ingresado, entrada, decimal_result, binario_result, 
-                       octal_result, hexadecimal_result)
+    mostrar_explicacion(tipo_ingresado, abreviar(entrada), resultados["decimal"], resultados["binario"],
+                       resultados["octal"], resultados["hexadecimal"])
+
+def actualizar_resultados(resultados):
+    """Escribe en los campos de resultado solo los valores que cambiaron"""
+    variables = {
+        "decimal": resultado_decimal,
+        "binario": resultado_binario,
+        "octal": resultado_octal,
+        "hexadecimal": resultado_hexadecimal
+    }
+    for tipo, valor in resultados.items():
+        if valores_mostrados.get(tipo) != valor:
+            variables[tipo].set(valor)
+            valores_mostrados[tipo] = valor
+
+def limpiar_resultados():
+    """Vacía los campos de resultado"""
+    resultados_completos.clear()
+    actualizar_resultados({tipo: "" for tipo in TIPOS})
+
+def programar_conversion(*args):
+    """Convierte en vivo cuando se deja de escribir por RETARDO_CONVERSION_MS"""
+    global conversion_programada
+    if conversion_programada is not None:
+        ventana.after_cancel(conversion_programada)
+        conversion_programada = None
+    if convertir_en_vivo.get():
+        conversion_programada = ventana.after(RETARDO_CONVERSION_MS, conversion_en_vivo)
+
+def al_soltar_tecla(event):
+    """Reprograma la conversión en vivo (Enter ya convirtió al presionarse)"""
+    if event.keysym != "Return":
+        programar_conversion()
+
+def conversion_en_vivo():
+    """Tarea del after() de programar_conversion"""
+    global conversion_programada
+    conversion_programada = None
+    realizar_conversion(en_vivo=True)
 
 def mostrar_explicacion(tipo_orig, entrada, decimal, binario, octal, hexa):
     """Muestra una explicación educativa del proceso de conversión"""
@@ -249,42 +641,148 @@ CONSEJO: Cada dígito hexadecimal = 4 bits binarios
 """
     }
     
+    explicacion = explicaciones[tipo_orig]
+    if any(len(valor) > MAXIMO_CARACTERES_CAMPO for valor in resultados_completos.values()):
+        explicacion += "\n🔍 Hay resultados muy largos: haz doble clic en su campo para verlos completos.\n"
+    mostrar_mensaje_explicacion(explicacion)
+
+lineas_explicacion = []         # líneas que muestra hoy el cuadro de explicación
+
+def mostrar_mensaje_explicacion(mensaje):
+    """Muestra un texto en el cuadro de explicación
+
+    Si el texto tiene tantas líneas como el anterior (lo normal al escribir
+    un número dígito a dígito) solo se reescriben las líneas que cambiaron.
+    """
+    nuevas = mensaje.split("\n")
     texto_explicacion.config(state=tk.NORMAL)
-    texto_explicacion.delete(1.0, tk.END)
-    texto_explicacion.insert(1.0, explicaciones[tipo_orig])
+    if len(nuevas) != len(lineas_explicacion):
+        texto_explicacion.delete(1.0, tk.END)
+        texto_explicacion.insert(1.0, mensaje)
+    else:
+        for numero, (vieja, nueva) in enumerate(zip(lineas_explicacion, nuevas), start=1):
+            if vieja != nueva:
+                texto_explicacion.delete(f"{numero}.0", f"{numero}.end")
+                texto_explicacion.insert(f"{numero}.0", nueva)
     texto_explicacion.config(state=tk.DISABLED)
+    lineas_explicacion[:] = nuevas
 
 def limpiar_campos():
     """Limpia todos los campos de entrada y resultados"""
     entrada_numero.delete(0, tk.END)
-    resultado_decimal.set("")
-    resultado_binario.set("")
-    resultado_octal.set("")
-    resultado_hexadecimal.set("")
-    texto_explicacion.config(state=tk.NORMAL)
-    texto_explicacion.delete(1.0, tk.END)
-    texto_explicacion.insert(1.0, "Ingresa un número y selecciona su tipo para ver las conversiones y explicaciones.")
-    texto_explicacion.config(state=tk.DISABLED)
+    limpiar_resultados()
+    mostrar_mensaje_explicacion(MENSAJE_INICIAL)
+
+# Tabla de conversión: rango máximo y filas que se dibujan a la vez
+LIMITE_TABLA = 2 ** 32
+FILAS_TABLA = 16
+
+def primer_valor_con_prefijo(prefijo, tipo, desde, hasta):
+    """Menor valor de [desde, hasta] cuya representación en tipo empieza con prefijo
+
+    Los números que empiezan con el prefijo p forman los intervalos
+    [p·b^k, (p+1)·b^k - 1] para k = 0, 1, 2...; basta recorrerlos en orden.
+    Los ceros a la izquierda del prefijo se ignoran. Devuelve None si no hay.
+    """
+    if not es_numero_valido(prefijo, tipo) or prefijo.startswith("-"):
+        return None
+    valor = int(prefijo.lstrip("0") or "0", BASES[tipo])
+    if valor == 0:
+        return 0 if desde == 0 else None
+    base = BASES[tipo]
+    potencia = 1
+    while valor * potencia <= hasta:
+        if (valor + 1) * potencia - 1 >= desde:
+            return max(valor * potencia, desde)
+        potencia *= base
+    return None
+
+def fila_tabla(valor):
+    """Las cuatro representaciones de valor para la tabla (binario en grupos de 4 bits)"""
+    binario = format(valor, "b")
+    return (
+        str(valor),
+        binario.zfill(-(-len(binario) // 4) * 4),
+        format(valor, "o"),
+        format(valor, "X")
+    )
 
 def mostrar_tabla_conversion():
-    """Muestra una tabla de conversión básica de 0 a 15"""
+    """Muestra una tabla de conversión para cualquier rango entre 0 y 2^32
+
+    Solo existen las etiquetas de FILAS_TABLA filas: al desplazarse se
+    recalcula el texto de las filas visibles, así que la cantidad de widgets
+    y la memoria no dependen del tamaño del rango.
+    """
     ventana_tabla = tk.Toplevel(ventana)
-    ventana_tabla.title("Tabla de Conversión (0-15)")
+    ventana_tabla.title("Tabla de Conversión")
     ventana_tabla.configure(bg=COLORES["fondo_principal"])
-    ventana_tabla.geometry("600x600")
+    ventana_tabla.geometry("820x700")
     
     # Centrar ventana
     ventana_tabla.transient(ventana)
     ventana_tabla.grab_set()
     
+    # Estado de la tabla: rango, primera fila visible y valor resaltado
+    estado = {"desde": 0, "hasta": 15, "primera": 0, "resaltado": None}
+    
     # Título
-    tk.Label(
+    titulo_tabla = tk.Label(
         ventana_tabla,
-        text="📊 TABLA DE CONVERSIÓN RÁPIDA (0-15)",
         font=("Arial", 16, "bold"),
         fg=COLORES["acento"],
         bg=COLORES["fondo_principal"]
-    ).pack(pady=10)
+    )
+    titulo_tabla.pack(pady=10)
+    
+    # Controles: rango y búsqueda
+    frame_controles = tk.Frame(ventana_tabla, bg=COLORES["fondo_principal"])
+    frame_controles.pack(pady=5)
+    
+    def crear_campo(texto, columna, ancho=14):
+        tk.Label(
+            frame_controles,
+            text=texto,
+            font=("Arial", 10),
+            fg=COLORES["texto_principal"],
+            bg=COLORES["fondo_principal"]
+        ).grid(row=columna // 6, column=columna % 6, padx=(10, 3), pady=3, sticky="e")
+        campo = tk.Entry(
+            frame_controles,
+            font=("Arial", 10),
+            width=ancho,
+            bg=COLORES["entrada_fondo"],
+            fg=COLORES["entrada_texto"],
+            insertbackground=COLORES["texto_principal"]
+        )
+        campo.grid(row=columna // 6, column=columna % 6 + 1, padx=3, pady=3)
+        return campo
+    
+    entrada_desde = crear_campo("Desde:", 0)
+    entrada_hasta = crear_campo("Hasta:", 2)
+    entrada_buscar = crear_campo("Buscar:", 6)
+    entrada_desde.insert(0, "0")
+    entrada_hasta.insert(0, "15")
+    
+    columna_busqueda = tk.StringVar(value="hexadecimal")
+    ttk.Combobox(
+        frame_controles,
+        textvariable=columna_busqueda,
+        values=TIPOS,
+        state="readonly",
+        width=12,
+        font=("Arial", 10)
+    ).grid(row=1, column=2, columnspan=2, padx=3, pady=3)
+    
+    estado_busqueda = tk.Label(
+        frame_controles,
+        font=("Arial", 9),
+        fg=COLORES["texto_secundario"],
+        bg=COLORES["fondo_principal"],
+        width=24,
+        anchor="w"
+    )
+    estado_busqueda.grid(row=1, column=4, columnspan=2, padx=3, pady=3, sticky="w")
     
     # Frame para la tabla
     frame_tabla = tk.Frame(ventana_tabla, bg=COLORES["fondo_secundario"])
@@ -292,6 +790,7 @@ def mostrar_tabla_conversion():
     
     # Encabezados
     encabezados = ["Decimal", "Binario", "Octal", "Hexadecimal"]
+    anchos = [12, 40, 12, 10]
     for i, encabezado in enumerate(encabezados):
         tk.Label(
             frame_tabla,
@@ -299,61 +798,129 @@ def mostrar_tabla_conversion():
             font=("Arial", 11, "bold"),
             fg=COLORES["acento"],
             bg=COLORES["fondo_secundario"],
-            width=15
+            width=anchos[i]
         ).grid(row=0, column=i, padx=2, pady=2)
     
-    # Datos de la tabla
-    for num in range(16):
-        # Fila con diferentes colores según paridad
-        color_fondo = COLORES["fondo_secundario"] if num % 2 == 0 else COLORES["fondo_principal"]
-        
-        # Decimal
-        tk.Label(
-            frame_tabla,
-            text=str(num),
-            font=("Arial", 10),
-            fg=COLORES["texto_principal"],
-            bg=color_fondo,
-            width=15
-        ).grid(row=num+1, column=0, padx=2, pady=1)
-        
-        # Binario
-        binario = bin(num)[2:].zfill(4)  # 4 bits con ceros a la izquierda
-        tk.Label(
-            frame_tabla,
-            text=binario,
-            font=("Arial", 10, "bold"),
-            fg=COLORES["acento_binario"],
-            bg=color_fondo,
-            width=15
-        ).grid(row=num+1, column=1, padx=2, pady=1)
-        
-        # Octal
-        octal = oct(num)[2:]
-        tk.Label(
-            frame_tabla,
-            text=octal,
-            font=("Arial", 10),
-            fg=COLORES["acento_octal"],
-            bg=color_fondo,
-            width=15
-        ).grid(row=num+1, column=2, padx=2, pady=1)
-        
-        # Hexadecimal
-        hexadecimal = hex(num)[2:].upper()
-        tk.Label(
-            frame_tabla,
-            text=hexadecimal,
-            font=("Arial", 10),
-            fg=COLORES["acento_hexadecimal"],
-            bg=color_fondo,
-            width=15
-        ).grid(row=num+1, column=3, padx=2, pady=1)
+    # Celdas fijas: se reutilizan para cualquier fila del rango
+    colores_columna = [COLORES["texto_principal"], COLORES["acento_binario"],
+                       COLORES["acento_octal"], COLORES["acento_hexadecimal"]]
+    celdas = [
+        [
+            tk.Label(
+                frame_tabla,
+                font=("Courier", 10, "bold" if columna == 1 else "normal"),
+                fg=colores_columna[columna],
+                width=anchos[columna]
+            )
+            for columna in range(4)
+        ]
+        for _ in range(FILAS_TABLA)
+    ]
+    for fila, etiquetas in enumerate(celdas):
+        for columna, etiqueta in enumerate(etiquetas):
+            etiqueta.grid(row=fila + 1, column=columna, padx=2, pady=1)
+    
+    barra_tabla = tk.Scrollbar(frame_tabla, orient=tk.VERTICAL)
+    barra_tabla.grid(row=1, column=4, rowspan=FILAS_TABLA, sticky="ns")
+    
+    def total_filas():
+        return estado["hasta"] - estado["desde"] + 1
+    
+    def dibujar():
+        """Calcula y muestra solo las filas visibles"""
+        primera = estado["primera"]
+        for fila, etiquetas in enumerate(celdas):
+            valor = estado["desde"] + primera + fila
+            visible = valor <= estado["hasta"]
+            textos = fila_tabla(valor) if visible else ("",) * 4
+            # Fila con diferentes colores según paridad (o resaltada)
+            if visible and valor == estado["resaltado"]:
+                color_fondo = COLORES["bordes"]
+            else:
+                color_fondo = COLORES["fondo_secundario"] if valor % 2 == 0 else COLORES["fondo_principal"]
+            for etiqueta, texto in zip(etiquetas, textos):
+                etiqueta.config(text=texto, bg=color_fondo)
+        total = total_filas()
+        barra_tabla.set(primera / total, min(primera + FILAS_TABLA, total) / total)
+    
+    def ir_a_fila(primera):
+        estado["primera"] = min(max(int(primera), 0), max(total_filas() - FILAS_TABLA, 0))
+        dibujar()
+    
+    def desplazar(*argumentos):
+        """Comando de la barra: ('moveto', fracción) o ('scroll', n, 'units'|'pages')"""
+        if argumentos[0] == "moveto":
+            ir_a_fila(float(argumentos[1]) * total_filas())
+        elif argumentos[0] == "scroll":
+            paso = FILAS_TABLA if argumentos[2] == "pages" else 1
+            ir_a_fila(estado["primera"] + int(argumentos[1]) * paso)
+    
+    def mostrar_valor(valor):
+        """Resalta valor y lo deja a la vista (en la parte de arriba de la tabla)"""
+        estado["resaltado"] = valor
+        ir_a_fila(valor - estado["desde"])
+    
+    def aplicar_rango(event=None):
+        try:
+            desde = int(entrada_desde.get())
+            hasta = int(entrada_hasta.get())
+        except ValueError:
+            messagebox.showerror("Error", "El rango debe estar formado por números decimales", parent=ventana_tabla)
+            return
+        if not 0 <= desde <= hasta <= LIMITE_TABLA:
+            messagebox.showerror("Error", f"Usa un rango entre 0 y {LIMITE_TABLA:,}", parent=ventana_tabla)
+            return
+        estado.update(desde=desde, hasta=hasta, primera=0, resaltado=None)
+        titulo_tabla.config(text=f"📊 TABLA DE CONVERSIÓN ({desde:,} - {hasta:,})")
+        dibujar()
+    
+    def buscar(siguiente=False):
+        """Búsqueda incremental: salta al primer valor cuyo texto empieza con lo escrito"""
+        prefijo = entrada_buscar.get().strip()
+        if not prefijo:
+            estado_busqueda.config(text="")
+            return
+        desde = estado["desde"]
+        if siguiente and estado["resaltado"] is not None:
+            desde = estado["resaltado"] + 1
+        valor = primer_valor_con_prefijo(prefijo, columna_busqueda.get(), desde, estado["hasta"])
+        if valor is None:
+            estado_busqueda.config(text="Sin coincidencias", fg=COLORES["acento_hexadecimal"])
+            return
+        estado_busqueda.config(text=f"Encontrado: {valor:,}  (Enter = siguiente)", fg=COLORES["texto_secundario"])
+        mostrar_valor(valor)
+    
+    def al_escribir(event):
+        # Enter ya buscó la siguiente coincidencia al presionarse
+        if event.keysym != "Return":
+            buscar()
+    
+    barra_tabla.config(command=desplazar)
+    entrada_desde.bind("<Return>", aplicar_rango)
+    entrada_hasta.bind("<Return>", aplicar_rango)
+    entrada_buscar.bind("<KeyRelease>", al_escribir)
+    entrada_buscar.bind("<Return>", lambda event: buscar(siguiente=True))
+    columna_busqueda.trace_add("write", lambda *args: buscar())
+    # Rueda del ratón: <MouseWheel> en Windows/macOS, botones 4 y 5 en Linux
+    for widget in [frame_tabla] + [etiqueta for etiquetas in celdas for etiqueta in etiquetas]:
+        widget.bind("<MouseWheel>", lambda e: desplazar("scroll", -3 if e.delta > 0 else 3, "units"))
+        widget.bind("<Button-4>", lambda e: desplazar("scroll", -3, "units"))
+        widget.bind("<Button-5>", lambda e: desplazar("scroll", 3, "units"))
+    
+    tk.Button(
+        frame_controles,
+        text="Aplicar rango",
+        command=aplicar_rango,
+        bg=COLORES["fondo_botones"],
+        fg=COLORES["texto_principal"],
+        font=("Arial", 10)
+    ).grid(row=0, column=4, columnspan=2, padx=10, pady=3)
     
     # Información adicional
     tk.Label(
         ventana_tabla,
-        text="💡 Consejo: Observa cómo los números cambian de representación en cada sistema.",
+        text="💡 Consejo: Observa cómo los números cambian de representación en cada sistema.\n"
+             "Escribe en «Buscar» el comienzo de un número en la columna elegida para saltar a él.",
         font=("Arial", 10),
         fg=COLORES["texto_secundario"],
         bg=COLORES["fondo_principal"]
@@ -369,6 +936,98 @@ def mostrar_tabla_conversion():
         font=("Arial", 10),
         width=15
     ).pack(pady=10)
+    
+    aplicar_rango()
+
+# ============================================================================
+# PRESENTACIÓN DE RESULTADOS MUY LARGOS
+# ============================================================================
+
+# Un StringVar con cientos de miles de dígitos congela la interfaz: los campos
+# muestran principio…final y el número completo se ve por páginas.
+MAXIMO_CARACTERES_CAMPO = 1000
+CARACTERES_VISTA_PREVIA = 12
+CARACTERES_POR_PAGINA = 20000
+
+resultados_completos = {}       # tipo -> representación completa del último resultado
+
+def abreviar(texto, maximo=MAXIMO_CARACTERES_CAMPO):
+    """Devuelve el texto tal cual si es corto, o principio…final si es muy largo"""
+    if len(texto) <= maximo:
+        return texto
+    return (f"{texto[:CARACTERES_VISTA_PREVIA]}…{texto[-CARACTERES_VISTA_PREVIA:]}"
+            f" ({len(texto.lstrip('-'))} dígitos)")
+
+def mostrar_resultado_completo(tipo):
+    """Muestra el último resultado de un sistema, por páginas, en otra ventana"""
+    texto = resultados_completos.get(tipo)
+    if not texto:
+        return
+    paginas = -(-len(texto) // CARACTERES_POR_PAGINA)
+    pagina = tk.IntVar(value=0)
+
+    ventana_resultado = tk.Toplevel(ventana)
+    ventana_resultado.title(f"Resultado {tipo} ({len(texto.lstrip('-'))} dígitos)")
+    ventana_resultado.configure(bg=COLORES["fondo_principal"])
+    ventana_resultado.geometry("700x500")
+    ventana_resultado.transient(ventana)
+
+    caja = tk.Text(
+        ventana_resultado,
+        font=("Courier", 10),
+        bg=COLORES["entrada_fondo"],
+        fg=COLORES["texto_principal"],
+        wrap=tk.CHAR,
+        relief=tk.SUNKEN,
+        bd=2
+    )
+    caja.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    frame_paginas = tk.Frame(ventana_resultado, bg=COLORES["fondo_principal"])
+    frame_paginas.pack(pady=(0, 10))
+
+    etiqueta_pagina = tk.Label(
+        frame_paginas,
+        font=("Arial", 10),
+        fg=COLORES["texto_secundario"],
+        bg=COLORES["fondo_principal"],
+        width=20
+    )
+
+    def mostrar_pagina(numero):
+        numero = min(max(numero, 0), paginas - 1)
+        pagina.set(numero)
+        inicio = numero * CARACTERES_POR_PAGINA
+        caja.config(state=tk.NORMAL)
+        caja.delete(1.0, tk.END)
+        caja.insert(1.0, texto[inicio:inicio + CARACTERES_POR_PAGINA])
+        caja.config(state=tk.DISABLED)
+        etiqueta_pagina.config(text=f"Página {numero + 1} de {paginas}")
+
+    def copiar_todo():
+        ventana_resultado.clipboard_clear()
+        ventana_resultado.clipboard_append(texto)
+
+    for texto_boton, comando in [
+        ("◀ Anterior", lambda: mostrar_pagina(pagina.get() - 1)),
+        (None, None),
+        ("Siguiente ▶", lambda: mostrar_pagina(pagina.get() + 1)),
+        ("📋 Copiar todo", copiar_todo),
+        ("Cerrar", ventana_resultado.destroy)
+    ]:
+        if texto_boton is None:
+            etiqueta_pagina.pack(side=tk.LEFT, padx=5)
+            continue
+        tk.Button(
+            frame_paginas,
+            text=texto_boton,
+            command=comando,
+            bg=COLORES["fondo_botones"],
+            fg=COLORES["texto_principal"],
+            font=("Arial", 10)
+        ).pack(side=tk.LEFT, padx=5)
+
+    mostrar_pagina(0)
 
 def crear_efecto_hover(boton, color_normal, color_hover):
     """Crea efecto hover para un botón"""
@@ -381,6 +1040,10 @@ def crear_efecto_hover(boton, color_normal, color_hover):
     boton.bind("<Enter>", entrar)
     boton.bind("<Leave>", salir)
 
+# Con argumentos se trabaja sin ventana (por ejemplo: archivo numeros.txt --tipo hexadecimal)
+if __name__ == "__main__" and len(sys.argv) > 1:
+    sys.exit(ejecutar_linea_de_comandos(sys.argv[1:]))
+
 # ============================================================================
 # CONFIGURACIÓN DE LA VENTANA PRINCIPAL
 # ============================================================================
@@ -540,6 +1203,21 @@ menu_tipo = ttk.Combobox(
 )
 menu_tipo.grid(row=0, column=3, padx=5, pady=5)
 
+# Conversión mientras se escribe
+convertir_en_vivo = tk.BooleanVar(value=True)
+tk.Checkbutton(
+    frame_entrada_interior,
+    text="⚡ Convertir mientras escribes",
+    variable=convertir_en_vivo,
+    command=programar_conversion,
+    font=("Arial", 10),
+    fg=COLORES["texto_principal"],
+    bg=COLORES["fondo_secundario"],
+    selectcolor=COLORES["entrada_fondo"],
+    activebackground=COLORES["fondo_secundario"],
+    activeforeground=COLORES["texto_principal"]
+).grid(row=1, column=1, columnspan=3, pady=(0, 5))
+
 # ============================================================================
 # WIDGETS - RESULTADOS
 # ============================================================================
@@ -574,7 +1252,7 @@ sistemas = [
     ("Sistema Hexadecimal", resultado_hexadecimal, "16", COLORES["acento_hexadecimal"], "Número en base 16 (0-9, A-F)")
 ]
 
-for i, (nombre, variable, base, color, descripcion) in enumerate(sistemas):
+for i, (tipo, (nombre, variable, base, color, descripcion)) in enumerate(zip(TIPOS, sistemas)):
     # Frame para cada sistema
     frame_sistema = tk.Frame(
         frame_resultados_interior,
@@ -614,6 +1292,7 @@ for i, (nombre, variable, base, color, descripcion) in enumerate(sistemas):
         justify="center"
     )
     resultado_entry.pack(pady=5)
+    resultado_entry.bind("<Double-Button-1>", lambda event, tipo=tipo: mostrar_resultado_completo(tipo))
     
     # Descripción
     tk.Label(
@@ -655,8 +1334,7 @@ texto_explicacion = tk.Text(
 texto_explicacion.pack(padx=10, pady=(0, 10), fill=tk.BOTH, expand=True)
 
 # Insertar texto inicial
-texto_explicacion.insert(1.0, "Ingresa un número y selecciona su tipo para ver las conversiones y explicaciones.")
-texto_explicacion.config(state=tk.DISABLED)
+mostrar_mensaje_explicacion(MENSAJE_INICIAL)
 
 # Barra de desplazamiento para el texto
 scrollbar = tk.Scrollbar(texto_explicacion)
@@ -709,7 +1387,7 @@ boton_limpiar.pack(side=tk.RIGHT, padx=10)
 # Botón para mostrar tabla de conversión
 boton_tabla = tk.Button(
     frame_botones_adicionales,
-    text="📊 VER TABLA DE CONVERSIÓN (0-15)",
+    text="📊 VER TABLA DE CONVERSIÓN",
     font=("Arial", 11),
     bg=COLORES["acento_binario"],
     fg=COLORES["texto_principal"],
@@ -720,12 +1398,29 @@ boton_tabla = tk.Button(
     height=1,
     command=mostrar_tabla_conversion
 )
-boton_tabla.pack(pady=5)
+boton_tabla.pack(side=tk.LEFT, expand=True, pady=5)
+
+# Botón para convertir un archivo completo
+boton_archivo = tk.Button(
+    frame_botones_adicionales,
+    text="📂 CONVERTIR ARCHIVO DE NÚMEROS",
+    font=("Arial", 11),
+    bg=COLORES["acento_octal"],
+    fg=COLORES["texto_principal"],
+    activebackground="#60a5fa",
+    relief=tk.RAISED,
+    bd=2,
+    width=30,
+    height=1,
+    command=seleccionar_archivo_para_convertir
+)
+boton_archivo.pack(side=tk.LEFT, expand=True, pady=5)
 
 # Aplicar efecto hover a todos los botones
 crear_efecto_hover(boton_convertir, COLORES["fondo_botones"], COLORES["hover_botones"])
 crear_efecto_hover(boton_limpiar, COLORES["fondo_botones"], COLORES["hover_botones"])
 crear_efecto_hover(boton_tabla, COLORES["acento_binario"], "#34d399")
+crear_efecto_hover(boton_archivo, COLORES["acento_octal"], "#60a5fa")
 
 # ============================================================================
 # INFORMACIÓN ADICIONAL
@@ -789,6 +1484,10 @@ pie_pagina.pack(pady=(0, 5))
 # Configurar el evento Enter para el campo de entrada
 entrada_numero.bind('<Return>', lambda event: realizar_conversion())
 
+# Cada tecla (o cambio de tipo) reprograma la conversión en vivo
+entrada_numero.bind('<KeyRelease>', al_soltar_tecla)
+tipo_entrada.trace_add("write", programar_conversion)
+
 # Configurar focus inicial
 entrada_numero.focus_set()
 
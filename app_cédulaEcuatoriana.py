@@ -1,6 +1,26 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import re
+import argparse
+import functools
+import http.client
+import json
+import mmap
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+try:
+    import numpy as np
+except ImportError:             # sin NumPy la validación masiva usa solo Python
+    np = None
 
 # ============================================
 # CONFIGURACIÓN DE COLORES Y ESTILOS
@@ -20,6 +40,35 @@ COLORES = {
     "borde": "#0d1b2a",             # Azul muy oscuro
 }
 
+# Diccionario de provincias del Ecuador
+PROVINCIAS = {
+    "01": "Azuay",
+    "02": "Bolívar",
+    "03": "Cañar",
+    "04": "Carchi",
+    "05": "Cotopaxi",
+    "06": "Chimborazo",
+    "07": "El Oro",
+    "08": "Esmeraldas",
+    "09": "Guayas",
+    "10": "Imbabura",
+    "11": "Loja",
+    "12": "Los Ríos",
+    "13": "Manabí",
+    "14": "Morona Santiago",
+    "15": "Napo",
+    "16": "Pastaza",
+    "17": "Pichincha",
+    "18": "Tungurahua",
+    "19": "Zamora Chinchipe",
+    "20": "Galápagos",
+    "21": "Sucumbíos",
+    "22": "Orellana",
+    "23": "Santo Domingo de los Tsáchilas",
+    "24": "Santa Elena",
+    "30": "Extranjero"
+}
+
 # ============================================
 # FUNCIONES PARA CÁLCULO DEL DÍGITO VERIFICADOR
 # ============================================
@@ -30,7 +79,7 @@ def validar_formato_cedula(cedula):
     Retorna True si es válida, False en caso contrario.
     """
     # Verificar que sean exactamente 10 dígitos numéricos
-    if not cedula.isdigit() or len(cedula) != 10:
+    if not (cedula.isascii() and cedula.isdigit()) or len(cedula) != 10:
         return False
     
     # Verificar que la provincia sea válida (01-24 o 30 para extranjeros)
@@ -40,57 +89,805 @@ def validar_formato_cedula(cedula):
     
     return True
 
+# Coeficientes para el cálculo (única fuente: la usan el cálculo rápido, la
+# explicación paso a paso y la validación masiva)
+COEFICIENTES = (2, 1, 2, 1, 2, 1, 2, 1, 2)
+
+# Para cada posición, dígito -> producto por el coeficiente (restando 9 si pasa de 9)
+_PRODUCTOS_POR_POSICION = tuple(
+    {str(digito): digito * coeficiente - 9 if digito * coeficiente > 9 else digito * coeficiente
+     for digito in range(10)}
+    for coeficiente in COEFICIENTES
+)
+
+def digito_verificador(cedula_9_digitos):
+    """
+    Calcula solo el dígito verificador (0-9) de los primeros 9 dígitos.
+    Retorna None si la entrada no son 9 dígitos.
+    """
+    if len(cedula_9_digitos) != 9 or not (cedula_9_digitos.isascii() and cedula_9_digitos.isdigit()):
+        return None
+    suma_total = 0
+    for productos, caracter in zip(_PRODUCTOS_POR_POSICION, cedula_9_digitos):
+        suma_total += productos[caracter]
+    return -suma_total % 10
+
+class ExplicacionDigitoVerificador:
+    """
+    Cálculo del dígito verificador explicado paso a paso.
+    Los pasos se generan recién cuando se piden (al abrir la ventana de pasos).
+    """
+    
+    def __init__(self, cedula_9_digitos):
+        self.cedula_9_digitos = cedula_9_digitos
+        self.digito_verificador = digito_verificador(cedula_9_digitos)
+    
+    @functools.cached_property
+    def pasos(self):
+        """Un diccionario por dígito con su posición, coeficiente y producto"""
+        pasos = []
+        for i, coeficiente in enumerate(COEFICIENTES):
+            digito = int(self.cedula_9_digitos[i])
+            producto = digito * coeficiente
+            
+            # Si el producto es mayor a 9, restar 9
+            if producto > 9:
+                producto -= 9
+            
+            pasos.append({
+                "posicion": i + 1,
+                "digito": digito,
+                "coeficiente": coeficiente,
+                "producto": producto
+            })
+        return pasos
+    
+    @property
+    def suma_total(self):
+        return sum(paso["producto"] for paso in self.pasos)
+    
+    @property
+    def residuo(self):
+        # Residuo de la división entre 10
+        return self.suma_total % 10
+
 def calcular_digito_verificador(cedula_9_digitos):
     """
     Calcula el dígito verificador para los primeros 9 dígitos de una cédula.
     Algoritmo según el Registro Civil del Ecuador.
+    Retorna una ExplicacionDigitoVerificador (o None si no son 9 dígitos).
     """
-    # Coeficientes para el cálculo
-    coeficientes = [2, 1, 2, 1, 2, 1, 2, 1, 2]
-    
-    # Verificar que la entrada tenga 9 dígitos
-    if len(cedula_9_digitos) != 9 or not cedula_9_digitos.isdigit():
+    if digito_verificador(cedula_9_digitos) is None:
         return None
+    return ExplicacionDigitoVerificador(cedula_9_digitos)
+
+# ============================================
+# VALIDACIÓN MASIVA DE CÉDULAS
+# ============================================
+
+# Las cédulas se procesan por bloques como una matriz de dígitos (una fila
+# por cédula) y el algoritmo del dígito verificador se aplica a todas las
+# filas a la vez con NumPy. Sin NumPy se valida una por una.
+CODIGOS_PROVINCIA = tuple(range(1, 25)) + (30,)     # 01-24 y 30 (extranjeros)
+
+# Estado de cada cédula (el índice es el código que devuelve la validación)
+ESTADOS_CEDULA = ("válida", "formato inválido", "provincia inválida", "dígito verificador incorrecto")
+VALIDA, FORMATO_INVALIDO, PROVINCIA_INVALIDA, DIGITO_INCORRECTO = range(4)
+
+BYTES_POR_BLOQUE = 1 << 23
+
+if np is not None:
+    _COEFICIENTES_NP = np.array(COEFICIENTES, dtype=np.uint8)
+    _PROVINCIA_VALIDA = np.zeros(100, dtype=bool)
+    _PROVINCIA_VALIDA[list(CODIGOS_PROVINCIA)] = True
+
+def estado_cedula(cedula):
+    """Código de ESTADOS_CEDULA para una sola cédula (texto)"""
+    if not (cedula.isascii() and cedula.isdigit()) or len(cedula) != 10:
+        return FORMATO_INVALIDO
+    if not validar_formato_cedula(cedula):
+        return PROVINCIA_INVALIDA
+    if digito_verificador(cedula[:9]) != int(cedula[9]):
+        return DIGITO_INCORRECTO
+    return VALIDA
+
+def _validar_matriz(caracteres, largos):
+    """Valida una matriz de caracteres ASCII (una cédula por fila, al menos 10 columnas)"""
+    digitos = caracteres[:, :10] - np.uint8(ord("0"))      # lo que no es dígito queda > 9
+    formato = (largos == 10) & (digitos <= 9).all(axis=1)
+    provincias = digitos[:, 0].astype(np.intp) * 10 + digitos[:, 1]
+    provincia_valida = _PROVINCIA_VALIDA[np.where(formato, provincias, 0)]
+    # Coeficientes 2-1-2-1...; si el producto pasa de 9 se le resta 9
+    productos = digitos[:, :9] * _COEFICIENTES_NP
+    productos -= np.uint8(9) * (productos > 9)
+    verificador = (10 - productos.sum(axis=1, dtype=np.int32) % 10) % 10
+    digito_correcto = verificador == digitos[:, 9]
+
+    estados = np.full(len(largos), VALIDA, dtype=np.uint8)
+    estados[~digito_correcto] = DIGITO_INCORRECTO
+    estados[~provincia_valida] = PROVINCIA_INVALIDA
+    estados[~formato] = FORMATO_INVALIDO
+    return {
+        "validas": estados == VALIDA,
+        "invalidas": estados != VALIDA,
+        "estados": estados,
+        "provincias": np.where(formato, provincias, -1)
+    }
+
+def validar_cedulas(cedulas):
+    """Valida muchas cédulas (lista de str o bytes) de una vez
+
+    Devuelve un diccionario de arreglos NumPy: máscaras "validas" e
+    "invalidas", "estados" (códigos de ESTADOS_CEDULA) y "provincias"
+    (código numérico, -1 si el formato es inválido).
+    """
+    cedulas = [cedula.encode("ascii", "replace") if isinstance(cedula, str) else cedula for cedula in cedulas]
+    largos = np.fromiter(map(len, cedulas), dtype=np.intp, count=len(cedulas))
+    caracteres = np.array(cedulas, dtype="S10").view(np.uint8).reshape(len(cedulas), 10)
+    return _validar_matriz(caracteres, largos)
+
+def validar_bloque(bloque):
+    """Valida un bloque de bytes con una cédula por línea
+
+    Devuelve (lista de cédulas o None, diccionario de validar_cedulas). Si
+    todas las líneas miden exactamente 10 dígitos + salto de línea, el bloque
+    se mira directo como matriz sin separar las líneas (y se devuelve None).
+    """
+    datos = np.frombuffer(bloque, dtype=np.uint8)
+    for ancho in (11, 12):              # "\n" o "\r\n"
+        if len(datos) % ancho == 0 and (datos[ancho - 1::ancho] == ord("\n")).all() \
+                and (ancho == 11 or (datos[10::ancho] == ord("\r")).all()):
+            caracteres = datos.reshape(-1, ancho)
+            return None, _validar_matriz(caracteres, np.full(len(caracteres), 10))
+    cedulas = separar_lineas(bloque)
+    return cedulas, validar_cedulas(cedulas)
+
+def separar_lineas(bloque):
+    """Cédulas de un bloque de bytes, sin espacios ni líneas vacías"""
+    return [cedula for cedula in (linea.strip() for linea in bloque.splitlines()) if cedula]
+
+def leer_bloques(archivo, columna=None):
+    """Lee un archivo binario en bloques que terminan en un salto de línea
+
+    Si se indica columna (archivo CSV) cada bloque trae solo esa columna;
+    una primera fila cuyo campo no es numérico se toma como encabezado y se salta.
+    """
+    primero = True
+    while True:
+        bloque = archivo.read(BYTES_POR_BLOQUE)
+        if not bloque:
+            return
+        if not bloque.endswith(b"\n"):
+            bloque += archivo.readline()
+        if columna is not None:
+            valores = [
+                campos[columna].strip(b"\r \"") if len(campos) > columna else b""
+                for campos in (linea.split(b",") for linea in bloque.splitlines())
+            ]
+            if primero and valores and not valores[0].isdigit():
+                del valores[0]
+            bloque = b"\n".join(valores) + b"\n"
+        primero = False
+        yield bloque
+
+def validar_archivo(ruta_entrada, salida=None, columna=None, todas=False):
+    """Valida todas las cédulas de un archivo y devuelve los totales por estado
+
+    Si se da un archivo de salida (binario) se escriben las filas
+    "cedula,estado": solo las inválidas, o todas con todas=True.
+    """
+    totales = [0] * len(ESTADOS_CEDULA)
+    sufijos = [f",{estado}\n".encode("utf-8") for estado in ESTADOS_CEDULA]
+    with open(ruta_entrada, "rb") as entrada:
+        for bloque in leer_bloques(entrada, columna):
+            if np is None:
+                cedulas = separar_lineas(bloque)
+                estados = [estado_cedula(cedula.decode("ascii", "replace")) for cedula in cedulas]
+                for estado in estados:
+                    totales[estado] += 1
+            else:
+                cedulas, resultado = validar_bloque(bloque)
+                estados = resultado["estados"]
+                for estado, cantidad in enumerate(np.bincount(estados, minlength=len(ESTADOS_CEDULA))):
+                    totales[estado] += int(cantidad)
+                if salida is not None and cedulas is None:
+                    cedulas = bloque.splitlines()
+                estados = estados.tolist()
+            if salida is not None:
+                salida.write(b"".join([
+                    cedula + sufijos[estado]
+                    for cedula, estado in zip(cedulas, estados)
+                    if todas or estado != VALIDA
+                ]))
+    return totales
+
+# ============================================
+# SERVICIO HTTP DE VALIDACIÓN
+# ============================================
+
+# Servidor con la biblioteca estándar para que otros sistemas validen cédulas:
+#   GET  /cedula/{cedula}   -> un objeto JSON
+#   POST /cedula/batch      -> cuerpo con una cédula por línea (respuesta en
+#                              JSON por líneas) o un arreglo JSON (respuesta
+#                              en arreglo JSON); la respuesta se envía por
+#                              trozos a medida que se valida.
+# Usa HTTP/1.1, así que los clientes pueden reutilizar la conexión.
+PUERTO_SERVICIO = 8080
+MAXIMO_CUERPO_LOTE = 64 << 20
+CEDULAS_POR_TROZO = 5000
+
+def resultado_cedula(cedula):
+    """Diccionario con el resultado de validar una cédula (lo que devuelve el servicio)"""
+    estado = estado_cedula(cedula)
+    formato_valido = estado != FORMATO_INVALIDO
+    return {
+        "cedula": cedula,
+        "valida": estado == VALIDA,
+        "estado": ESTADOS_CEDULA[estado],
+        "provincia": cedula[:2] if formato_valido else None,
+        "digito_verificador": digito_verificador(cedula[:9]) if formato_valido else None
+    }
+
+def fila_lote(cedula):
+    """Resultado de una cédula del lote como texto JSON
+
+    Si la cédula no se puede procesar (por ejemplo, texto que no se puede
+    codificar en UTF-8) se devuelve una fila de error: la respuesta ya empezó
+    a enviarse y no puede cortarse a la mitad.
+    """
+    try:
+        fila = json.dumps(resultado_cedula(cedula), ensure_ascii=False)
+        fila.encode("utf-8")
+        return fila
+    except (ValueError, TypeError) as error:
+        return json.dumps({"cedula": cedula, "valida": False, "estado": "error", "error": str(error)})
+
+class ManejadorCedulas(BaseHTTPRequestHandler):
+    """Atiende las peticiones del servicio de validación"""
     
-    suma_total = 0
+    protocol_version = "HTTP/1.1"
+    server_version = "CedulaEcuatoriana/1.0"
+    # Encabezados y cuerpo van en escrituras separadas: sin esto, Nagle y el
+    # ACK demorado del cliente agregan ~40 ms a cada respuesta keep-alive
+    disable_nagle_algorithm = True
     
-    # Proceso de cálculo paso a paso
-    pasos = []  # Para almacenar los pasos intermedios
+    def do_GET(self):
+        ruta = urlsplit(self.path).path
+        prefijo = "/cedula/"
+        if not ruta.startswith(prefijo) or ruta == prefijo + "batch":
+            self._responder(404, {"error": "Ruta desconocida: usa GET /cedula/{cedula}"})
+            return
+        try:
+            resultado = resultado_cedula(unquote(ruta[len(prefijo):]))
+        except (ValueError, TypeError) as error:
+            self._responder(400, {"error": f"Cédula inválida: {error}"})
+            return
+        self._responder(200, resultado)
     
-    for i in range(9):
-        digito = int(cedula_9_digitos[i])
-        coeficiente = coeficientes[i]
-        producto = digito * coeficiente
+    def do_POST(self):
+        if urlsplit(self.path).path != "/cedula/batch":
+            self._responder(404, {"error": "Ruta desconocida: usa POST /cedula/batch"})
+            return
+        largo = self.headers.get("Content-Length")
+        if largo is None or not (largo.isascii() and largo.isdigit()):
+            self._responder(411, {"error": "Falta Content-Length"})
+            return
+        if int(largo) > MAXIMO_CUERPO_LOTE:
+            self.close_connection = True
+            self._responder(413, {"error": f"El lote supera {MAXIMO_CUERPO_LOTE} bytes"})
+            return
+        cuerpo = self.rfile.read(int(largo))
         
-        # Si el producto es mayor a 9, restar 9
-        if producto > 9:
-            producto -= 9
+        # Arreglo JSON o una cédula por línea
+        es_json = "json" in self.headers.get("Content-Type", "") or cuerpo.lstrip().startswith(b"[")
+        try:
+            if es_json:
+                cedulas = json.loads(cuerpo)
+                if not isinstance(cedulas, list):
+                    raise ValueError("se esperaba un arreglo JSON")
+                cedulas = [str(cedula).strip() for cedula in cedulas]
+            else:
+                cedulas = [linea.strip() for linea in cuerpo.decode("utf-8").splitlines() if linea.strip()]
+        except ValueError as error:
+            self._responder(400, {"error": f"Cuerpo inválido: {error}"})
+            return
         
-        pasos.append({
-            "posicion": i + 1,
-            "digito": digito,
-            "coeficiente": coeficiente,
-            "producto": producto
-        })
-        
-        suma_total += producto
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json" if es_json else "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        separador = ",\n" if es_json else "\n"
+        if es_json:
+            self._enviar_trozo("[\n")
+        for inicio in range(0, len(cedulas), CEDULAS_POR_TROZO):
+            filas = separador.join(
+                fila_lote(cedula) for cedula in cedulas[inicio:inicio + CEDULAS_POR_TROZO]
+            )
+            if es_json and inicio > 0:
+                filas = separador + filas
+            self._enviar_trozo(filas if es_json else filas + "\n")
+        if es_json:
+            self._enviar_trozo("\n]\n")
+        self.wfile.write(b"0\r\n\r\n")
     
-    # Obtener el residuo de la división entre 10
-    residuo = suma_total % 10
+    def _enviar_trozo(self, texto):
+        """Escribe un trozo de una respuesta con Transfer-Encoding: chunked"""
+        datos = texto.encode("utf-8")
+        self.wfile.write(b"%X\r\n%s\r\n" % (len(datos), datos))
     
-    # Calcular el dígito verificador
-    if residuo == 0:
-        digito_verificador = 0
-    else:
-        digito_verificador = 10 - residuo
+    def _responder(self, codigo, objeto):
+        datos = json.dumps(objeto, ensure_ascii=False).encode("utf-8")
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+    
+    def log_message(self, formato, *args):
+        # Sin una línea por petición: en las pruebas de carga serían millones
+        pass
+
+def iniciar_servicio(host="127.0.0.1", puerto=PUERTO_SERVICIO):
+    """Atiende peticiones (un hilo por conexión) hasta Ctrl+C"""
+    servidor = ThreadingHTTPServer((host, puerto), ManejadorCedulas)
+    servidor.daemon_threads = True
+    print(f"Servicio de cédulas en http://{host}:{servidor.server_port}/cedula/{{cedula}}", file=sys.stderr)
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+# ============================================
+# GENERADOR DE CARGA PARA EL SERVICIO
+# ============================================
+
+def _cedulas_de_prueba(cantidad, semilla):
+    """Mezcla de cédulas válidas e inválidas para las pruebas de carga"""
+    aleatorio = random.Random(semilla)
+    cedulas = []
+    for _ in range(cantidad):
+        primeros_9 = f"{aleatorio.choice(CODIGOS_PROVINCIA):02d}{aleatorio.randrange(10 ** 7):07d}"
+        cedulas.append(primeros_9 + str(aleatorio.choice([digito_verificador(primeros_9), aleatorio.randrange(10)])))
+    return cedulas
+
+def _esperar_servicio(host, puerto, segundos=10):
+    """Espera a que el servicio acepte conexiones"""
+    limite = time.perf_counter() + segundos
+    while True:
+        try:
+            socket.create_connection((host, puerto), timeout=1).close()
+            return
+        except OSError:
+            if time.perf_counter() > limite:
+                raise
+            time.sleep(0.05)
+
+def generar_carga(host, puerto, clientes=4, peticiones=2000, lote=0, semilla=1):
+    """Lanza clientes concurrentes (con conexiones keep-alive) contra el servicio
+
+    Cada cliente hace peticiones GET /cedula/{cedula} o, si lote > 0,
+    POST /cedula/batch con lote cédulas. Devuelve peticiones/s y latencias.
+    """
+    cedulas = _cedulas_de_prueba(max(lote, 1) * 100, semilla)
+    latencias = []
+    errores = []
+    
+    def cliente(numero):
+        conexion = http.client.HTTPConnection(host, puerto, timeout=30)
+        propias = []
+        try:
+            for k in range(peticiones):
+                inicio = time.perf_counter()
+                if lote:
+                    desde = (numero * peticiones + k) * lote % len(cedulas)
+                    cuerpo = "\n".join(cedulas[desde:desde + lote]).encode("ascii")
+                    conexion.request("POST", "/cedula/batch", body=cuerpo,
+                                     headers={"Content-Type": "text/plain"})
+                else:
+                    conexion.request("GET", f"/cedula/{cedulas[(numero * peticiones + k) % len(cedulas)]}")
+                respuesta = conexion.getresponse()
+                respuesta.read()
+                propias.append(time.perf_counter() - inicio)
+                if respuesta.status != 200:
+                    errores.append(respuesta.status)
+        except (OSError, http.client.HTTPException) as error:
+            errores.append(str(error))
+        finally:
+            conexion.close()
+            latencias.extend(propias)
+    
+    hilos = [threading.Thread(target=cliente, args=(numero,)) for numero in range(clientes)]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+    
+    latencias.sort()
+    
+    def percentil(fraccion):
+        if not latencias:
+            return 0.0
+        return latencias[min(len(latencias) - 1, int(fraccion * len(latencias)))]
     
     return {
-        "digito_verificador": digito_verificador,
-        "suma_total": suma_total,
-        "residuo": residuo,
-        "pasos": pasos
+        "peticiones": len(latencias),
+        "errores": len(errores),
+        "segundos": segundos,
+        "peticiones_por_segundo": len(latencias) / max(segundos, 1e-9),
+        "cedulas_por_segundo": len(latencias) * max(lote, 1) / max(segundos, 1e-9),
+        "p50_ms": percentil(0.50) * 1000,
+        "p99_ms": percentil(0.99) * 1000
     }
 
+# ============================================
+# INFORME POR PROVINCIA (VARIOS PROCESOS)
+# ============================================
+
+# El archivo se mapea en memoria y se corta en tramos que terminan en un
+# salto de línea; cada proceso valida su tramo y devuelve una tabla de
+# conteos [provincia][estado]. La fila SIN_PROVINCIA junta las cédulas cuyo
+# formato no permite leer una provincia.
+PROCESOS_INFORME = os.cpu_count() or 1
+TRAMOS_POR_PROCESO = 4          # tramos extra para repartir mejor y mostrar avance
+SIN_PROVINCIA = 100
+
+def _tabla_vacia():
+    return [[0] * len(ESTADOS_CEDULA) for _ in range(SIN_PROVINCIA + 1)]
+
+def tramos_del_archivo(ruta, partes):
+    """Corta el archivo en hasta partes tramos (inicio, fin) que terminan en un salto de línea"""
+    tamaño = os.path.getsize(ruta)
+    if tamaño == 0:
+        return []
+    with open(ruta, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+        cortes = [0]
+        for parte in range(1, partes):
+            salto = datos.find(b"\n", max(tamaño * parte // partes, cortes[-1]))
+            if salto == -1:
+                break
+            if salto + 1 > cortes[-1]:
+                cortes.append(salto + 1)
+        if cortes[-1] < tamaño:
+            cortes.append(tamaño)
+    return list(zip(cortes, cortes[1:]))
+
+def contar_tramo(ruta, inicio, fin):
+    """Tabla de conteos [provincia][estado] de las cédulas entre los bytes inicio y fin"""
+    tabla = _tabla_vacia()
+    with open(ruta, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+        posicion = inicio
+        while posicion < fin:
+            corte = min(posicion + BYTES_POR_BLOQUE, fin)
+            if corte < fin:
+                salto = datos.find(b"\n", corte - 1, fin)
+                corte = fin if salto == -1 else salto + 1
+            bloque = datos[posicion:corte]
+            posicion = corte
+            if np is None:
+                for cedula in separar_lineas(bloque):
+                    cedula = cedula.decode("ascii", "replace")
+                    estado = estado_cedula(cedula)
+                    provincia = int(cedula[:2]) if estado != FORMATO_INVALIDO else SIN_PROVINCIA
+                    tabla[provincia][estado] += 1
+                continue
+            _, resultado = validar_bloque(bloque)
+            provincias = np.where(resultado["provincias"] < 0, SIN_PROVINCIA, resultado["provincias"])
+            conteos = np.bincount(
+                provincias * len(ESTADOS_CEDULA) + resultado["estados"],
+                minlength=(SIN_PROVINCIA + 1) * len(ESTADOS_CEDULA)
+            ).reshape(SIN_PROVINCIA + 1, len(ESTADOS_CEDULA))
+            for provincia, fila in enumerate(conteos.tolist()):
+                for estado, cantidad in enumerate(fila):
+                    tabla[provincia][estado] += cantidad
+    return tabla
+
+def sumar_tablas(tablas):
+    """Suma varias tablas de conteos [provincia][estado]"""
+    total = _tabla_vacia()
+    for tabla in tablas:
+        for provincia, fila in enumerate(tabla):
+            for estado, cantidad in enumerate(fila):
+                total[provincia][estado] += cantidad
+    return total
+
+def informe_provincias(ruta, procesos=PROCESOS_INFORME):
+    """Cuenta las cédulas de un archivo por provincia y estado usando varios procesos"""
+    tramos = tramos_del_archivo(ruta, procesos * TRAMOS_POR_PROCESO)
+    if procesos <= 1 or len(tramos) <= 1:
+        return sumar_tablas(contar_tramo(ruta, inicio, fin) for inicio, fin in tramos)
+    with multiprocessing.Pool(procesos) as pool:
+        return sumar_tablas(pool.starmap(contar_tramo, [(ruta, inicio, fin) for inicio, fin in tramos]))
+
+def filas_del_informe(tabla):
+    """(código, nombre, conteos por estado) de las provincias con alguna cédula, en orden"""
+    filas = []
+    for provincia, conteos in enumerate(tabla):
+        if not any(conteos):
+            continue
+        if provincia == SIN_PROVINCIA:
+            filas.append(("--", "Formato inválido", conteos))
+        else:
+            codigo = f"{provincia:02d}"
+            filas.append((codigo, PROVINCIAS.get(codigo, "Provincia inválida"), conteos))
+    return filas
+
+# ============================================
+# GENERADOR DE CÉDULAS DE PRUEBA
+# ============================================
+
+# Genera archivos grandes con cédulas válidas y, si se pide, una proporción
+# de inválidas de cada tipo (con su estado esperado) para probar el
+# validador, el informe y el servicio. Con NumPy cada bloque se arma como
+# una matriz de bytes (10 dígitos + salto de línea por fila) que se escribe
+# de una sola vez. La misma semilla da siempre el mismo archivo (el de
+# NumPy y el de Python puro no coinciden entre sí).
+FILAS_POR_ESCRITURA = 1 << 20
+CEDULAS_POR_PROVINCIA = 10 ** 7        # 7 dígitos después del código de provincia
+CODIGOS_SIN_PROVINCIA = tuple(codigo for codigo in range(100) if codigo not in CODIGOS_PROVINCIA)
+ESTADOS_INVALIDOS = (FORMATO_INVALIDO, PROVINCIA_INVALIDA, DIGITO_INCORRECTO)
+
+if np is not None:
+    _POTENCIAS_DIEZ = 10 ** np.arange(8, -1, -1, dtype=np.int64)
+
+def _bloque_python(aleatorio, desde, filas, provincias, invalidas, secuencial):
+    """Bloque de cédulas generadas una por una: (bytes, lista de estados)"""
+    lineas = []
+    estados = []
+    for indice in range(desde, desde + filas):
+        if secuencial:
+            provincia = provincias[indice // CEDULAS_POR_PROVINCIA]
+            resto = indice % CEDULAS_POR_PROVINCIA
+        else:
+            provincia = aleatorio.choice(provincias)
+            resto = aleatorio.randrange(CEDULAS_POR_PROVINCIA)
+        estado = VALIDA
+        if invalidas and aleatorio.random() < invalidas:
+            estado = aleatorio.choice(ESTADOS_INVALIDOS)
+        if estado == PROVINCIA_INVALIDA:
+            provincia = aleatorio.choice(CODIGOS_SIN_PROVINCIA)
+        primeros_9 = f"{provincia:02d}{resto:07d}"
+        digito = digito_verificador(primeros_9)
+        if estado == DIGITO_INCORRECTO:
+            digito = (digito + aleatorio.randrange(1, 10)) % 10
+        cedula = f"{primeros_9}{digito}"
+        if estado == FORMATO_INVALIDO:
+            posicion = aleatorio.randrange(10)
+            cedula = cedula[:posicion] + "X" + cedula[posicion + 1:]
+        lineas.append(cedula)
+        estados.append(estado)
+    return ("\n".join(lineas) + "\n").encode("ascii"), estados
+
+def _bloque_numpy(generador, desde, filas, provincias, invalidas, secuencial):
+    """Bloque de cédulas generadas como matriz: (bytes, arreglo de estados)"""
+    provincias = np.asarray(provincias, dtype=np.int64)
+    if secuencial:
+        indices = np.arange(desde, desde + filas, dtype=np.int64)
+        provincia = provincias[indices // CEDULAS_POR_PROVINCIA]
+        resto = indices % CEDULAS_POR_PROVINCIA
+    else:
+        provincia = generador.choice(provincias, filas)
+        resto = generador.integers(0, CEDULAS_POR_PROVINCIA, filas)
+    estados = np.zeros(filas, dtype=np.uint8)
+    if invalidas:
+        marcadas = np.flatnonzero(generador.random(filas) < invalidas)
+        estados[marcadas] = generador.choice(np.array(ESTADOS_INVALIDOS, dtype=np.uint8), len(marcadas))
+        sin_provincia = np.flatnonzero(estados == PROVINCIA_INVALIDA)
+        provincia[sin_provincia] = generador.choice(np.array(CODIGOS_SIN_PROVINCIA), len(sin_provincia))
+    
+    matriz = np.empty((filas, 11), dtype=np.uint8)
+    matriz[:, :9] = (provincia * CEDULAS_POR_PROVINCIA + resto)[:, None] // _POTENCIAS_DIEZ % 10
+    # Mismo cálculo que _validar_matriz: coeficientes 2-1-2-1... y resta de 9
+    productos = matriz[:, :9] * _COEFICIENTES_NP
+    productos -= np.uint8(9) * (productos > 9)
+    matriz[:, 9] = -productos.sum(axis=1, dtype=np.int32) % 10
+    incorrectas = np.flatnonzero(estados == DIGITO_INCORRECTO)
+    matriz[incorrectas, 9] = (matriz[incorrectas, 9] + generador.integers(1, 10, len(incorrectas))) % 10
+    matriz[:, :10] += np.uint8(ord("0"))
+    mal_formadas = np.flatnonzero(estados == FORMATO_INVALIDO)
+    matriz[mal_formadas, generador.integers(0, 10, len(mal_formadas))] = ord("X")
+    matriz[:, 10] = ord("\n")
+    return matriz.tobytes(), estados
+
+def generar_cedulas(cantidad, semilla=None, invalidas=0.0, provincias=CODIGOS_PROVINCIA, secuencial=False):
+    """Genera cantidad cédulas en bloques de FILAS_POR_ESCRITURA
+
+    Cada bloque es (bytes con una cédula por línea, estados esperados). Con
+    secuencial=True se recorren en orden los números de cada provincia en
+    lugar de sortearlos; invalidas es la proporción (0 a 1) de cédulas que
+    se dañan a propósito, repartida entre los tres tipos de error.
+    """
+    provincias = tuple(provincias)
+    if secuencial and cantidad > len(provincias) * CEDULAS_POR_PROVINCIA:
+        raise ValueError(f"Solo hay {len(provincias) * CEDULAS_POR_PROVINCIA:,} cédulas en esas provincias")
+    if not 0 <= invalidas <= 1:
+        raise ValueError("La proporción de inválidas debe estar entre 0 y 1")
+    if np is not None:
+        aleatorio, generar_bloque = np.random.default_rng(semilla), _bloque_numpy
+    else:
+        aleatorio, generar_bloque = random.Random(semilla), _bloque_python
+    for desde in range(0, cantidad, FILAS_POR_ESCRITURA):
+        yield generar_bloque(aleatorio, desde, min(FILAS_POR_ESCRITURA, cantidad - desde),
+                             provincias, invalidas, secuencial)
+
+def escribir_cedulas(salida, cantidad, semilla=None, invalidas=0.0, provincias=CODIGOS_PROVINCIA,
+                     secuencial=False, con_estado=False):
+    """Escribe las cédulas generadas en un archivo binario y devuelve los totales por estado
+
+    Con con_estado=True cada fila lleva el estado esperado ("cedula,estado"),
+    igual que la salida de validar_archivo.
+    """
+    totales = [0] * len(ESTADOS_CEDULA)
+    sufijos = [f",{estado}\n".encode("utf-8") for estado in ESTADOS_CEDULA]
+    for bloque, estados in generar_cedulas(cantidad, semilla, invalidas, provincias, secuencial):
+        if np is not None:
+            for estado, total in enumerate(np.bincount(estados, minlength=len(ESTADOS_CEDULA))):
+                totales[estado] += int(total)
+            estados = estados.tolist()
+        else:
+            for estado in estados:
+                totales[estado] += 1
+        if con_estado:
+            bloque = b"".join([cedula + sufijos[estado]
+                               for cedula, estado in zip(bloque.splitlines(), estados)])
+        salida.write(bloque)
+    return totales
+
+def ejecutar_linea_de_comandos(argumentos):
+    """Punto de entrada sin ventana: python app_cédulaEcuatoriana.py validar|informe|generar|servidor|carga ..."""
+    parser = argparse.ArgumentParser(
+        prog="app_cédulaEcuatoriana.py",
+        description="Dígito verificador de la cédula ecuatoriana: modos sin interfaz gráfica"
+    )
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    validar = subcomandos.add_parser(
+        "validar", aliases=["validate"],
+        help="valida un archivo con una cédula por línea (o una columna de un CSV)"
+    )
+    validar.add_argument("entrada", help="archivo de texto o CSV con las cédulas")
+    validar.add_argument("--salida", "--out", dest="salida",
+                         help="CSV donde escribir las cédulas inválidas y su motivo")
+    validar.add_argument("--todas", action="store_true",
+                         help="escribir en --salida también las cédulas válidas")
+    validar.add_argument("--columna", type=int,
+                         help="columna del CSV que contiene las cédulas (desde 0); "
+                              "si la primera fila no es numérica se toma como encabezado")
+    servidor = subcomandos.add_parser(
+        "servidor", aliases=["server"],
+        help="servicio HTTP: GET /cedula/{cedula} y POST /cedula/batch"
+    )
+    servidor.add_argument("--host", default="127.0.0.1")
+    servidor.add_argument("--puerto", "--port", dest="puerto", type=int, default=PUERTO_SERVICIO)
+    carga = subcomandos.add_parser(
+        "carga", aliases=["load"],
+        help="prueba de carga del servicio HTTP (lo inicia en localhost si no se da --puerto)"
+    )
+    carga.add_argument("--host", default="127.0.0.1")
+    carga.add_argument("--puerto", "--port", dest="puerto", type=int,
+                       help="puerto de un servicio ya iniciado")
+    carga.add_argument("--clientes", type=int, default=4, help="conexiones concurrentes")
+    carga.add_argument("--peticiones", type=int, default=2000, help="peticiones por cliente")
+    carga.add_argument("--lote", type=int, default=0,
+                       help="cédulas por petición POST /cedula/batch (0 = usar GET)")
+    informe = subcomandos.add_parser(
+        "informe", aliases=["report"],
+        help="cuenta las cédulas de un archivo por provincia y estado (varios procesos)"
+    )
+    informe.add_argument("entrada", help="archivo con una cédula por línea")
+    informe.add_argument("--procesos", "--workers", dest="procesos", type=int, default=PROCESOS_INFORME,
+                         help="cantidad de procesos de trabajo")
+    generar = subcomandos.add_parser(
+        "generar", aliases=["generate"],
+        help="genera un archivo de cédulas de prueba (válidas y, si se pide, inválidas)"
+    )
+    generar.add_argument("salida", help="archivo a crear (- para la salida estándar)")
+    generar.add_argument("--cantidad", "--count", dest="cantidad", type=int, default=1_000_000)
+    generar.add_argument("--semilla", "--seed", dest="semilla", type=int,
+                         help="la misma semilla genera siempre el mismo archivo")
+    generar.add_argument("--invalidas", type=float, default=0.0,
+                         help="proporción de cédulas inválidas, de 0 a 1 (0.1 = 10 %%)")
+    generar.add_argument("--provincia", type=int, action="append", choices=CODIGOS_PROVINCIA,
+                         metavar="CÓDIGO", help="generar solo de esta provincia (se puede repetir)")
+    generar.add_argument("--secuencial", action="store_true",
+                         help="recorrer los números en orden en lugar de sortearlos")
+    generar.add_argument("--con-estado", action="store_true",
+                         help="agregar a cada fila el estado esperado (cedula,estado)")
+    opciones = parser.parse_args(argumentos)
+    
+    if opciones.comando in ("generar", "generate"):
+        return generar_archivo_de_prueba(opciones)
+    if opciones.comando in ("informe", "report"):
+        inicio = time.perf_counter()
+        tabla = informe_provincias(opciones.entrada, opciones.procesos)
+        segundos = time.perf_counter() - inicio
+        print(f"{'Código':<7}{'Provincia':<32}" + "".join(f"{estado[:14]:>16}" for estado in ESTADOS_CEDULA))
+        total = 0
+        for codigo, nombre, conteos in filas_del_informe(tabla):
+            print(f"{codigo:<7}{nombre:<32}" + "".join(f"{cantidad:>16,}" for cantidad in conteos))
+            total += sum(conteos)
+        print(f"{total:,} cédulas en {segundos:.2f} s con {opciones.procesos} procesos "
+              f"({total / max(segundos, 1e-9):,.0f} cédulas/s)", file=sys.stderr)
+        return 0
+    if opciones.comando in ("servidor", "server"):
+        iniciar_servicio(opciones.host, opciones.puerto)
+        return 0
+    if opciones.comando in ("carga", "load"):
+        return ejecutar_prueba_de_carga(opciones)
+    
+    inicio = time.perf_counter()
+    if opciones.salida:
+        with open(opciones.salida, "wb") as salida:
+            salida.write("cedula,estado\n".encode("utf-8"))
+            totales = validar_archivo(opciones.entrada, salida, opciones.columna, opciones.todas)
+    else:
+        totales = validar_archivo(opciones.entrada, None, opciones.columna)
+    segundos = time.perf_counter() - inicio
+    
+    total = sum(totales)
+    for estado, cantidad in zip(ESTADOS_CEDULA, totales):
+        print(f"{estado:<30} {cantidad:>12,}")
+    print(
+        f"{total:,} cédulas en {segundos:.2f} s ({total / max(segundos, 1e-9):,.0f} cédulas/s)",
+        file=sys.stderr
+    )
+    return 0
+
+def generar_archivo_de_prueba(opciones):
+    """Subcomando generar: escribe el archivo y muestra los totales por estado"""
+    inicio = time.perf_counter()
+    argumentos = (opciones.cantidad, opciones.semilla, opciones.invalidas,
+                  opciones.provincia or CODIGOS_PROVINCIA, opciones.secuencial, opciones.con_estado)
+    try:
+        if opciones.salida == "-":
+            totales = escribir_cedulas(sys.stdout.buffer, *argumentos)
+        else:
+            with open(opciones.salida, "wb") as salida:
+                totales = escribir_cedulas(salida, *argumentos)
+    except ValueError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    segundos = time.perf_counter() - inicio
+    
+    for estado, cantidad in zip(ESTADOS_CEDULA, totales):
+        print(f"{estado:<30} {cantidad:>12,}", file=sys.stderr)
+    print(f"{opciones.cantidad:,} cédulas en {segundos:.2f} s "
+          f"({opciones.cantidad / max(segundos, 1e-9):,.0f} cédulas/s)", file=sys.stderr)
+    return 0
+
+def ejecutar_prueba_de_carga(opciones):
+    """Subcomando carga: inicia el servicio en otro proceso si hace falta y lo mide"""
+    proceso = None
+    puerto = opciones.puerto
+    if puerto is None:
+        with socket.socket() as libre:
+            libre.bind((opciones.host, 0))
+            puerto = libre.getsockname()[1]
+        proceso = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "servidor",
+             "--host", opciones.host, "--puerto", str(puerto)],
+            stderr=subprocess.DEVNULL
+        )
+    try:
+        _esperar_servicio(opciones.host, puerto)
+        informe = generar_carga(opciones.host, puerto, opciones.clientes,
+                                opciones.peticiones, opciones.lote)
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+    
+    print(f"Peticiones:        {informe['peticiones']:,} ({informe['errores']} errores) "
+          f"en {informe['segundos']:.2f} s con {opciones.clientes} clientes")
+    print(f"Peticiones/s:      {informe['peticiones_por_segundo']:,.0f}")
+    if opciones.lote:
+        print(f"Cédulas/s:         {informe['cedulas_por_segundo']:,.0f}")
+    print(f"Latencia p50:      {informe['p50_ms']:.2f} ms")
+    print(f"Latencia p99:      {informe['p99_ms']:.2f} ms")
+    return 1 if informe["errores"] else 0
+
 # ============================================
 # FUNCIONES PARA LA INTERFAZ GRÁFICA
 # ============================================
@@ -176,7 +973,7 @@ def mostrar_pasos_calculo(resultado, cedula_9_digitos):
     scrollbar.pack(side="right", fill="y")
     
     # Mostrar los pasos del cálculo
-    for i, paso in enumerate(resultado["pasos"]):
+    for i, paso in enumerate(resultado.pasos):
         paso_frame = tk.Frame(
             scrollable_frame,
             bg=COLORES["fondo_secundario"] if i % 2 == 0 else COLORES["fondo_terciario"],
@@ -216,7 +1013,7 @@ def mostrar_pasos_calculo(resultado, cedula_9_digitos):
     
     label_suma = tk.Label(
         suma_frame,
-        text=f"Suma total: {resultado['suma_total']}",
+        text=f"Suma total: {resultado.suma_total}",
         font=("Arial", 12, "bold"),
         bg=COLORES["fondo_secundario"],
         fg=COLORES["verde"],
@@ -233,7 +1030,7 @@ def mostrar_pasos_calculo(resultado, cedula_9_digitos):
     )
     resultado_frame.pack(fill="x", padx=5, pady=5)
     
-    texto_residuo = f"Residuo: {resultado['suma_total']} % 10 = {resultado['residuo']}"
+    texto_residuo = f"Residuo: {resultado.suma_total} % 10 = {resultado.residuo}"
     label_residuo = tk.Label(
         resultado_frame,
         text=texto_residuo,
@@ -244,10 +1041,10 @@ def mostrar_pasos_calculo(resultado, cedula_9_digitos):
     )
     label_residuo.pack()
     
-    if resultado['residuo'] == 0:
+    if resultado.residuo == 0:
         texto_dv = f"Dígito Verificador: 0 (porque el residuo es 0)"
     else:
-        texto_dv = f"Dígito Verificador: 10 - {resultado['residuo']} = {resultado['digito_verificador']}"
+        texto_dv = f"Dígito Verificador: 10 - {resultado.residuo} = {resultado.digito_verificador}"
     
     label_dv = tk.Label(
         resultado_frame,
@@ -305,7 +1102,7 @@ def calcular_y_mostrar():
         return
     
     # Mostrar el resultado en la interfaz
-    digito_calculado = resultado["digito_verificador"]
+    digito_calculado = resultado.digito_verificador
     digito_real = cedula_completa[9]  # Último dígito de la cédula ingresada
     
     # Actualizar etiquetas de resultado
@@ -341,42 +1138,141 @@ def mostrar_info_provincia(codigo_provincia):
     """
     Muestra información sobre la provincia según los dos primeros dígitos de la cédula.
     """
-    # Diccionario de provincias del Ecuador
-    provincias = {
-        "01": "Azuay",
-        "02": "Bolívar",
-        "03": "Cañar",
-        "04": "Carchi",
-        "05": "Cotopaxi",
-        "06": "Chimborazo",
-        "07": "El Oro",
-        "08": "Esmeraldas",
-        "09": "Guayas",
-        "10": "Imbabura",
-        "11": "Loja",
-        "12": "Los Ríos",
-        "13": "Manabí",
-        "14": "Morona Santiago",
-        "15": "Napo",
-        "16": "Pastaza",
-        "17": "Pichincha",
-        "18": "Tungurahua",
-        "19": "Zamora Chinchipe",
-        "20": "Galápagos",
-        "21": "Sucumbíos",
-        "22": "Orellana",
-        "23": "Santo Domingo de los Tsáchilas",
-        "24": "Santa Elena",
-        "30": "Extranjero"
-    }
-    
-    nombre_provincia = provincias.get(codigo_provincia, "Desconocida")
+    nombre_provincia = PROVINCIAS.get(codigo_provincia, "Desconocida")
     
     etiqueta_provincia.config(
         text=f"Provincia: {nombre_provincia} (Código: {codigo_provincia})",
         fg=COLORES["naranja"]
     )
 
+# Informe en curso: su pool y el próximo sondeo, para cortarlos al cerrar la ventana
+_informe = {"pool": None, "sondeo": None}
+
+def detener_informe(evento=None):
+    """Termina los procesos del informe en curso (al cerrar la ventana o ante un error)"""
+    if evento is not None and evento.widget is not ventana_principal:
+        return
+    if _informe["sondeo"] is not None:
+        ventana_principal.after_cancel(_informe["sondeo"])
+        _informe["sondeo"] = None
+    if _informe["pool"] is not None:
+        _informe["pool"].terminate()
+        _informe["pool"] = None
+
+def generar_informe_provincias():
+    """
+    Pide un archivo de cédulas, lo valida con varios procesos y muestra
+    el gráfico de cédulas por provincia.
+    """
+    ruta = filedialog.askopenfilename(
+        title="Archivo con una cédula por línea",
+        filetypes=[("Texto o CSV", "*.txt *.csv"), ("Todos los archivos", "*.*")]
+    )
+    if not ruta:
+        return
+    
+    try:
+        tramos = tramos_del_archivo(ruta, PROCESOS_INFORME * TRAMOS_POR_PROCESO)
+    except (OSError, ValueError) as error:
+        messagebox.showerror("Error", f"No se pudo leer el archivo:\n{error}")
+        return
+    if not tramos:
+        messagebox.showwarning("Archivo vacío", "El archivo no tiene ninguna cédula.")
+        return
+    pool = _informe["pool"] = multiprocessing.Pool(PROCESOS_INFORME)
+    pendientes = [pool.apply_async(contar_tramo, (ruta, inicio, fin)) for inicio, fin in tramos]
+    pool.close()
+    inicio = time.perf_counter()
+    texto_boton = boton_informe.cget("text")
+    boton_informe.config(state="disabled")
+    
+    def sondear():
+        # Revisar cada 100 ms sin bloquear la ventana
+        _informe["sondeo"] = None
+        listos = sum(tarea.ready() for tarea in pendientes)
+        if listos < len(pendientes):
+            boton_informe.config(text=f"⏳ Procesando... {listos}/{len(pendientes)}")
+            _informe["sondeo"] = ventana_principal.after(100, sondear)
+            return
+        boton_informe.config(text=texto_boton, state="normal")
+        try:
+            tabla = sumar_tablas(tarea.get() for tarea in pendientes)
+        except (OSError, ValueError) as error:
+            detener_informe()
+            messagebox.showerror("Error", f"No se pudo procesar el archivo:\n{error}")
+            return
+        pool.join()
+        _informe["pool"] = None
+        mostrar_grafico_provincias(ruta, tabla, time.perf_counter() - inicio)
+    
+    sondear()
+
+def mostrar_grafico_provincias(ruta, tabla, segundos):
+    """
+    Dibuja un gráfico de barras horizontales con las cédulas de cada provincia,
+    separando las válidas de cada tipo de error.
+    """
+    filas = filas_del_informe(tabla)
+    colores_estado = [COLORES["verde"], "#9e9e9e", COLORES["naranja"], COLORES["acento"]]
+    alto_fila = 20
+    margen_nombres = 230
+    ancho_barras = 480
+    
+    ventana_informe = tk.Toplevel(ventana_principal)
+    ventana_informe.title(f"Informe por Provincia - {os.path.basename(ruta)}")
+    ventana_informe.configure(bg=COLORES["fondo_principal"])
+    ventana_informe.transient(ventana_principal)
+    
+    # Totales por estado
+    totales = [sum(conteos[estado] for _, _, conteos in filas) for estado in range(len(ESTADOS_CEDULA))]
+    total = sum(totales)
+    resumen = tk.Label(
+        ventana_informe,
+        text=f"{total:,} cédulas procesadas en {segundos:.1f} s con {PROCESOS_INFORME} procesos\n"
+             + "   ".join(f"{estado}: {cantidad:,}" for estado, cantidad in zip(ESTADOS_CEDULA, totales)),
+        font=("Arial", 11, "bold"),
+        bg=COLORES["fondo_principal"],
+        fg=COLORES["texto_principal"],
+        pady=10
+    )
+    resumen.pack()
+    
+    canvas = tk.Canvas(
+        ventana_informe,
+        width=margen_nombres + ancho_barras + 110,
+        height=min(600, 40 + alto_fila * len(filas)),
+        bg=COLORES["fondo_secundario"],
+        highlightthickness=0,
+        scrollregion=(0, 0, margen_nombres + ancho_barras + 110, 40 + alto_fila * len(filas))
+    )
+    scrollbar = tk.Scrollbar(ventana_informe, orient="vertical", command=canvas.yview)
+    canvas.configure(yscrollcommand=scrollbar.set)
+    scrollbar.pack(side="right", fill="y")
+    canvas.pack(padx=10, pady=(0, 10), fill="both", expand=True)
+    
+    # Leyenda
+    x = 10
+    for estado, color in zip(ESTADOS_CEDULA, colores_estado):
+        canvas.create_rectangle(x, 10, x + 12, 22, fill=color, outline="")
+        texto = canvas.create_text(x + 18, 16, text=estado, anchor="w",
+                                   fill=COLORES["texto_principal"], font=("Arial", 9))
+        x = canvas.bbox(texto)[2] + 20
+    
+    # Una barra por provincia, con un tramo de color por estado
+    maximo = max((sum(conteos) for _, _, conteos in filas), default=1)
+    for i, (codigo, nombre, conteos) in enumerate(filas):
+        y = 40 + i * alto_fila
+        canvas.create_text(margen_nombres - 8, y + alto_fila / 2, text=f"{codigo}  {nombre}",
+                           anchor="e", fill=COLORES["texto_principal"], font=("Arial", 9))
+        x = margen_nombres
+        for cantidad, color in zip(conteos, colores_estado):
+            ancho = ancho_barras * cantidad / maximo
+            if ancho > 0:
+                canvas.create_rectangle(x, y + 3, x + ancho, y + alto_fila - 3, fill=color, outline="")
+            x += ancho
+        canvas.create_text(x + 6, y + alto_fila / 2, text=f"{sum(conteos):,}", anchor="w",
+                           fill=COLORES["texto_secundario"], font=("Arial", 9))
+
 def limpiar_campos():
     """
     Limpia todos los campos y resultados de la interfaz.
@@ -403,7 +1299,7 @@ def mostrar_info_algoritmo():
     """
     Muestra información sobre el algoritmo de cálculo del dígito verificador.
     """
-    info = """
+    info = f"""
     ALGORITMO PARA CALCULAR EL DÍGITO VERIFICADOR
 
     1. Tomar los primeros 9 dígitos de la cédula.
@@ -419,7 +1315,7 @@ def mostrar_info_algoritmo():
 
     Ejemplo rápido:
     Cédula: 171317612-?
-    Coeficientes: 2,1,2,1,2,1,2,1,2
+    Coeficientes: {",".join(map(str, COEFICIENTES))}
     Cálculo:
       1×2=2, 7×1=7, 1×2=2, 3×1=3, 1×2=2, 7×1=7, 6×2=12→3, 1×1=1, 2×2=4
     Suma: 2+7+2+3+2+7+3+1+4 = 31
@@ -433,247 +1329,277 @@ def mostrar_info_algoritmo():
 # CONFIGURACIÓN DE LA VENTANA PRINCIPAL
 # ============================================
 
-# Crear ventana principal
-ventana_principal = tk.Tk()
-ventana_principal.title("Cálculo del Dígito Verificador - Cédula Ecuatoriana")
-ventana_principal.configure(bg=COLORES["fondo_principal"])
-
-# Centrar la ventana en la pantalla
-ancho_ventana = 800
-alto_ventana = 900
-ancho_pantalla = ventana_principal.winfo_screenwidth()
-alto_pantalla = ventana_principal.winfo_screenheight()
-x = (ancho_pantalla // 2) - (ancho_ventana // 2)
-y = (alto_pantalla // 2) - (alto_ventana // 2)
-ventana_principal.geometry(f"{ancho_ventana}x{alto_ventana}+{x}+{y}")
-ventana_principal.resizable(False, False)
+def configurar_ventana_principal():
+    """
+    Construye la ventana principal y todos sus componentes.
+    (Se arma dentro de una función para que importar este archivo, por
+    ejemplo desde los procesos de trabajo, no abra ninguna ventana.)
+    """
+    global ventana_principal, entrada_cedula, boton_ver_pasos, boton_informe
+    global etiqueta_resultado, etiqueta_cedula_completa, etiqueta_validacion, etiqueta_provincia
+    
+    # Crear ventana principal
+    ventana_principal = tk.Tk()
+    ventana_principal.title("Cálculo del Dígito Verificador - Cédula Ecuatoriana")
+    ventana_principal.configure(bg=COLORES["fondo_principal"])
+    # Cerrar la ventana a mitad de un informe termina sus procesos
+    ventana_principal.bind("<Destroy>", detener_informe, add="+")
 
-# ============================================
-# INTERFAZ GRÁFICA - COMPONENTES
-# ============================================
+    # Centrar la ventana en la pantalla
+    ancho_ventana = 800
+    alto_ventana = 900
+    ancho_pantalla = ventana_principal.winfo_screenwidth()
+    alto_pantalla = ventana_principal.winfo_screenheight()
+    x = (ancho_pantalla // 2) - (ancho_ventana // 2)
+    y = (alto_pantalla // 2) - (alto_ventana // 2)
+    ventana_principal.geometry(f"{ancho_ventana}x{alto_ventana}+{x}+{y}")
+    ventana_principal.resizable(False, False)
 
-# Marco principal para organizar los elementos
-marco_principal = tk.Frame(ventana_principal, bg=COLORES["fondo_principal"], padx=20, pady=20)
-marco_principal.pack(fill="both", expand=True)
-
-# Título de la aplicación
-titulo = tk.Label(
-    marco_principal,
-    text="CÁLCULO DEL DÍGITO VERIFICADOR",
-    font=("Arial", 24, "bold"),
-    bg=COLORES["fondo_principal"],
-    fg=COLORES["texto_principal"],
-    pady=20
-)
-titulo.pack()
-
-subtitulo = tk.Label(
-    marco_principal,
-    text="Cédula Ecuatoriana - Aplicación Educativa",
-    font=("Arial", 14),
-    bg=COLORES["fondo_principal"],
-    fg=COLORES["texto_secundario"],
-    pady=5
-)
-subtitulo.pack()
-
-# Línea separadora
-separador = ttk.Separator(marco_principal, orient="horizontal")
-separador.pack(fill="x", pady=20)
-
-# Marco para la explicación
-marco_explicacion = tk.Frame(
-    marco_principal,
-    bg=COLORES["fondo_secundario"],
-    relief="ridge",
-    borderwidth=2,
-    padx=15,
-    pady=15
-)
-marco_explicacion.pack(fill="x", pady=10)
-
-explicacion = tk.Label(
-    marco_explicacion,
-    text="El dígito verificador es el último número de la cédula ecuatoriana (posición 10).\n"
-         "Sirve para validar que la cédula sea auténtica y esté correctamente construida.\n"
-         "Ingresa una cédula de 10 dígitos para calcular y verificar su dígito verificador.",
-    font=("Arial", 11),
-    bg=COLORES["fondo_secundario"],
-    fg=COLORES["texto_principal"],
-    justify="center",
-    wraplength=700 #controlar el ajuste automático del texto
-)
-explicacion.pack()
-
-# Marco para entrada de datos
-marco_entrada = tk.Frame(marco_principal, bg=COLORES["fondo_principal"], pady=20)
-marco_entrada.pack()
-
-etiqueta_instruccion = tk.Label(
-    marco_entrada,
-    text="Ingresa una cédula ecuatoriana (10 dígitos):",
-    font=("Arial", 12, "bold"),
-    bg=COLORES["fondo_principal"],
-    fg=COLORES["texto_principal"]
-)
-etiqueta_instruccion.grid(row=0, column=0, columnspan=2, pady=10)
-
-# Campo de entrada para la cédula
-entrada_cedula = tk.Entry(
-    marco_entrada,
-    font=("Arial", 16),
-    width=20,
-    justify="center",
-    relief="solid",
-    borderwidth=2
-)
-entrada_cedula.grid(row=1, column=0, columnspan=2, pady=10, ipady=8)
-entrada_cedula.focus_set()
-
-# Marco para botones principales
-marco_botones = tk.Frame(marco_principal, bg=COLORES["fondo_principal"], pady=20)
-marco_botones.pack()
-
-# Botón para calcular
-boton_calcular = crear_boton(
-    marco_botones,
-    "🔍 Calcular Dígito",
-    calcular_y_mostrar,
-    COLORES["verde"],
-    COLORES["verde_hover"]
-)
-boton_calcular.grid(row=0, column=0, padx=10, pady=5)
-
-# Botón para limpiar
-boton_limpiar = crear_boton(
-    marco_botones,
-    "🗑️ Limpiar",
-    limpiar_campos,
-    COLORES["naranja"],
-    COLORES["naranja_hover"]
-)
-boton_limpiar.grid(row=0, column=1, padx=10, pady=5)
-
-# Botón para ejemplo
-boton_ejemplo = crear_boton(
-    marco_botones,
-    "📋 Ejemplo",
-    insertar_ejemplo,
-    COLORES["fondo_terciario"],
-    COLORES["acento_suave"]
-)
-boton_ejemplo.grid(row=0, column=2, padx=10, pady=5)
-
-# Marco para mostrar resultados
-marco_resultados = tk.Frame(
-    marco_principal,
-    bg=COLORES["fondo_secundario"],
-    relief="groove",
-    borderwidth=3,
-    padx=20,
-    pady=20
-)
-marco_resultados.pack(fill="x", pady=20)
-
-# Etiquetas para mostrar resultados
-etiqueta_resultado = tk.Label(
-    marco_resultados,
-    text="Dígito calculado: -",
-    font=("Arial", 14, "bold"),
-    bg=COLORES["fondo_secundario"],
-    fg=COLORES["texto_principal"],
-    pady=5
-)
-etiqueta_resultado.pack()
-
-etiqueta_cedula_completa = tk.Label(
-    marco_resultados,
-    text="Cédula completa: ----------",
-    font=("Arial", 12),
-    bg=COLORES["fondo_secundario"],
-    fg=COLORES["texto_principal"],
-    pady=5
-)
-etiqueta_cedula_completa.pack()
-
-etiqueta_validacion = tk.Label(
-    marco_resultados,
-    text="Ingresa una cédula y presiona Calcular",
-    font=("Arial", 12),
-    bg=COLORES["fondo_secundario"],
-    fg=COLORES["texto_secundario"],
-    pady=5
-)
-etiqueta_validacion.pack()
-
-etiqueta_provincia = tk.Label(
-    marco_resultados,
-    text="Provincia: -",
-    font=("Arial", 11, "italic"),
-    bg=COLORES["fondo_secundario"],
-    fg=COLORES["texto_principal"],
-    pady=5
-)
-etiqueta_provincia.pack()
-
-# Botón para ver pasos detallados (inicialmente deshabilitado)
-boton_ver_pasos = crear_boton(
-    marco_resultados,
-    "📊 Ver Pasos Detallados",
-    lambda: None,
-    COLORES["fondo_terciario"],
-    COLORES["acento_suave"]
-)
-boton_ver_pasos.pack(pady=15)
-boton_ver_pasos.config(state="disabled")
-
-# Marco para información adicional
-marco_info = tk.Frame(marco_principal, bg=COLORES["fondo_principal"], pady=20)
-marco_info.pack()
-
-# Botón para información del algoritmo
-boton_info_algoritmo = crear_boton(
-    marco_info,
-    "ℹ️ Ver Algoritmo de Cálculo",
-    mostrar_info_algoritmo,
-    COLORES["fondo_terciario"],
-    COLORES["acento_suave"]
-)
-boton_info_algoritmo.pack()
-
-# Información sobre las provincias
-info_provincias = tk.Label(
-    marco_info,
-    text="Nota: Los dos primeros dígitos representan la provincia de emisión de la cédula.",
-    font=("Arial", 10, "italic"),
-    bg=COLORES["fondo_principal"],
-    fg=COLORES["texto_secundario"],
-    pady=10
-)
-info_provincias.pack()
-
-# Pie de página
-pie_pagina = tk.Label(
-    marco_principal,
-    text="Aplicación Educativa - Cálculo del Dígito Verificador de la Cédula Ecuatoriana\n"
-         "Desarrollada para estudiantes de bachillerato - © 2023",
-    font=("Arial", 9),
-    bg=COLORES["fondo_principal"],
-    fg=COLORES["texto_secundario"],
-    pady=20
-)
-pie_pagina.pack()
+    # ============================================
+    # INTERFAZ GRÁFICA - COMPONENTES
+    # ============================================
 
-# ============================================
-# CONFIGURACIÓN DE EVENTOS ADICIONALES
-# ============================================
+    # Marco principal para organizar los elementos
+    marco_principal = tk.Frame(ventana_principal, bg=COLORES["fondo_principal"], padx=20, pady=20)
+    marco_principal.pack(fill="both", expand=True)
+
+    # Título de la aplicación
+    titulo = tk.Label(
+        marco_principal,
+        text="CÁLCULO DEL DÍGITO VERIFICADOR",
+        font=("Arial", 24, "bold"),
+        bg=COLORES["fondo_principal"],
+        fg=COLORES["texto_principal"],
+        pady=20
+    )
+    titulo.pack()
 
-# Permitir calcular presionando Enter en el campo de entrada
-entrada_cedula.bind("<Return>", lambda event: calcular_y_mostrar())
+    subtitulo = tk.Label(
+        marco_principal,
+        text="Cédula Ecuatoriana - Aplicación Educativa",
+        font=("Arial", 14),
+        bg=COLORES["fondo_principal"],
+        fg=COLORES["texto_secundario"],
+        pady=5
+    )
+    subtitulo.pack()
+
+    # Línea separadora
+    separador = ttk.Separator(marco_principal, orient="horizontal")
+    separador.pack(fill="x", pady=20)
+
+    # Marco para la explicación
+    marco_explicacion = tk.Frame(
+        marco_principal,
+        bg=COLORES["fondo_secundario"],
+        relief="ridge",
+        borderwidth=2,
+        padx=15,
+        pady=15
+    )
+    marco_explicacion.pack(fill="x", pady=10)
+
+    explicacion = tk.Label(
+        marco_explicacion,
+        text="El dígito verificador es el último número de la cédula ecuatoriana (posición 10).\n"
+             "Sirve para validar que la cédula sea auténtica y esté correctamente construida.\n"
+             "Ingresa una cédula de 10 dígitos para calcular y verificar su dígito verificador.",
+        font=("Arial", 11),
+        bg=COLORES["fondo_secundario"],
+        fg=COLORES["texto_principal"],
+        justify="center",
+        wraplength=700 #controlar el ajuste automático del texto
+    )
+    explicacion.pack()
+
+    # Marco para entrada de datos
+    marco_entrada = tk.Frame(marco_principal, bg=COLORES["fondo_principal"], pady=20)
+    marco_entrada.pack()
+
+    etiqueta_instruccion = tk.Label(
+        marco_entrada,
+        text="Ingresa una cédula ecuatoriana (10 dígitos):",
+        font=("Arial", 12, "bold"),
+        bg=COLORES["fondo_principal"],
+        fg=COLORES["texto_principal"]
+    )
+    etiqueta_instruccion.grid(row=0, column=0, columnspan=2, pady=10)
+
+    # Campo de entrada para la cédula
+    entrada_cedula = tk.Entry(
+        marco_entrada,
+        font=("Arial", 16),
+        width=20,
+        justify="center",
+        relief="solid",
+        borderwidth=2
+    )
+    entrada_cedula.grid(row=1, column=0, columnspan=2, pady=10, ipady=8)
+    entrada_cedula.focus_set()
+
+    # Marco para botones principales
+    marco_botones = tk.Frame(marco_principal, bg=COLORES["fondo_principal"], pady=20)
+    marco_botones.pack()
+
+    # Botón para calcular
+    boton_calcular = crear_boton(
+        marco_botones,
+        "🔍 Calcular Dígito",
+        calcular_y_mostrar,
+        COLORES["verde"],
+        COLORES["verde_hover"]
+    )
+    boton_calcular.grid(row=0, column=0, padx=10, pady=5)
+
+    # Botón para limpiar
+    boton_limpiar = crear_boton(
+        marco_botones,
+        "🗑️ Limpiar",
+        limpiar_campos,
+        COLORES["naranja"],
+        COLORES["naranja_hover"]
+    )
+    boton_limpiar.grid(row=0, column=1, padx=10, pady=5)
+
+    # Botón para ejemplo
+    boton_ejemplo = crear_boton(
+        marco_botones,
+        "📋 Ejemplo",
+        insertar_ejemplo,
+        COLORES["fondo_terciario"],
+        COLORES["acento_suave"]
+    )
+    boton_ejemplo.grid(row=0, column=2, padx=10, pady=5)
+
+    # Marco para mostrar resultados
+    marco_resultados = tk.Frame(
+        marco_principal,
+        bg=COLORES["fondo_secundario"],
+        relief="groove",
+        borderwidth=3,
+        padx=20,
+        pady=20
+    )
+    marco_resultados.pack(fill="x", pady=20)
+
+    # Etiquetas para mostrar resultados
+    etiqueta_resultado = tk.Label(
+        marco_resultados,
+        text="Dígito calculado: -",
+        font=("Arial", 14, "bold"),
+        bg=COLORES["fondo_secundario"],
+        fg=COLORES["texto_principal"],
+        pady=5
+    )
+    etiqueta_resultado.pack()
+
+    etiqueta_cedula_completa = tk.Label(
+        marco_resultados,
+        text="Cédula completa: ----------",
+        font=("Arial", 12),
+        bg=COLORES["fondo_secundario"],
+        fg=COLORES["texto_principal"],
+        pady=5
+    )
+    etiqueta_cedula_completa.pack()
+
+    etiqueta_validacion = tk.Label(
+        marco_resultados,
+        text="Ingresa una cédula y presiona Calcular",
+        font=("Arial", 12),
+        bg=COLORES["fondo_secundario"],
+        fg=COLORES["texto_secundario"],
+        pady=5
+    )
+    etiqueta_validacion.pack()
+
+    etiqueta_provincia = tk.Label(
+        marco_resultados,
+        text="Provincia: -",
+        font=("Arial", 11, "italic"),
+        bg=COLORES["fondo_secundario"],
+        fg=COLORES["texto_principal"],
+        pady=5
+    )
+    etiqueta_provincia.pack()
+
+    # Botón para ver pasos detallados (inicialmente deshabilitado)
+    boton_ver_pasos = crear_boton(
+        marco_resultados,
+        "📊 Ver Pasos Detallados",
+        lambda: None,
+        COLORES["fondo_terciario"],
+        COLORES["acento_suave"]
+    )
+    boton_ver_pasos.pack(pady=15)
+    boton_ver_pasos.config(state="disabled")
+
+    # Marco para información adicional
+    marco_info = tk.Frame(marco_principal, bg=COLORES["fondo_principal"], pady=20)
+    marco_info.pack()
+
+    # Botón para información del algoritmo
+    boton_info_algoritmo = crear_boton(
+        marco_info,
+        "ℹ️ Ver Algoritmo de Cálculo",
+        mostrar_info_algoritmo,
+        COLORES["fondo_terciario"],
+        COLORES["acento_suave"]
+    )
+    boton_info_algoritmo.pack(side="left", padx=10)
+    
+    # Botón para el informe por provincia de un archivo de cédulas
+    boton_informe = crear_boton(
+        marco_info,
+        "📈 Informe por Provincia",
+        generar_informe_provincias,
+        COLORES["fondo_terciario"],
+        COLORES["acento_suave"]
+    )
+    boton_informe.pack(side="left", padx=10)
+
+    # Información sobre las provincias
+    info_provincias = tk.Label(
+        marco_info,
+        text="Nota: Los dos primeros dígitos representan la provincia de emisión de la cédula.",
+        font=("Arial", 10, "italic"),
+        bg=COLORES["fondo_principal"],
+        fg=COLORES["texto_secundario"],
+        pady=10
+    )
+    info_provincias.pack(side="bottom")
+
+    # Pie de página
+    pie_pagina = tk.Label(
+        marco_principal,
+        text="Aplicación Educativa - Cálculo del Dígito Verificador de la Cédula Ecuatoriana\n"
+             "Desarrollada para estudiantes de bachillerato - © 2023",
+        font=("Arial", 9),
+        bg=COLORES["fondo_principal"],
+        fg=COLORES["texto_secundario"],
+        pady=20
+    )
+    pie_pagina.pack()
+
+    # ============================================
+    # CONFIGURACIÓN DE EVENTOS ADICIONALES
+    # ============================================
+
+    # Permitir calcular presionando Enter en el campo de entrada
+    entrada_cedula.bind("<Return>", lambda event: calcular_y_mostrar())
+    
+    return ventana_principal
 
 # ============================================
 # INICIALIZACIÓN DE LA APLICACIÓN
 # ============================================
 
-# Ejecutar la aplicación
-ventana_principal.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    # Con argumentos se trabaja sin ventana (por ejemplo: validar cedulas.txt, servidor o carga)
+    if len(sys.argv) > 1:
+        sys.exit(ejecutar_linea_de_comandos(sys.argv[1:]))
+    
+    configurar_ventana_principal()
+    
+    # Ejecutar la aplicación
+    ventana_principal.mainloop()
@@ -7,8 +7,21 @@ Descripción: Aplicación para enseñar el concepto de interés compuesto
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import argparse
+import bisect
+import decimal
 import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # ============================================================================
 # CONFIGURACIÓN DE COLORES Y ESTILO
@@ -47,9 +60,33 @@ def calcular_monto_final():
         monto_final = capital * ((1 + tasa_decimal/periodos) ** (periodos * tiempo))
         interes_generado = monto_final - capital
         
-        # Mostrar resultados
-        resultado_var.set(f"${monto_final:,.2f}")
-        interes_var.set(f"${interes_generado:,.2f}")
+        # Modo exacto: el mismo cálculo con Decimal, redondeado al centavo
+        modo = ""
+        if modo_exacto.get():
+            try:
+                contexto = opciones_exactas()
+                capital_exacto, tasa_exacta, tiempo_exacto = leer_datos_exactos(contexto)
+                monto_exacto, monto_redondeado = monto_final_exacto(capital_exacto, tasa_exacta, 
+                                                                    tiempo_exacto, periodos, contexto)
+                interes_exacto = contexto.subtract(monto_redondeado, contexto.quantize(capital_exacto, CENTAVO))
+            except (ValueError, decimal.DecimalException) as error:
+                messagebox.showerror("Modo exacto", str(error))
+                return
+        
+        # Mostrar resultados (en modo exacto, los de Decimal)
+        if modo_exacto.get():
+            resultado_var.set(f"${monto_redondeado:,.2f}")
+            interes_var.set(f"${interes_exacto:,.2f}")
+            modo = f"""
+🔢 MODO EXACTO (Decimal, {contexto.prec} dígitos, redondeo {redondeo_var.get()}):
+M = {monto_exacto}
+M al centavo = ${monto_redondeado:,.2f}
+Interés al centavo = ${interes_exacto:,.2f}
+Diferencia del cálculo con float: ${decimal.Decimal(monto_final) - monto_exacto:.10f}
+"""
+        else:
+            resultado_var.set(f"${monto_final:,.2f}")
+            interes_var.set(f"${interes_generado:,.2f}")
         
         # Mostrar explicación paso a paso
         explicacion = f"""📈 CÁLCULO PASO A PASO:
@@ -77,7 +114,7 @@ M = {capital:,.2f} × {((1 + tasa_decimal/periodos) ** (periodos * tiempo)):.4f}
 M = ${monto_final:,.2f}
 
 💰 INTERÉS GENERADO: ${interes_generado:,.2f}
-"""
+{modo}"""
         texto_explicacion.delete(1.0, tk.END)
         texto_explicacion.insert(1.0, explicacion)
         
@@ -133,48 +170,597 @@ para que ${capital:,.2f} se conviertan en ${monto_objetivo:,.2f}.
     except ValueError:
         messagebox.showerror("Error", "Ingresa valores válidos en todos los campos.")
 
-def actualizar_grafico(capital, tasa, tiempo, periodos):
-    """Genera datos para mostrar crecimiento en el tiempo"""
-    # Limpiar gráfico anterior
-    for item in canvas_grafico.find_all():
-        canvas_grafico.delete(item)
-    
-    # Configurar área del gráfico
-    ancho = 400
-    alto = 200
-    margen = 40
-    
-    # Dibujar ejes
-    canvas_grafico.create_line(margen, alto-margen, ancho-margen, alto-margen, width=2)  # Eje X
-    canvas_grafico.create_line(margen, margen, margen, alto-margen, width=2)  # Eje Y
-    
-    # Etiquetas de ejes
-    canvas_grafico.create_text(ancho//2, alto-10, text="Años", fill=COLOR_TEXTO)
-    canvas_grafico.create_text(15, alto//2, text="Monto ($)", angle=90, fill=COLOR_TEXTO)
-    
-    # Generar puntos del gráfico
-    puntos = []
-    for año in range(int(tiempo) + 1):
-        monto = capital * ((1 + tasa/periodos) ** (periodos * año))
-        x = margen + (año/tiempo) * (ancho - 2*margen) if tiempo > 0 else margen
-        y = alto - margen - (monto/(capital*3)) * (alto - 2*margen) if monto > 0 else alto-margen
-        puntos.append((x, y))
-        
-        # Marcar cada año
-        if año <= tiempo:
-            canvas_grafico.create_text(x, alto-margen+10, text=str(año), fill=COLOR_TEXTO)
-            canvas_grafico.create_line(x, alto-margen-5, x, alto-margen+5, fill=COLOR_TEXTO)
-    
-    # Dibujar línea del gráfico
-    for i in range(len(puntos)-1):
-        canvas_grafico.create_line(puntos[i][0], puntos[i][1], 
-                                  puntos[i+1][0], puntos[i+1][1], 
-                                  fill=COLOR_PRIMARIO, width=3)
-    
-    # Puntos de datos
-    for x, y in puntos:
-        canvas_grafico.create_oval(x-4, y-4, x+4, y+4, 
-                                  fill=COLOR_SECUNDARIO, outline=COLOR_SECUNDARIO)
+def leer_datos_calculo():
+    """Lee capital, tasa (decimal), tiempo y periodos de los campos
+
+    Devuelve None (después de avisar) si algún valor no es válido.
+    """
+    try:
+        capital = float(entrada_capital.get())
+        tasa = float(entrada_tasa.get())
+        tiempo = float(entrada_tiempo.get())
+        periodos = int(entrada_periodos.get())
+    except ValueError:
+        messagebox.showerror("Error de entrada", 
+                            "Por favor, ingresa valores numéricos válidos.")
+        return None
+    if capital <= 0 or tasa <= 0 or tiempo <= 0 or periodos <= 0:
+        messagebox.showwarning("Valores inválidos", 
+                               "Todos los valores deben ser mayores que cero.")
+        return None
+    return capital, tasa / 100, tiempo, periodos
+
+def opciones_exactas():
+    """Contexto de Decimal con la precisión y el redondeo elegidos en la ventana"""
+    precision = int(entrada_precision.get())
+    if not 2 <= precision <= 10000:
+        raise ValueError("La precisión debe estar entre 2 y 10000 dígitos")
+    return contexto_exacto(precision, REDONDEOS[redondeo_var.get()])
+
+def leer_datos_exactos(contexto):
+    """Capital, tasa (decimal) y tiempo como Decimal, tal como se escribieron"""
+    return (a_decimal(entrada_capital.get()), 
+            contexto.divide(a_decimal(entrada_tasa.get()), 100),
+            a_decimal(entrada_tiempo.get()))
+
+# ============================================================================
+# TABLA DE CAPITALIZACIÓN PERIODO A PERIODO
+# ============================================================================
+
+# El saldo al final del periodo k es C × (1 + r/n)^k, así que cualquier tramo
+# de la tabla se calcula directo con potencias (vectorizadas con NumPy) sin
+# recorrer los periodos anteriores. La ventana solo calcula las filas que se
+# ven y el CSV se escribe tramo por tramo.
+FILAS_TABLA = 20
+PERIODOS_POR_TRAMO = 65536
+ENCABEZADOS_TABLA = ("Periodo", "Año", "Interés del periodo", "Interés acumulado", "Saldo")
+FORMATO_CSV = "%d,%.4f,%.2f,%.2f,%.2f\n"
+
+def total_periodos(tiempo, periodos):
+    """Cantidad de periodos completos de capitalización en el plazo"""
+    return int(round(periodos * tiempo, 9))
+
+def tramo_calendario(capital, tasa, periodos, desde, hasta):
+    """Columnas de la tabla para los periodos desde+1 ... hasta
+
+    Devuelve cinco listas: periodo, año, interés del periodo, interés
+    acumulado y saldo al final del periodo.
+    """
+    factor = 1 + tasa / periodos
+    if np is not None:
+        numeros = np.arange(desde, hasta + 1, dtype=np.float64)
+        saldos = capital * np.power(factor, numeros)
+        numeros, intereses, saldos = numeros[1:], np.diff(saldos), saldos[1:]
+        return (list(range(desde + 1, hasta + 1)), (numeros / periodos).tolist(),
+                intereses.tolist(), (saldos - capital).tolist(), saldos.tolist())
+    columnas = ([], [], [], [], [])
+    saldo_anterior = capital * factor ** desde
+    for periodo in range(desde + 1, hasta + 1):
+        saldo = capital * factor ** periodo
+        for columna, valor in zip(columnas, (periodo, periodo / periodos, saldo - saldo_anterior,
+                                             saldo - capital, saldo)):
+            columna.append(valor)
+        saldo_anterior = saldo
+    return columnas
+
+def exportar_calendario_csv(archivo, capital, tasa, tiempo, periodos, contexto=None):
+    """Escribe la tabla completa en un archivo de texto CSV, tramo por tramo
+
+    Es un generador: después de cada tramo entrega cuántas filas lleva, para
+    que la ventana pueda mostrar el avance sin congelarse. Con un contexto
+    de Decimal se usa el modo exacto (capital y tasa como Decimal).
+    """
+    archivo.write("periodo,año,interes_periodo,interes_acumulado,saldo\n")
+    total = total_periodos(tiempo, periodos)
+    por_tramo = PERIODOS_POR_TRAMO if contexto is None else PERIODOS_POR_TRAMO_EXACTO
+    for desde in range(0, total, por_tramo):
+        hasta = min(desde + por_tramo, total)
+        if contexto is None:
+            columnas = tramo_calendario(capital, tasa, periodos, desde, hasta)
+            archivo.writelines([FORMATO_CSV % fila for fila in zip(*columnas)])
+        else:
+            columnas = tramo_calendario_exacto(capital, tasa, periodos, desde, hasta, contexto)
+            archivo.writelines([FORMATO_CSV_EXACTO % fila for fila in zip(*columnas)])
+        yield hasta
+
+# ============================================================================
+# MODO EXACTO CON DECIMAL
+# ============================================================================
+
+# Para conciliar al centavo con un sistema contable se calcula con
+# decimal.Decimal: los datos se leen tal como se escribieron (5.1 es
+# exactamente 5.1, no el float más cercano) y se eligen la precisión y el
+# redondeo. (1 + r/n)^k sale de contexto.power(), que con exponente entero
+# devuelve el resultado correctamente redondeado en unos pocos microsegundos.
+PRECISION_EXACTA = 50
+CENTAVO = decimal.Decimal("0.01")
+REDONDEOS = {
+    "mitad hacia arriba": decimal.ROUND_HALF_UP,
+    "mitad al par": decimal.ROUND_HALF_EVEN,
+    "hacia abajo": decimal.ROUND_DOWN,
+    "hacia arriba": decimal.ROUND_UP
+}
+FORMATO_CSV_EXACTO = "%d,%.4f,%s,%s,%s\n"
+PERIODOS_POR_TRAMO_EXACTO = 4096
+
+def a_decimal(texto):
+    """Decimal a partir del texto de un campo (ValueError si no es un número)"""
+    try:
+        valor = decimal.Decimal(texto.strip())
+    except decimal.InvalidOperation:
+        raise ValueError(f"Número inválido: {texto!r}") from None
+    if not valor.is_finite():
+        raise ValueError(f"Número inválido: {texto!r}")
+    return valor
+
+def contexto_exacto(precision=PRECISION_EXACTA, redondeo=decimal.ROUND_HALF_UP):
+    """Contexto de Decimal con la precisión (dígitos) y el redondeo elegidos"""
+    return decimal.Context(prec=precision, rounding=redondeo, 
+                           Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+
+def factor_exacto(tasa, periodos, contexto):
+    """1 + r/n, con la tasa r en decimal (0.05 para 5 %)"""
+    return contexto.add(1, contexto.divide(tasa, periodos))
+
+def precision_minima(capital, tasa, periodos, exponente):
+    """Dígitos que necesita C × (1 + r/n)^exponente para salir correcto al centavo
+
+    Son los dígitos enteros del monto, los 2 decimales, los dígitos del
+    exponente (el error de redondeo del factor crece con la potencia) y 4 de
+    guarda: así el error queda por debajo de 0.001 centavos.
+    """
+    exponente = max(float(exponente), 1.0)
+    factor = abs(1 + float(tasa) / periodos)
+    enteros = math.log10(max(abs(float(capital)), 1)) + exponente * math.log10(max(factor, 1))
+    return int(enteros) + 1 + 2 + len(str(int(exponente))) + 4
+
+def comprobar_precision(capital, tasa, periodos, exponente, contexto):
+    """ValueError si la precisión del contexto no alcanza para llegar al centavo"""
+    minima = precision_minima(capital, tasa, periodos, exponente)
+    if contexto.prec < minima:
+        raise ValueError(f"Con {contexto.prec} dígitos el monto no sale exacto al centavo: "
+                         f"para estos datos hacen falta al menos {minima} dígitos de precisión.")
+
+def monto_final_exacto(capital, tasa, tiempo, periodos, contexto):
+    """C × (1 + r/n)^(n×t) con Decimal: devuelve (monto, monto redondeado al centavo)
+
+    ValueError si la precisión del contexto es demasiado baja para el monto.
+    """
+    factor = factor_exacto(tasa, periodos, contexto)
+    exponente = contexto.multiply(periodos, tiempo)
+    comprobar_precision(capital, tasa, periodos, exponente, contexto)
+    enteros = int(exponente)
+    potencia = contexto.power(factor, enteros)
+    if exponente != enteros:
+        # El tiempo no completa el último periodo: parte fraccionaria del exponente
+        potencia = contexto.multiply(potencia, contexto.power(factor, exponente - enteros))
+    monto = contexto.multiply(capital, potencia)
+    return monto, contexto.quantize(monto, CENTAVO)
+
+def tramo_calendario_exacto(capital, tasa, periodos, desde, hasta, contexto):
+    """Como tramo_calendario(), pero con Decimal y montos redondeados al centavo
+
+    El saldo inicial del tramo sale de contexto.power() y los siguientes se
+    obtienen multiplicando por el factor (con 50 dígitos el error acumulado
+    en 100 años diarios no llega a 10^-40). El interés de cada periodo es la
+    diferencia de saldos ya redondeados, así que la columna suma exactamente
+    el interés acumulado.
+    """
+    comprobar_precision(capital, tasa, periodos, hasta, contexto)
+    factor = factor_exacto(tasa, periodos, contexto)
+    capital_redondeado = contexto.quantize(capital, CENTAVO)
+    saldo = contexto.multiply(capital, contexto.power(factor, desde))
+    anterior = contexto.quantize(saldo, CENTAVO)
+    columnas = ([], [], [], [], [])
+    for periodo in range(desde + 1, hasta + 1):
+        saldo = contexto.multiply(saldo, factor)
+        redondeado = contexto.quantize(saldo, CENTAVO)
+        for columna, valor in zip(columnas, (periodo, periodo / periodos, 
+                                             contexto.subtract(redondeado, anterior),
+                                             contexto.subtract(redondeado, capital_redondeado), 
+                                             redondeado)):
+            columna.append(valor)
+        anterior = redondeado
+    return columnas
+
+# ============================================================================
+# BARRIDO DE ESCENARIOS
+# ============================================================================
+
+# Para comparar opciones se calcula de una vez el monto final de todas las
+# combinaciones de tasa, periodos por año y tiempo. Con NumPy es una sola
+# operación sobre la rejilla (broadcasting): M = C × e^(n·t·ln(1 + r/n)).
+MAXIMO_CELDAS_BARRIDO = 20_000_000
+PALETA_MAPA = ("#F0F7FF", "#95B8D1", "#4A6FA5", "#166088", "#0B2E45")   # de menor a mayor monto
+FORMATO_CSV_BARRIDO = "%d,%.6f,%.6f,%.2f\n"
+
+def _interpolar_paleta(paleta, pasos=256):
+    """Lista de pasos colores "#rrggbb" que pasan suavemente por los de la paleta"""
+    colores = [tuple(int(color[i:i+2], 16) for i in (1, 3, 5)) for color in paleta]
+    resultado = []
+    for paso in range(pasos):
+        posicion = paso / (pasos - 1) * (len(colores) - 1)
+        i = min(int(posicion), len(colores) - 2)
+        fraccion = posicion - i
+        resultado.append("#%02x%02x%02x" % tuple(
+            round(a + (b - a) * fraccion) for a, b in zip(colores[i], colores[i + 1])))
+    return resultado
+
+COLORES_MAPA = _interpolar_paleta(PALETA_MAPA)
+
+def valores_en_rango(desde, hasta, pasos):
+    """pasos valores equiespaciados de desde a hasta (ambos incluidos)"""
+    if pasos == 1:
+        return [desde]
+    return [desde + (hasta - desde) * i / (pasos - 1) for i in range(pasos)]
+
+def barrido_montos(capital, tasas, periodos, tiempos):
+    """Montos finales de todas las combinaciones (tasas en decimal)
+
+    El resultado se indexa [periodo][tasa][tiempo]: un arreglo NumPy de tres
+    dimensiones, o listas anidadas si no hay NumPy.
+    """
+    if np is None:
+        return [[[capital * (1 + tasa/n) ** (n * tiempo) for tiempo in tiempos]
+                 for tasa in tasas] for n in periodos]
+    n = np.asarray(periodos, dtype=np.float64)[:, None, None]
+    crecimiento = n * np.log1p(np.asarray(tasas, dtype=np.float64)[None, :, None] / n)
+    # Una sola pasada sobre la rejilla completa, sin arreglos intermedios
+    montos = crecimiento * np.asarray(tiempos, dtype=np.float64)
+    with np.errstate(over="ignore"):
+        np.exp(montos, out=montos)
+    montos *= capital
+    return montos
+
+def extremos_barrido(montos):
+    """(mínimo, máximo) de todos los montos de la rejilla"""
+    if np is not None:
+        return float(montos.min()), float(montos.max())
+    valores = [monto for tabla in montos for fila in tabla for monto in fila]
+    return min(valores), max(valores)
+
+def datos_imagen_mapa(rejilla, filas, columnas, minimo, maximo):
+    """Datos para PhotoImage.put(): un color por píxel según rejilla[fila][columna]
+
+    filas y columnas dicen qué celda de la rejilla cae en cada píxel. El
+    color sigue el logaritmo del monto, que crece de forma exponencial.
+    """
+    inferior = math.log(minimo)
+    escala = (len(COLORES_MAPA) - 1) / max(math.log(maximo) - inferior, 1e-12)
+    ultimo = len(COLORES_MAPA) - 1
+    if np is not None:
+        indices = (np.log(rejilla[np.ix_(filas, columnas)]) - inferior) * escala
+        colores = np.array(COLORES_MAPA)[np.minimum(indices.astype(np.intp), ultimo)].tolist()
+    else:
+        colores = [[COLORES_MAPA[min(int((math.log(rejilla[i][j]) - inferior) * escala), ultimo)]
+                    for j in columnas] for i in filas]
+    return " ".join("{" + " ".join(fila) + "}" for fila in colores)
+
+def exportar_barrido_csv(archivo, montos, tasas, periodos, tiempos):
+    """Escribe la rejilla completa en CSV (una fila por combinación)
+
+    Es un generador: después de cada tasa entrega cuántas filas lleva.
+    """
+    archivo.write("periodos_por_año,tasa,tiempo,monto_final\n")
+    escritas = 0
+    for i, n in enumerate(periodos):
+        for j, tasa in enumerate(tasas):
+            fila = montos[i][j].tolist() if np is not None else montos[i][j]
+            archivo.writelines([FORMATO_CSV_BARRIDO % (n, tasa, tiempo, monto)
+                                for tiempo, monto in zip(tiempos, fila)])
+            escritas += len(tiempos)
+            yield escritas
+
+# ============================================================================
+# SIMULACIÓN MONTE CARLO CON TASA VARIABLE
+# ============================================================================
+
+# Cada trayectoria sortea una tasa para cada año. Se trabaja con logaritmos:
+# cada año suma n·ln(1 + r/n) y el monto es C·e^(suma acumulada), así que un
+# trozo de trayectorias es una matriz (trayectorias × años) y un cumsum. Los
+# trozos acotan la memoria: de cada uno se guardan los montos finales y un
+# histograma (de tamaño fijo) del logaritmo del monto en los años que se
+# grafican; los histogramas de todos los trozos simplemente se suman.
+DISTRIBUCIONES_TASA = ("normal", "uniforme")
+VALORES_POR_TROZO = 2_000_000      # trayectorias × años de cada trozo (16 MB)
+MAXIMO_AÑOS_BANDAS = 100
+CASILLAS_HISTOGRAMA = 2048
+PERCENTILES_BANDAS = (5, 50, 95)
+PERCENTILES_INFORME = (5, 25, 50, 75, 95)
+INTERVALO_SONDEO_MS = 50           # cada cuánto revisa la ventana si la simulación terminó
+
+def años_de_bandas(tiempo):
+    """Años (desde el inicio) en que se calculan las bandas: 0, 1, 2... hasta el final"""
+    años = math.ceil(tiempo)
+    if años + 1 <= MAXIMO_AÑOS_BANDAS:
+        return list(range(años + 1))
+    return sorted({round(años * i / (MAXIMO_AÑOS_BANDAS - 1)) for i in range(MAXIMO_AÑOS_BANDAS)})
+
+def _limites_histograma(capital, tasa, desviacion, tiempo, periodos, años):
+    """Rango del logaritmo del monto en cada año de años (±10 desviaciones)"""
+    limites = []
+    for año in años:
+        transcurrido = min(año, tiempo)
+        centro = math.log(capital) + periodos * transcurrido * math.log1p(tasa / periodos)
+        ancho = 10 * desviacion * math.sqrt(transcurrido) + 1e-9
+        limites.append((centro - ancho, centro + ancho))
+    return limites
+
+def simular_trozo(capital, tasa, desviacion, distribucion, tiempo, periodos, trayectorias, semilla, años):
+    """Simula un trozo de trayectorias
+
+    Devuelve (montos finales, histograma): el histograma tiene una fila por
+    año de años con CASILLAS_HISTOGRAMA casillas del logaritmo del monto.
+    """
+    total_años = math.ceil(tiempo)
+    limites = _limites_histograma(capital, tasa, desviacion, tiempo, periodos, años)
+    if np is None:
+        aleatorio = random.Random(semilla)
+        finales = []
+        histograma = [[0] * CASILLAS_HISTOGRAMA for _ in años]
+        for _ in range(trayectorias):
+            logaritmos = [math.log(capital)]
+            for año in range(total_años):
+                if distribucion == "normal":
+                    tasa_año = aleatorio.gauss(tasa, desviacion)
+                else:
+                    tasa_año = aleatorio.uniform(tasa - desviacion, tasa + desviacion)
+                duracion = min(año + 1, tiempo) - año
+                logaritmos.append(logaritmos[-1] + periodos * duracion * math.log1p(max(tasa_año / periodos, -0.99)))
+            finales.append(math.exp(logaritmos[-1]))
+            for fila, año, (inferior, superior) in zip(histograma, años, limites):
+                casilla = int((logaritmos[año] - inferior) / (superior - inferior) * CASILLAS_HISTOGRAMA)
+                fila[min(max(casilla, 0), CASILLAS_HISTOGRAMA - 1)] += 1
+        return finales, histograma
+    
+    generador = np.random.default_rng(semilla)
+    if distribucion == "normal":
+        logaritmos = generador.normal(tasa, desviacion, (trayectorias, total_años))
+    else:
+        logaritmos = generador.uniform(tasa - desviacion, tasa + desviacion, (trayectorias, total_años))
+    # Tasa por periodo -> logaritmo del crecimiento de cada año (en el lugar).
+    # Perder el 100 % o más en un periodo no tiene sentido: se acota en -99 %.
+    duraciones = np.minimum(np.arange(1, total_años + 1), tiempo) - np.arange(total_años)
+    logaritmos /= periodos
+    np.maximum(logaritmos, -0.99, out=logaritmos)
+    np.log1p(logaritmos, out=logaritmos)
+    logaritmos *= periodos * duraciones
+    np.cumsum(logaritmos, axis=1, out=logaritmos)
+    logaritmos += math.log(capital)
+    finales = np.exp(logaritmos[:, -1])
+    
+    indices = np.asarray(años)
+    columnas = logaritmos[:, np.maximum(indices - 1, 0)]
+    columnas[:, indices == 0] = math.log(capital)
+    inferiores, superiores = np.array(limites).T
+    casillas = ((columnas - inferiores) / (superiores - inferiores) * CASILLAS_HISTOGRAMA).astype(np.intp)
+    np.clip(casillas, 0, CASILLAS_HISTOGRAMA - 1, out=casillas)
+    casillas += np.arange(len(años)) * CASILLAS_HISTOGRAMA
+    histograma = np.bincount(casillas.ravel(), minlength=len(años) * CASILLAS_HISTOGRAMA)
+    return finales, histograma.reshape(len(años), CASILLAS_HISTOGRAMA)
+
+def _percentil(ordenados, percentil):
+    """Percentil de una lista ordenada, interpolando como numpy.percentile"""
+    posicion = (len(ordenados) - 1) * percentil / 100
+    abajo = int(posicion)
+    arriba = min(abajo + 1, len(ordenados) - 1)
+    return ordenados[abajo] + (ordenados[arriba] - ordenados[abajo]) * (posicion - abajo)
+
+def percentiles_histograma(histograma, limites, percentil):
+    """Monto del percentil pedido en cada fila del histograma (interpolando dentro de la casilla)"""
+    montos = []
+    for fila, (inferior, superior) in zip(histograma, limites):
+        fila = fila.tolist() if np is not None else fila
+        buscado = sum(fila) * percentil / 100
+        acumulado = 0
+        for casilla, cantidad in enumerate(fila):
+            if cantidad and acumulado + cantidad >= buscado:
+                fraccion = (casilla + (buscado - acumulado) / cantidad) / CASILLAS_HISTOGRAMA
+                montos.append(math.exp(inferior + (superior - inferior) * fraccion))
+                break
+            acumulado += cantidad
+    return montos
+
+def tareas_montecarlo(capital, tasa, desviacion, distribucion, tiempo, periodos, 
+                      trayectorias, semilla=None):
+    """Años de las bandas y argumentos de simular_trozo() para cada trozo"""
+    años = años_de_bandas(tiempo)
+    por_trozo = max(VALORES_POR_TROZO // math.ceil(tiempo), 1)
+    # Una semilla por trozo: el resultado no depende de cómo se repartan
+    aleatorio = random.Random(semilla)
+    tareas = [
+        (capital, tasa, desviacion, distribucion, tiempo, periodos, 
+         min(por_trozo, trayectorias - inicio), aleatorio.getrandbits(64), años)
+        for inicio in range(0, trayectorias, por_trozo)
+    ]
+    return años, tareas
+
+def combinar_montecarlo(capital, tasa, desviacion, tiempo, periodos, años, resultados):
+    """Junta los resultados de simular_trozo() de todos los trozos (ver simular_montecarlo)"""
+    if np is not None:
+        finales = np.sort(np.concatenate([finales for finales, _ in resultados]))
+        histograma = sum(histograma for _, histograma in resultados)
+    else:
+        finales = sorted(monto for finales, _ in resultados for monto in finales)
+        histograma = [[sum(cantidades) for cantidades in zip(*filas)]
+                      for filas in zip(*(histograma for _, histograma in resultados))]
+    limites = _limites_histograma(capital, tasa, desviacion, tiempo, periodos, años)
+    return {
+        "años": [min(año, tiempo) for año in años],
+        "bandas": {percentil: percentiles_histograma(histograma, limites, percentil)
+                   for percentil in PERCENTILES_BANDAS},
+        "finales": finales
+    }
+
+def simular_montecarlo(capital, tasa, desviacion, distribucion, tiempo, periodos, 
+                       trayectorias, semilla=None, procesos=1):
+    """Simula trayectorias con tasa anual aleatoria
+
+    Devuelve un diccionario con "años", las bandas (percentiles de
+    PERCENTILES_BANDAS del monto en cada uno de esos años) y "finales",
+    los montos finales ordenados. Con procesos > 1 los trozos se reparten
+    en varios procesos; la misma semilla da el mismo resultado siempre.
+    """
+    años, tareas = tareas_montecarlo(capital, tasa, desviacion, distribucion, tiempo, periodos,
+                                     trayectorias, semilla)
+    if procesos > 1 and len(tareas) > 1:
+        with multiprocessing.Pool(min(procesos, len(tareas))) as pool:
+            resultados = pool.starmap(simular_trozo, tareas)
+    else:
+        resultados = [simular_trozo(*tarea) for tarea in tareas]
+    return combinar_montecarlo(capital, tasa, desviacion, tiempo, periodos, años, resultados)
+
+def resumen_finales(finales, objetivo):
+    """Promedio, percentiles de PERCENTILES_INFORME, extremos y probabilidad de llegar al objetivo"""
+    if np is not None:
+        alcanzan = len(finales) - int(np.searchsorted(finales, objetivo))
+        promedio = float(finales.mean())
+    else:
+        alcanzan = len(finales) - bisect.bisect_left(finales, objetivo)
+        promedio = math.fsum(finales) / len(finales)
+    return {
+        "promedio": promedio,
+        "percentiles": {percentil: float(_percentil(finales, percentil)) for percentil in PERCENTILES_INFORME},
+        "minimo": float(finales[0]),
+        "maximo": float(finales[-1]),
+        "probabilidad": alcanzan / len(finales)
+    }
+
+# ============================================================================
+# GRÁFICO DE CRECIMIENTO
+# ============================================================================
+
+# Los elementos del gráfico se crean una sola vez y en cada cálculo solo se
+# mueven con canvas.coords(): la curva es una sola polilínea con a lo sumo
+# dos puntos (mínimo y máximo) por columna de píxeles, y las marcas del eje
+# se espacian para que no se encimen, sin importar cuántos años haya.
+ANCHO_GRAFICO = 400
+ALTO_GRAFICO = 200
+MARGEN_GRAFICO = 40
+MAXIMO_MARCAS = 11              # hasta 10 años se marca cada año
+MAXIMO_PERIODOS_CURVA = 1 << 20     # más periodos que esto se muestrean por columna
+elementos_grafico = {}          # nombre -> id del elemento en canvas_grafico
+
+def puntos_curva(capital, tasa, tiempo, periodos, columnas):
+    """Puntos (año, monto) de la curva, reducidos a columnas columnas
+
+    De cada columna quedan el monto mínimo y el máximo (en el orden en que
+    aparecen, al principio y al final de la columna), que es todo lo que se
+    distingue en pantalla. La curva termina en el plazo exacto, aunque el
+    último periodo no se complete, con el mismo monto que muestra el cálculo.
+    """
+    total = total_periodos(tiempo, periodos)
+    factor = 1 + tasa / periodos
+    final = [(tiempo, capital * factor ** (periodos * tiempo))] if total < periodos * tiempo else []
+    if np is None or total > MAXIMO_PERIODOS_CURVA:
+        # El monto crece con cada periodo, así que muestrear dos veces por
+        # columna da la misma curva en pantalla
+        numeros = sorted({total * i // (2 * columnas - 1) for i in range(2 * columnas)})
+        return [(k / periodos, capital * factor ** k) for k in numeros] + final
+    numeros = np.arange(total + 1)
+    montos = capital * np.power(factor, numeros.astype(np.float64))
+    columna = numeros * columnas // (total + 1)
+    inicios = np.flatnonzero(np.diff(columna, prepend=-1))
+    finales = np.append(inicios[1:], total + 1) - 1
+    minimos = np.minimum.reduceat(montos, inicios)
+    maximos = np.maximum.reduceat(montos, inicios)
+    crece = montos[finales] >= montos[inicios]
+    años = np.column_stack((numeros[inicios], numeros[finales])).ravel() / periodos
+    ordenados = np.column_stack((np.where(crece, minimos, maximos),
+                                 np.where(crece, maximos, minimos))).ravel()
+    return list(zip(años.tolist(), ordenados.tolist())) + final
+
+def paso_marcas(tiempo, maximo=MAXIMO_MARCAS):
+    """Años entre marcas del eje X (1, 2, 5, 10, 20, 50...) para no pasar de maximo marcas"""
+    escala = 1
+    while True:
+        for paso in (escala, 2 * escala, 5 * escala):
+            if int(tiempo) // paso + 1 <= maximo:
+                return paso
+        escala *= 10
+
+def crear_elementos_grafico():
+    """Crea los ejes, la curva y las marcas del gráfico (una sola vez)"""
+    ancho, alto, margen = ANCHO_GRAFICO, ALTO_GRAFICO, MARGEN_GRAFICO
+    elementos_grafico["ejes"] = [
+        canvas_grafico.create_line(margen, alto-margen, ancho-margen, alto-margen, width=2),  # Eje X
+        canvas_grafico.create_line(margen, margen, margen, alto-margen, width=2),  # Eje Y
+        canvas_grafico.create_text(ancho//2, alto-10, text="Años", fill=COLOR_TEXTO),
+        canvas_grafico.create_text(15, alto//2, text="Monto ($)", angle=90, fill=COLOR_TEXTO)
+    ]
+    # Bandas de la simulación Monte Carlo (percentiles 5-95 y mediana), debajo de la curva
+    elementos_grafico["banda"] = canvas_grafico.create_polygon(
+        0, 0, 0, 0, 0, 0, fill=COLOR_TERCIARIO, outline=COLOR_PRIMARIO)
+    elementos_grafico["mediana"] = canvas_grafico.create_line(
+        0, 0, 0, 0, fill=COLOR_SECUNDARIO, width=2, dash=(6, 3))
+    elementos_grafico["curva"] = canvas_grafico.create_line(
+        0, 0, 0, 0, fill=COLOR_PRIMARIO, width=3, joinstyle=tk.ROUND)
+    # Cada marca: rayita y año en el eje X, y el punto sobre la curva
+    elementos_grafico["marcas"] = [
+        (canvas_grafico.create_line(0, 0, 0, 0, fill=COLOR_TEXTO),
+         canvas_grafico.create_text(0, 0, fill=COLOR_TEXTO),
+         canvas_grafico.create_oval(0, 0, 0, 0, fill=COLOR_SECUNDARIO, outline=COLOR_SECUNDARIO))
+        for _ in range(MAXIMO_MARCAS)
+    ]
+
+def actualizar_grafico(capital, tasa, tiempo, periodos, bandas=None):
+    """Mueve la curva y las marcas del gráfico al nuevo cálculo
+
+    bandas es el resultado de simular_montecarlo() para dibujar también los
+    percentiles 5, 50 y 95 de la simulación.
+    """
+    if not elementos_grafico:
+        crear_elementos_grafico()
+    ancho, alto, margen = ANCHO_GRAFICO, ALTO_GRAFICO, MARGEN_GRAFICO
+    canvas_grafico.itemconfigure(tk.ALL, state=tk.NORMAL)
+    
+    puntos = puntos_curva(capital, tasa, tiempo, periodos, ancho - 2*margen)
+    # Escala: el triple del capital, o más si el monto final no entra
+    escala = max(capital * 3, max(monto for _, monto in puntos))
+    if bandas is not None:
+        escala = max(escala, max(bandas["bandas"][95]))
+    
+    def a_pantalla(año, monto):
+        return (margen + (año/tiempo) * (ancho - 2*margen),
+                alto - margen - (monto/escala) * (alto - 2*margen))
+    
+    canvas_grafico.coords(elementos_grafico["curva"],
+                          *[coordenada for punto in puntos for coordenada in a_pantalla(*punto)])
+    
+    if bandas is None:
+        canvas_grafico.itemconfigure(elementos_grafico["banda"], state=tk.HIDDEN)
+        canvas_grafico.itemconfigure(elementos_grafico["mediana"], state=tk.HIDDEN)
+    else:
+        años, percentiles = bandas["años"], bandas["bandas"]
+        # Polígono: el percentil 95 de ida y el 5 de vuelta
+        contorno = list(zip(años, percentiles[95])) + list(zip(años, percentiles[5]))[::-1]
+        canvas_grafico.coords(elementos_grafico["banda"],
+                              *[coordenada for punto in contorno for coordenada in a_pantalla(*punto)])
+        canvas_grafico.coords(elementos_grafico["mediana"],
+                              *[coordenada for punto in zip(años, percentiles[50])
+                                for coordenada in a_pantalla(*punto)])
+    
+    # Marcar los años, espaciados para que las etiquetas no se encimen
+    paso = paso_marcas(tiempo)
+    años = range(0, int(tiempo) + 1, paso)
+    for i, (raya, etiqueta, punto) in enumerate(elementos_grafico["marcas"]):
+        if i >= len(años):
+            for elemento in (raya, etiqueta, punto):
+                canvas_grafico.itemconfigure(elemento, state=tk.HIDDEN)
+            continue
+        x, y = a_pantalla(años[i], capital * ((1 + tasa/periodos) ** (periodos * años[i])))
+        canvas_grafico.coords(raya, x, alto-margen-5, x, alto-margen+5)
+        canvas_grafico.coords(etiqueta, x, alto-margen+10)
+        canvas_grafico.itemconfigure(etiqueta, text=str(años[i]))
+        canvas_grafico.coords(punto, x-4, y-4, x+4, y+4)
+
+def ocultar_grafico():
+    """Oculta el gráfico sin borrar sus elementos (se reutilizan en el próximo cálculo)"""
+    canvas_grafico.itemconfigure(tk.ALL, state=tk.HIDDEN)
+
+# ============================================================================
+# UTILIDADES DE LA INTERFAZ
+# ============================================================================
 
 def limpiar_campos():
     """Limpia todos los campos de entrada y resultados"""
@@ -189,8 +775,7 @@ def limpiar_campos():
     texto_explicacion.delete(1.0, tk.END)
     
     # Limpiar gráfico
-    for item in canvas_grafico.find_all():
-        canvas_grafico.delete(item)
+    ocultar_grafico()
 
 def crear_efecto_hover(boton, color_normal, color_hover):
     """Crea efecto hover para un botón"""
@@ -234,69 +819,715 @@ Ej: al 6% anual, se duplica en ≈ 12 años.
 """
     messagebox.showinfo("Concepto: Interés Compuesto", info)
 
+def mostrar_tabla_periodos():
+    """Muestra el saldo y los intereses de cada periodo en una tabla virtual
+
+    Solo existen las etiquetas de FILAS_TABLA filas: al desplazarse se
+    calculan las filas visibles, así que 50 años de capitalización diaria
+    (o muchos más) se recorren sin demora.
+    """
+    datos = leer_datos_calculo()
+    if datos is None:
+        return
+    capital, tasa_decimal, tiempo, periodos = datos
+    total = total_periodos(tiempo, periodos)
+    if total == 0:
+        messagebox.showwarning("Valores inválidos", 
+                               "El tiempo debe alcanzar al menos un periodo completo.")
+        return
+    titulo = (f"📋 {total:,} PERIODOS: ${capital:,.2f} al {tasa_decimal*100:g}% "
+              f"con {periodos} capitalizaciones por año")
+    contexto = None
+    if modo_exacto.get():
+        # En modo exacto la tabla usa Decimal con los valores tal como se escribieron
+        try:
+            contexto = opciones_exactas()
+            capital, tasa_decimal, _ = leer_datos_exactos(contexto)
+            comprobar_precision(capital, tasa_decimal, periodos, total, contexto)
+        except (ValueError, decimal.DecimalException) as error:
+            messagebox.showerror("Modo exacto", str(error))
+            return
+        titulo += f" (exacto: {contexto.prec} dígitos, {redondeo_var.get()})"
+    
+    ventana_tabla = tk.Toplevel(ventana)
+    ventana_tabla.title("Tabla de Capitalización por Periodo")
+    ventana_tabla.configure(bg=COLOR_FONDO)
+    ventana_tabla.transient(ventana)
+    
+    estado = {"primera": 0}
+    
+    tk.Label(ventana_tabla,
+             text=titulo,
+             font=("Arial", 12, "bold"),
+             bg=COLOR_FONDO,
+             fg=COLOR_SECUNDARIO).pack(pady=10)
+    
+    frame_tabla = tk.Frame(ventana_tabla, bg=COLOR_ENTRADA, relief=tk.SOLID, borderwidth=1)
+    frame_tabla.pack(padx=15, pady=5)
+    
+    anchos = (10, 10, 20, 20, 22)
+    for columna, (encabezado, ancho) in enumerate(zip(ENCABEZADOS_TABLA, anchos)):
+        tk.Label(frame_tabla, text=encabezado, width=ancho,
+                 font=("Arial", 10, "bold"),
+                 bg=COLOR_PRIMARIO,
+                 fg="white").grid(row=0, column=columna, sticky="ew")
+    
+    # Celdas fijas: se reutilizan para cualquier periodo
+    celdas = [
+        [tk.Label(frame_tabla, width=ancho, font=("Courier", 10), fg=COLOR_TEXTO, anchor="e")
+         for ancho in anchos]
+        for _ in range(FILAS_TABLA)
+    ]
+    for fila, etiquetas in enumerate(celdas):
+        for columna, etiqueta in enumerate(etiquetas):
+            etiqueta.grid(row=fila + 1, column=columna, sticky="ew")
+    
+    barra_tabla = tk.Scrollbar(frame_tabla, orient=tk.VERTICAL)
+    barra_tabla.grid(row=1, column=len(anchos), rowspan=FILAS_TABLA, sticky="ns")
+    
+    def dibujar():
+        """Calcula y muestra solo las filas visibles"""
+        primera = estado["primera"]
+        ultima = min(primera + FILAS_TABLA, total)
+        if contexto is None:
+            columnas = tramo_calendario(capital, tasa_decimal, periodos, primera, ultima)
+        else:
+            try:
+                columnas = tramo_calendario_exacto(capital, tasa_decimal, periodos, primera, ultima, contexto)
+            except (ValueError, decimal.DecimalException) as error:
+                messagebox.showerror("Modo exacto", str(error), parent=ventana_tabla)
+                return
+        filas = list(zip(*columnas))
+        for fila, etiquetas in enumerate(celdas):
+            if fila < len(filas):
+                periodo, año, interes, acumulado, saldo = filas[fila]
+                textos = (f"{periodo:,}", f"{año:.2f}", f"${interes:,.2f}",
+                          f"${acumulado:,.2f}", f"${saldo:,.2f}")
+            else:
+                textos = ("",) * len(etiquetas)
+            color_fondo = COLOR_FONDO if (primera + fila) % 2 else COLOR_ENTRADA
+            for etiqueta, texto in zip(etiquetas, textos):
+                etiqueta.config(text=texto, bg=color_fondo)
+        barra_tabla.set(primera / total, ultima / total)
+    
+    def ir_a_fila(primera):
+        estado["primera"] = min(max(int(primera), 0), max(total - FILAS_TABLA, 0))
+        dibujar()
+    
+    def desplazar(*argumentos):
+        """Comando de la barra: ('moveto', fracción) o ('scroll', n, 'units'|'pages')"""
+        if argumentos[0] == "moveto":
+            ir_a_fila(float(argumentos[1]) * total)
+        elif argumentos[0] == "scroll":
+            paso = FILAS_TABLA if argumentos[2] == "pages" else 1
+            ir_a_fila(estado["primera"] + int(argumentos[1]) * paso)
+    
+    barra_tabla.config(command=desplazar)
+    # Rueda del ratón: <MouseWheel> en Windows/macOS, botones 4 y 5 en Linux
+    for widget in [frame_tabla] + [etiqueta for etiquetas in celdas for etiqueta in etiquetas]:
+        widget.bind("<MouseWheel>", lambda e: desplazar("scroll", -3 if e.delta > 0 else 3, "units"))
+        widget.bind("<Button-4>", lambda e: desplazar("scroll", -3, "units"))
+        widget.bind("<Button-5>", lambda e: desplazar("scroll", 3, "units"))
+    
+    # Ir a un periodo y exportar
+    frame_acciones = tk.Frame(ventana_tabla, bg=COLOR_FONDO)
+    frame_acciones.pack(pady=10)
+    
+    tk.Label(frame_acciones, text="Ir al periodo:", bg=COLOR_FONDO, 
+             fg=COLOR_TEXTO, font=("Arial", 10)).pack(side=tk.LEFT)
+    entrada_periodo = tk.Entry(frame_acciones, width=12, font=("Arial", 10), 
+                               bg=COLOR_ENTRADA, relief=tk.SOLID, borderwidth=1)
+    entrada_periodo.pack(side=tk.LEFT, padx=(5, 20))
+    
+    def ir_al_periodo(event=None):
+        try:
+            ir_a_fila(int(entrada_periodo.get()) - 1)
+        except ValueError:
+            pass
+    
+    entrada_periodo.bind("<Return>", ir_al_periodo)
+    
+    estado_exportacion = tk.Label(ventana_tabla, text="", bg=COLOR_FONDO, 
+                                  fg=COLOR_TEXTO, font=("Arial", 9))
+    exportacion = {"archivo": None, "pendiente": None}
+    
+    def cerrar_exportacion(evento=None):
+        # Cerrar la ventana a media exportación no debe dejar el archivo abierto
+        if evento is not None and evento.widget is not ventana_tabla:
+            return
+        if exportacion["pendiente"] is not None:
+            ventana_tabla.after_cancel(exportacion["pendiente"])
+            exportacion["pendiente"] = None
+        if exportacion["archivo"] is not None:
+            exportacion["archivo"].close()
+            exportacion["archivo"] = None
+    
+    ventana_tabla.bind("<Destroy>", cerrar_exportacion, add="+")
+    
+    def exportar():
+        ruta = filedialog.asksaveasfilename(
+            parent=ventana_tabla,
+            title="Exportar tabla a CSV",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("Todos los archivos", "*.*")]
+        )
+        if not ruta:
+            return
+        try:
+            archivo = open(ruta, "w", encoding="utf-8", newline="")
+        except OSError as error:
+            messagebox.showerror("Error", f"No se pudo crear el archivo:\n{error}", parent=ventana_tabla)
+            return
+        exportacion["archivo"] = archivo
+        avance = exportar_calendario_csv(archivo, capital, tasa_decimal, tiempo, periodos, contexto)
+        btn_exportar.config(state=tk.DISABLED)
+        
+        def continuar():
+            # Un tramo por vuelta del bucle de eventos: la ventana sigue respondiendo
+            exportacion["pendiente"] = None
+            try:
+                filas = next(avance, None)
+            except OSError as error:
+                cerrar_exportacion()
+                btn_exportar.config(state=tk.NORMAL)
+                messagebox.showerror("Error", f"No se pudo escribir el archivo:\n{error}", parent=ventana_tabla)
+                return
+            except (ValueError, decimal.DecimalException) as error:
+                cerrar_exportacion()
+                btn_exportar.config(state=tk.NORMAL)
+                messagebox.showerror("Modo exacto", str(error), parent=ventana_tabla)
+                return
+            if filas is None:
+                cerrar_exportacion()
+                btn_exportar.config(state=tk.NORMAL)
+                estado_exportacion.config(text=f"✅ {total:,} filas exportadas a {ruta}")
+                return
+            estado_exportacion.config(text=f"Exportando... {filas:,} de {total:,} filas")
+            exportacion["pendiente"] = ventana_tabla.after(1, continuar)
+        
+        continuar()
+    
+    btn_exportar = tk.Button(frame_acciones, text="💾 Exportar CSV", 
+                             font=("Arial", 10, "bold"),
+                             bg=COLOR_BOTON,
+                             fg="white",
+                             relief=tk.RAISED,
+                             borderwidth=2,
+                             width=16,
+                             command=exportar)
+    btn_exportar.pack(side=tk.LEFT, padx=5)
+    crear_efecto_hover(btn_exportar, COLOR_BOTON, COLOR_BOTON_HOVER)
+    estado_exportacion.pack(pady=(0, 10))
+    
+    dibujar()
+
+def mostrar_barrido_escenarios():
+    """Calcula el monto final para rangos de tasa, tiempo y periodos y lo
+    muestra como mapa de calor (tasa × tiempo) para cada cantidad de periodos"""
+    try:
+        capital = float(entrada_capital.get())
+    except ValueError:
+        messagebox.showerror("Error de entrada", 
+                            "Por favor, ingresa valores numéricos válidos.")
+        return
+    if capital <= 0:
+        messagebox.showwarning("Valores inválidos", 
+                               "Todos los valores deben ser mayores que cero.")
+        return
+    
+    ancho_mapa, alto_mapa = 600, 320
+    x_mapa, y_mapa = 70, 15
+    
+    ventana_barrido = tk.Toplevel(ventana)
+    ventana_barrido.title("Barrido de Escenarios")
+    ventana_barrido.configure(bg=COLOR_FONDO)
+    ventana_barrido.transient(ventana)
+    
+    estado = {"montos": None}
+    
+    tk.Label(ventana_barrido,
+             text=f"🗺️ BARRIDO DE ESCENARIOS PARA ${capital:,.2f}",
+             font=("Arial", 12, "bold"),
+             bg=COLOR_FONDO,
+             fg=COLOR_SECUNDARIO).pack(pady=10)
+    
+    # Rangos: desde, hasta y cantidad de pasos
+    frame_rangos = tk.Frame(ventana_barrido, bg=COLOR_FONDO)
+    frame_rangos.pack(padx=15)
+    
+    def crear_campo(fila, columna, valor, ancho=8):
+        entrada = tk.Entry(frame_rangos, width=ancho, font=("Arial", 10), 
+                           bg=COLOR_ENTRADA, relief=tk.SOLID, borderwidth=1)
+        entrada.grid(row=fila, column=columna, padx=5, pady=3, sticky="w")
+        entrada.insert(0, valor)
+        return entrada
+    
+    for columna, texto in enumerate(("", "Desde", "Hasta", "Pasos")):
+        tk.Label(frame_rangos, text=texto, bg=COLOR_FONDO, fg=COLOR_TEXTO, 
+                 font=("Arial", 10, "bold")).grid(row=0, column=columna, padx=5)
+    tk.Label(frame_rangos, text="Tasa anual (%):", bg=COLOR_FONDO, fg=COLOR_TEXTO, 
+             font=("Arial", 10)).grid(row=1, column=0, sticky="w")
+    tk.Label(frame_rangos, text="Tiempo (años):", bg=COLOR_FONDO, fg=COLOR_TEXTO, 
+             font=("Arial", 10)).grid(row=2, column=0, sticky="w")
+    tk.Label(frame_rangos, text="Periodos por año:", bg=COLOR_FONDO, fg=COLOR_TEXTO, 
+             font=("Arial", 10)).grid(row=3, column=0, sticky="w")
+    campos_tasa = [crear_campo(1, 1, "1"), crear_campo(1, 2, "15"), crear_campo(1, 3, "281")]
+    campos_tiempo = [crear_campo(2, 1, "1"), crear_campo(2, 2, "50"), crear_campo(2, 3, "981")]
+    entrada_lista_periodos = tk.Entry(frame_rangos, width=28, font=("Arial", 10), 
+                                      bg=COLOR_ENTRADA, relief=tk.SOLID, borderwidth=1)
+    entrada_lista_periodos.grid(row=3, column=1, columnspan=3, padx=5, pady=3, sticky="w")
+    entrada_lista_periodos.insert(0, "1, 2, 4, 12, 52, 365")
+    
+    # Periodos que se muestran en el mapa
+    frame_vista = tk.Frame(ventana_barrido, bg=COLOR_FONDO)
+    frame_vista.pack(pady=5)
+    tk.Label(frame_vista, text="Ver con periodos por año:", bg=COLOR_FONDO, 
+             fg=COLOR_TEXTO, font=("Arial", 10)).pack(side=tk.LEFT)
+    periodo_visible = tk.StringVar()
+    selector_periodos = ttk.Combobox(frame_vista, textvariable=periodo_visible, 
+                                     state="readonly", width=8, font=("Arial", 10))
+    selector_periodos.pack(side=tk.LEFT, padx=5)
+    etiqueta_calculo = tk.Label(frame_vista, text="", bg=COLOR_FONDO, 
+                                fg=COLOR_TEXTO, font=("Arial", 9))
+    etiqueta_calculo.pack(side=tk.LEFT, padx=10)
+    
+    # Mapa de calor: una imagen del tamaño del mapa (un color por píxel),
+    # sin importar cuántas celdas tenga la rejilla
+    canvas_mapa = tk.Canvas(ventana_barrido, bg="white", 
+                            width=x_mapa + ancho_mapa + 15, height=y_mapa + alto_mapa + 45)
+    canvas_mapa.pack(padx=15, pady=5)
+    imagen_mapa = tk.PhotoImage(width=ancho_mapa, height=alto_mapa)
+    canvas_mapa.create_image(x_mapa, y_mapa, image=imagen_mapa, anchor="nw")
+    canvas_mapa.create_text(x_mapa + ancho_mapa // 2, y_mapa + alto_mapa + 35, 
+                            text="Tiempo (años)", fill=COLOR_TEXTO)
+    canvas_mapa.create_text(15, y_mapa + alto_mapa // 2, text="Tasa (%)", 
+                            angle=90, fill=COLOR_TEXTO)
+    etiquetas_ejes = [
+        canvas_mapa.create_text(x_mapa - 5, y_mapa + alto_mapa, anchor="e", fill=COLOR_TEXTO),
+        canvas_mapa.create_text(x_mapa - 5, y_mapa, anchor="e", fill=COLOR_TEXTO),
+        canvas_mapa.create_text(x_mapa, y_mapa + alto_mapa + 12, anchor="w", fill=COLOR_TEXTO),
+        canvas_mapa.create_text(x_mapa + ancho_mapa, y_mapa + alto_mapa + 12, anchor="e", fill=COLOR_TEXTO)
+    ]
+    
+    lectura = tk.Label(ventana_barrido, text="Pasa el ratón sobre el mapa para ver cada escenario", 
+                       bg=COLOR_FONDO, fg=COLOR_SECUNDARIO, font=("Arial", 10, "bold"))
+    lectura.pack(pady=5)
+    
+    def indice_periodo():
+        return estado["periodos"].index(int(periodo_visible.get()))
+    
+    def dibujar_mapa(*args):
+        """Pinta la rebanada de la rejilla con los periodos elegidos"""
+        if estado["montos"] is None or not periodo_visible.get():
+            return
+        tasas, tiempos = estado["tasas"], estado["tiempos"]
+        # Qué celda cae en cada píxel (las tasas crecen hacia arriba)
+        filas = [(alto_mapa - 1 - fila) * len(tasas) // alto_mapa for fila in range(alto_mapa)]
+        columnas = [columna * len(tiempos) // ancho_mapa for columna in range(ancho_mapa)]
+        imagen_mapa.put(datos_imagen_mapa(estado["montos"][indice_periodo()], filas, columnas, 
+                                          estado["minimo"], estado["maximo"]), to=(0, 0))
+        for elemento, texto in zip(etiquetas_ejes, (f"{tasas[0]*100:g}", f"{tasas[-1]*100:g}", 
+                                                    f"{tiempos[0]:g}", f"{tiempos[-1]:g}")):
+            canvas_mapa.itemconfigure(elemento, text=texto)
+    
+    def mostrar_lectura(event):
+        """Valores del escenario bajo el ratón"""
+        if estado["montos"] is None or not periodo_visible.get():
+            return
+        fila, columna = event.y - y_mapa, event.x - x_mapa
+        if not (0 <= fila < alto_mapa and 0 <= columna < ancho_mapa):
+            return
+        tasas, tiempos = estado["tasas"], estado["tiempos"]
+        i = (alto_mapa - 1 - fila) * len(tasas) // alto_mapa
+        j = columna * len(tiempos) // ancho_mapa
+        monto = float(estado["montos"][indice_periodo()][i][j])
+        lectura.config(text=f"Tasa {tasas[i]*100:.3f}% · {tiempos[j]:.2f} años · "
+                            f"{periodo_visible.get()} periodos/año → ${monto:,.2f}")
+    
+    def calcular_barrido():
+        try:
+            tasa_desde, tasa_hasta = (float(campo.get()) for campo in campos_tasa[:2])
+            tiempo_desde, tiempo_hasta = (float(campo.get()) for campo in campos_tiempo[:2])
+            pasos_tasa, pasos_tiempo = int(campos_tasa[2].get()), int(campos_tiempo[2].get())
+            periodos = sorted({int(valor) for valor in entrada_lista_periodos.get().split(",") if valor.strip()})
+        except ValueError:
+            messagebox.showerror("Error de entrada", 
+                                "Por favor, ingresa valores numéricos válidos.", parent=ventana_barrido)
+            return
+        if (min(tasa_desde, tiempo_desde, pasos_tasa, pasos_tiempo) <= 0 or not periodos 
+                or periodos[0] <= 0 or tasa_hasta < tasa_desde or tiempo_hasta < tiempo_desde):
+            messagebox.showwarning("Valores inválidos", 
+                                   "Los valores deben ser mayores que cero y cada rango ir de menor a mayor.",
+                                   parent=ventana_barrido)
+            return
+        celdas = pasos_tasa * pasos_tiempo * len(periodos)
+        if celdas > MAXIMO_CELDAS_BARRIDO:
+            messagebox.showwarning("Barrido muy grande", 
+                                   f"El barrido tendría {celdas:,} escenarios; el máximo es "
+                                   f"{MAXIMO_CELDAS_BARRIDO:,}.", parent=ventana_barrido)
+            return
+        
+        tasas = valores_en_rango(tasa_desde / 100, tasa_hasta / 100, pasos_tasa)
+        tiempos = valores_en_rango(tiempo_desde, tiempo_hasta, pasos_tiempo)
+        inicio = time.perf_counter()
+        montos = barrido_montos(capital, tasas, periodos, tiempos)
+        segundos = time.perf_counter() - inicio
+        minimo, maximo = extremos_barrido(montos)
+        if not math.isfinite(maximo):
+            messagebox.showwarning("Barrido muy grande", 
+                                   "Algunos montos son demasiado grandes; reduce la tasa o el tiempo.",
+                                   parent=ventana_barrido)
+            return
+        estado.update(montos=montos, tasas=tasas, tiempos=tiempos, periodos=periodos, 
+                      minimo=minimo, maximo=maximo)
+        etiqueta_calculo.config(text=f"{celdas:,} escenarios en {segundos*1000:.0f} ms · "
+                                     f"de ${minimo:,.0f} (claro) a ${maximo:,.0f} (oscuro)")
+        selector_periodos.config(values=periodos)
+        if periodo_visible.get() in map(str, periodos):
+            dibujar_mapa()
+        else:
+            periodo_visible.set(str(periodos[-1]))      # el trace dibuja el mapa
+    
+    estado_exportacion = tk.Label(ventana_barrido, text="", bg=COLOR_FONDO, 
+                                  fg=COLOR_TEXTO, font=("Arial", 9))
+    exportacion = {"archivo": None, "pendiente": None}
+    
+    def cerrar_exportacion(evento=None):
+        # Cerrar la ventana a media exportación no debe dejar el archivo abierto
+        if evento is not None and evento.widget is not ventana_barrido:
+            return
+        if exportacion["pendiente"] is not None:
+            ventana_barrido.after_cancel(exportacion["pendiente"])
+            exportacion["pendiente"] = None
+        if exportacion["archivo"] is not None:
+            exportacion["archivo"].close()
+            exportacion["archivo"] = None
+    
+    ventana_barrido.bind("<Destroy>", cerrar_exportacion, add="+")
+    
+    def exportar():
+        if estado["montos"] is None:
+            return
+        ruta = filedialog.asksaveasfilename(
+            parent=ventana_barrido,
+            title="Exportar barrido a CSV",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("Todos los archivos", "*.*")]
+        )
+        if not ruta:
+            return
+        try:
+            archivo = open(ruta, "w", encoding="utf-8", newline="")
+        except OSError as error:
+            messagebox.showerror("Error", f"No se pudo crear el archivo:\n{error}", parent=ventana_barrido)
+            return
+        exportacion["archivo"] = archivo
+        avance = exportar_barrido_csv(archivo, estado["montos"], estado["tasas"], 
+                                      estado["periodos"], estado["tiempos"])
+        total = len(estado["tasas"]) * len(estado["tiempos"]) * len(estado["periodos"])
+        btn_exportar.config(state=tk.DISABLED)
+        
+        def continuar():
+            # Escribir unos 50 ms por vuelta del bucle de eventos
+            exportacion["pendiente"] = None
+            limite = time.perf_counter() + 0.05
+            try:
+                filas = next(avance, None)
+                while filas is not None and time.perf_counter() < limite:
+                    filas = next(avance, None)
+            except OSError as error:
+                cerrar_exportacion()
+                btn_exportar.config(state=tk.NORMAL)
+                messagebox.showerror("Error", f"No se pudo escribir el archivo:\n{error}", parent=ventana_barrido)
+                return
+            if filas is None:
+                cerrar_exportacion()
+                btn_exportar.config(state=tk.NORMAL)
+                estado_exportacion.config(text=f"✅ {total:,} escenarios exportados a {ruta}")
+                return
+            estado_exportacion.config(text=f"Exportando... {filas:,} de {total:,} escenarios")
+            exportacion["pendiente"] = ventana_barrido.after(1, continuar)
+        
+        continuar()
+    
+    frame_acciones = tk.Frame(ventana_barrido, bg=COLOR_FONDO)
+    frame_acciones.pack(pady=5)
+    btn_barrido = tk.Button(frame_acciones, text="Calcular Barrido", 
+                            font=("Arial", 10, "bold"),
+                            bg=COLOR_BOTON,
+                            fg="white",
+                            relief=tk.RAISED,
+                            borderwidth=2,
+                            width=16,
+                            command=calcular_barrido)
+    btn_barrido.pack(side=tk.LEFT, padx=5)
+    crear_efecto_hover(btn_barrido, COLOR_BOTON, COLOR_BOTON_HOVER)
+    btn_exportar = tk.Button(frame_acciones, text="💾 Exportar CSV", 
+                             font=("Arial", 10, "bold"),
+                             bg=COLOR_TERCIARIO,
+                             fg=COLOR_TEXTO,
+                             relief=tk.RAISED,
+                             borderwidth=2,
+                             width=16,
+                             command=exportar)
+    btn_exportar.pack(side=tk.LEFT, padx=5)
+    crear_efecto_hover(btn_exportar, COLOR_TERCIARIO, COLOR_SECUNDARIO)
+    estado_exportacion.pack(pady=(0, 10))
+    
+    periodo_visible.trace_add("write", dibujar_mapa)
+    canvas_mapa.bind("<Motion>", mostrar_lectura)
+    calcular_barrido()
+
+def mostrar_montecarlo():
+    """Ventana de la simulación Monte Carlo: tasa anual aleatoria en cada año"""
+    ventana_mc = tk.Toplevel(ventana)
+    ventana_mc.title("Simulación Monte Carlo")
+    ventana_mc.configure(bg=COLOR_FONDO)
+    ventana_mc.transient(ventana)
+    ventana_mc.resizable(False, False)
+    
+    tk.Label(ventana_mc,
+             text="🎲 TASA VARIABLE: SIMULACIÓN MONTE CARLO",
+             font=("Arial", 12, "bold"),
+             bg=COLOR_FONDO,
+             fg=COLOR_SECUNDARIO).pack(padx=15, pady=10)
+    tk.Label(ventana_mc,
+             text="Cada año se sortea una tasa alrededor de la tasa anual ingresada.\n"
+                  "Se usan el capital, el tiempo, los periodos y el monto objetivo de la ventana principal.",
+             font=("Arial", 9),
+             bg=COLOR_FONDO,
+             fg=COLOR_TEXTO).pack(padx=15)
+    
+    frame_parametros = tk.Frame(ventana_mc, bg=COLOR_FONDO, padx=15, pady=10)
+    frame_parametros.pack()
+    distribucion = tk.StringVar(value=DISTRIBUCIONES_TASA[0])
+    varios_procesos = tk.BooleanVar(value=False)
+    
+    tk.Label(frame_parametros, text="Distribución de la tasa:", bg=COLOR_FONDO, 
+             fg=COLOR_TEXTO, font=("Arial", 10)).grid(row=0, column=0, sticky="w", pady=5)
+    ttk.Combobox(frame_parametros, textvariable=distribucion, values=DISTRIBUCIONES_TASA,
+                 state="readonly", width=17, font=("Arial", 10)).grid(row=0, column=1, padx=10, pady=5)
+    entrada_desviacion = crear_fila_entrada(frame_parametros, "Desviación de la tasa (%):", "", 1)
+    entrada_trayectorias = crear_fila_entrada(frame_parametros, "Trayectorias:", "", 2)
+    entrada_semilla = crear_fila_entrada(frame_parametros, "Semilla:", "", 3)
+    entrada_desviacion.insert(0, "2")
+    entrada_trayectorias.insert(0, "100000")
+    entrada_semilla.insert(0, "2024")
+    tk.Checkbutton(frame_parametros, text="Repartir en varios procesos", variable=varios_procesos,
+                   bg=COLOR_FONDO, fg=COLOR_TEXTO, font=("Arial", 10),
+                   activebackground=COLOR_FONDO).grid(row=4, column=0, columnspan=2, sticky="w", pady=5)
+    simulacion = {"pool": None, "pendiente": None, "sondeo": None}
+    
+    def detener_simulacion(evento=None):
+        # Al cerrar la ventana se descarta la simulación en curso
+        if evento is not None and evento.widget is not ventana_mc:
+            return
+        if simulacion["sondeo"] is not None:
+            ventana_mc.after_cancel(simulacion["sondeo"])
+            simulacion["sondeo"] = None
+        if simulacion["pool"] is not None:
+            simulacion["pool"].terminate()
+            simulacion["pool"] = None
+        simulacion["pendiente"] = None
+    
+    ventana_mc.bind("<Destroy>", detener_simulacion, add="+")
+    
+    def simular():
+        datos = leer_datos_calculo()
+        if datos is None:
+            return
+        capital, tasa_decimal, tiempo, periodos = datos
+        try:
+            desviacion = float(entrada_desviacion.get()) / 100
+            trayectorias = int(entrada_trayectorias.get())
+            semilla = int(entrada_semilla.get()) if entrada_semilla.get().strip() else None
+            objetivo = float(entrada_objetivo.get())
+        except ValueError:
+            messagebox.showerror("Error de entrada", 
+                                "Por favor, ingresa valores numéricos válidos.", parent=ventana_mc)
+            return
+        if desviacion < 0 or trayectorias <= 0:
+            messagebox.showwarning("Valores inválidos", 
+                                   "La desviación no puede ser negativa y debe haber al menos una trayectoria.",
+                                   parent=ventana_mc)
+            return
+        
+        def mostrar(resultado, segundos):
+            resumen = resumen_finales(resultado["finales"], objetivo)
+            monto_fijo = capital * ((1 + tasa_decimal/periodos) ** (periodos * tiempo))
+            
+            percentiles = "\n".join(f"  {f'Percentil {percentil}:':<17}${monto:,.2f}"
+                                    for percentil, monto in resumen["percentiles"].items())
+            explicacion = f"""🎲 SIMULACIÓN MONTE CARLO:
+
+{trayectorias:,} trayectorias en {segundos:.2f} s ({procesos} proceso{'s' if procesos > 1 else ''})
+
+Capital inicial: ${capital:,.2f}
+Tasa anual: {distribucion.get()}, media {tasa_decimal*100:g}% y desviación {desviacion*100:g}%
+Tiempo: {tiempo} años
+Periodos por año: {periodos}
+
+MONTO FINAL:
+  Promedio:        ${resumen['promedio']:,.2f}
+{percentiles}
+  Mínimo:          ${resumen['minimo']:,.2f}
+  Máximo:          ${resumen['maximo']:,.2f}
+
+Con la tasa fija del {tasa_decimal*100:g}%: ${monto_fijo:,.2f}
+
+🎯 PROBABILIDAD DE LLEGAR A ${objetivo:,.2f}: {resumen['probabilidad']*100:.1f}%
+
+En el gráfico, la franja va del percentil 5 al 95
+y la línea punteada es la mediana.
+"""
+            resultado_var.set(f"${resumen['percentiles'][50]:,.2f} (mediana)")
+            interes_var.set(f"${resumen['percentiles'][50] - capital:,.2f} (mediana)")
+            texto_explicacion.delete(1.0, tk.END)
+            texto_explicacion.insert(1.0, explicacion)
+            actualizar_grafico(capital, tasa_decimal, tiempo, periodos, resultado)
+        
+        procesos = (os.cpu_count() or 1) if varios_procesos.get() else 1
+        inicio = time.perf_counter()
+        # Los trozos se calculan en otros procesos y la ventana solo revisa
+        # (con after) si ya terminaron: así sigue respondiendo mientras tanto
+        años, tareas = tareas_montecarlo(capital, tasa_decimal, desviacion, distribucion.get(), 
+                                         tiempo, periodos, trayectorias, semilla)
+        procesos = min(procesos, len(tareas))
+        simulacion["pool"] = multiprocessing.Pool(procesos)
+        simulacion["pendiente"] = simulacion["pool"].starmap_async(simular_trozo, tareas)
+        btn_simular.config(state=tk.DISABLED)
+        ventana_mc.config(cursor="watch")
+        
+        def sondear():
+            simulacion["sondeo"] = None
+            if not simulacion["pendiente"].ready():
+                simulacion["sondeo"] = ventana_mc.after(INTERVALO_SONDEO_MS, sondear)
+                return
+            try:
+                resultados = simulacion["pendiente"].get()
+            except Exception as error:
+                resultados = None
+                messagebox.showerror("Error", f"La simulación falló:\n{error}", parent=ventana_mc)
+            detener_simulacion()
+            btn_simular.config(state=tk.NORMAL)
+            ventana_mc.config(cursor="")
+            if resultados is not None:
+                mostrar(combinar_montecarlo(capital, tasa_decimal, desviacion, tiempo, periodos, 
+                                            años, resultados),
+                        time.perf_counter() - inicio)
+        
+        simulacion["sondeo"] = ventana_mc.after(INTERVALO_SONDEO_MS, sondear)
+    
+    btn_simular = tk.Button(ventana_mc, text="Simular", 
+                            font=("Arial", 10, "bold"),
+                            bg=COLOR_BOTON,
+                            fg="white",
+                            relief=tk.RAISED,
+                            borderwidth=2,
+                            width=20,
+                            height=2,
+                            command=simular)
+    btn_simular.pack(pady=(0, 15))
+    crear_efecto_hover(btn_simular, COLOR_BOTON, COLOR_BOTON_HOVER)
+
 # ============================================================================
-# CONFIGURACIÓN DE LA VENTANA PRINCIPAL
+# COMPARACIÓN DE RENDIMIENTO: MODO EXACTO Y FLOAT
 # ============================================================================
 
-# Crear ventana principal
-ventana = tk.Tk()
-ventana.title("Calculadora Educativa de Interés Compuesto")
-ventana.geometry("900x900")
-ventana.configure(bg=COLOR_FONDO)
-ventana.resizable(False, False)
-
-# Centrar ventana en pantalla
-ventana.update_idletasks()
-ancho_ventana = ventana.winfo_width()
-alto_ventana = ventana.winfo_height()
-ancho_pantalla = ventana.winfo_screenwidth()
-alto_pantalla = ventana.winfo_screenheight()
-x = (ancho_pantalla // 2) - (ancho_ventana // 2)
-y = (alto_pantalla // 2) - (alto_ventana // 2)
-ventana.geometry(f'{ancho_ventana}x{alto_ventana}+{x}+{y}')
+def _mejor_tiempo(funcion, repeticiones):
+    """Mejor tiempo (segundos) de varias ejecuciones de funcion()"""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def comparar_modos(capital, tasa, tiempo, periodos, precision=PRECISION_EXACTA, repeticiones=5):
+    """Mide el monto final y la tabla completa en float y con Decimal
+
+    capital, tasa (en %) y tiempo son textos, como los de los campos.
+    Devuelve una lista de (descripción, segundos, diferencia en $ o cantidad).
+    """
+    contexto = contexto_exacto(precision)
+    capital_exacto, tiempo_exacto = a_decimal(capital), a_decimal(tiempo)
+    tasa_exacta = contexto.divide(a_decimal(tasa), 100)
+    capital, tasa, tiempo = float(capital), float(tasa) / 100, float(tiempo)
+    total = total_periodos(tiempo, periodos)
+    factor = factor_exacto(tasa_exacta, periodos, contexto)
+    
+    monto_float = capital * ((1 + tasa/periodos) ** (periodos * tiempo))
+    monto_exacto, _ = monto_final_exacto(capital_exacto, tasa_exacta, tiempo_exacto, periodos, contexto)
+    tabla_float = tramo_calendario(capital, tasa, periodos, 0, total)
+    tabla_exacta = tramo_calendario_exacto(capital_exacto, tasa_exacta, periodos, 0, total, contexto)
+    # Los saldos float se comparan con los exactos sin redondear (la diferencia
+    # es el error del float) y, ya redondeados, con los de la tabla exacta
+    saldo = capital_exacto
+    diferencia_tabla = decimal.Decimal(0)
+    centavos_distintos = 0
+    for flotante, redondeado in zip(tabla_float[4], tabla_exacta[4]):
+        saldo = contexto.multiply(saldo, factor)
+        flotante = decimal.Decimal(flotante)
+        diferencia_tabla = max(diferencia_tabla, abs(flotante - saldo))
+        centavos_distintos += contexto.quantize(flotante, CENTAVO) != redondeado
+    return [
+        ("Monto final float", _mejor_tiempo(
+            lambda: capital * ((1 + tasa/periodos) ** (periodos * tiempo)), repeticiones)),
+        ("Monto final exacto", _mejor_tiempo(
+            lambda: monto_final_exacto(capital_exacto, tasa_exacta, tiempo_exacto, periodos, contexto),
+            repeticiones)),
+        (f"Tabla float de {total:,} periodos", _mejor_tiempo(
+            lambda: tramo_calendario(capital, tasa, periodos, 0, total), repeticiones)),
+        (f"Tabla exacta de {total:,} periodos", _mejor_tiempo(
+            lambda: tramo_calendario_exacto(capital_exacto, tasa_exacta, periodos, 0, total, contexto),
+            repeticiones)),
+        ("Diferencia del monto final (float - exacto)", decimal.Decimal(monto_float) - monto_exacto),
+        ("Máxima diferencia de saldo en la tabla", diferencia_tabla),
+        ("Saldos float que difieren al centavo", centavos_distintos)
+    ]
+
+def ejecutar_linea_de_comandos(argumentos):
+    """Punto de entrada sin ventana: python app_interés-compuesto.py benchmark ..."""
+    parser = argparse.ArgumentParser(
+        prog="app_interés-compuesto.py",
+        description="Calculadora de interés compuesto: modos sin interfaz gráfica"
+    )
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    benchmark = subcomandos.add_parser(
+        "benchmark", help="compara el tiempo y la diferencia del modo exacto (Decimal) con float"
+    )
+    benchmark.add_argument("--capital", default="1000")
+    benchmark.add_argument("--tasa", default="5", help="tasa anual en %%")
+    benchmark.add_argument("--tiempo", default="100", help="años")
+    benchmark.add_argument("--periodos", type=int, default=365, help="periodos por año")
+    benchmark.add_argument("--precision", type=int, default=PRECISION_EXACTA,
+                           help="dígitos de precisión del modo exacto")
+    benchmark.add_argument("--repeticiones", type=int, default=5,
+                           help="se toma el mejor tiempo de estas repeticiones")
+    opciones = parser.parse_args(argumentos)
+    
+    try:
+        resultados = comparar_modos(opciones.capital, opciones.tasa, opciones.tiempo, 
+                                    opciones.periodos, opciones.precision, opciones.repeticiones)
+    except (ValueError, decimal.DecimalException) as error:
+        parser.error(str(error))
+    print(f"${opciones.capital} al {opciones.tasa}% durante {opciones.tiempo} años, "
+          f"{opciones.periodos} periodos por año, {opciones.precision} dígitos\n")
+    for descripcion, valor in resultados:
+        if isinstance(valor, decimal.Decimal):
+            print(f"{descripcion:<45} ${valor:.10f}")
+        elif isinstance(valor, int):
+            print(f"{descripcion:<45} {valor:10,}")
+        else:
+            print(f"{descripcion:<45} {valor * 1000:10.3f} ms")
+    return 0
 
 # ============================================================================
-# WIDGETS DE LA INTERFAZ
+# CONFIGURACIÓN DE LA VENTANA PRINCIPAL
 # ============================================================================
 
-# Título principal
-frame_titulo = tk.Frame(ventana, bg=COLOR_FONDO)
-frame_titulo.pack(pady=20)
-
-titulo = tk.Label(frame_titulo, 
-                  text="💸 CALCULADORA DE INTERÉS COMPUESTO", 
-                  font=("Arial", 20, "bold"),
-                  bg=COLOR_FONDO,
-                  fg=COLOR_SECUNDARIO)
-titulo.pack()
-
-subtitulo = tk.Label(frame_titulo,
-                     text="Herramienta educativa para estudiantes de bachillerato",
-                     font=("Arial", 12),
-                     bg=COLOR_FONDO,
-                     fg=COLOR_TEXTO)
-subtitulo.pack(pady=5)
-
-# Frame principal con dos columnas
-frame_principal = tk.Frame(ventana, bg=COLOR_FONDO)
-frame_principal.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
-
-# Columna izquierda - Entradas y controles
-frame_izquierda = tk.Frame(frame_principal, bg=COLOR_FONDO)
-frame_izquierda.pack(side=tk.LEFT, padx=10, fill=tk.BOTH, expand=True)
-
-# Frame de entrada de datos
-frame_entradas = tk.LabelFrame(frame_izquierda, 
-                               text="📝 DATOS DE ENTRADA",
-                               font=("Arial", 11, "bold"),
-                               bg=COLOR_FONDO,
-                               fg=COLOR_SECUNDARIO,
-                               padx=15,
-                               pady=15)
-frame_entradas.pack(fill=tk.X, pady=(0, 15))
-
-# Función para crear filas de entrada
 def crear_fila_entrada(parent, texto, variable, row):
+    """Etiqueta y campo de entrada en la fila `row` de una grilla; devuelve el campo"""
     tk.Label(parent, text=texto, bg=COLOR_FONDO, fg=COLOR_TEXTO, 
              font=("Arial", 10)).grid(row=row, column=0, sticky="w", pady=5)
     entrada = tk.Entry(parent, width=20, font=("Arial", 10), 
@@ -304,153 +1535,236 @@ def crear_fila_entrada(parent, texto, variable, row):
     entrada.grid(row=row, column=1, padx=10, pady=5)
     return entrada
 
-# Crear campos de entrada
-entrada_capital = crear_fila_entrada(frame_entradas, "Capital inicial ($):", "", 0)
-entrada_tasa = crear_fila_entrada(frame_entradas, "Tasa de interés anual (%):", "", 1)
-entrada_tiempo = crear_fila_entrada(frame_entradas, "Tiempo (años):", "", 2)
-entrada_periodos = crear_fila_entrada(frame_entradas, "Periodos por año:", "", 3)
-
-# Configurar valores por defecto
-entrada_capital.insert(0, "1000")
-entrada_tasa.insert(0, "5")
-entrada_tiempo.insert(0, "10")
-entrada_periodos.insert(0, "12")
-
-# Campo para objetivo (tiempo)
-frame_objetivo = tk.Frame(frame_izquierda, bg=COLOR_FONDO)
-frame_objetivo.pack(fill=tk.X, pady=(0, 15))
-
-tk.Label(frame_objetivo, text="Objetivo - Calcular tiempo para:", 
-         bg=COLOR_FONDO, fg=COLOR_TEXTO, font=("Arial", 10, "bold")).pack(anchor="w")
-frame_obj_input = tk.Frame(frame_objetivo, bg=COLOR_FONDO)
-frame_obj_input.pack(fill=tk.X, pady=5)
-
-tk.Label(frame_obj_input, text="Monto objetivo ($):", bg=COLOR_FONDO, 
-         fg=COLOR_TEXTO, font=("Arial", 10)).pack(side=tk.LEFT)
-entrada_objetivo = tk.Entry(frame_obj_input, width=20, font=("Arial", 10), 
-                           bg=COLOR_ENTRADA, relief=tk.SOLID, borderwidth=1)
-entrada_objetivo.pack(side=tk.LEFT, padx=10)
-entrada_objetivo.insert(0, "2000")
-
-# Frame de botones
-frame_botones = tk.Frame(frame_izquierda, bg=COLOR_FONDO)
-frame_botones.pack(fill=tk.X, pady=(0, 15))
-
-# Botones principales
-btn_calcular = tk.Button(frame_botones, text="Calcular Monto Final", 
-                        font=("Arial", 10, "bold"),
-                        bg=COLOR_BOTON,
-                        fg="white",
-                        relief=tk.RAISED,
-                        borderwidth=2,
-                        width=20,
-                        height=2,
-                        command=calcular_monto_final)
-btn_calcular.pack(side=tk.LEFT, padx=5, pady=5)
-
-btn_tiempo = tk.Button(frame_botones, text="Calcular Tiempo", 
-                      font=("Arial", 10, "bold"),
-                      bg=COLOR_TERCIARIO,
-                      fg=COLOR_TEXTO,
-                      relief=tk.RAISED,
-                      borderwidth=2,
-                      width=20,
-                      height=2,
-                      command=calcular_tiempo_objetivo)
-btn_tiempo.pack(side=tk.LEFT, padx=5, pady=5)
-
-btn_limpiar = tk.Button(frame_botones, text="Limpiar Todo", 
-                       font=("Arial", 10, "bold"),
-                       bg="#E74C3C",
-                       fg="white",
-                       relief=tk.RAISED,
-                       borderwidth=2,
-                       width=20,
-                       height=2,
-                       command=limpiar_campos)
-btn_limpiar.pack(side=tk.LEFT, padx=5, pady=5)
-
-# Aplicar efectos hover
-crear_efecto_hover(btn_calcular, COLOR_BOTON, COLOR_BOTON_HOVER)
-crear_efecto_hover(btn_tiempo, COLOR_TERCIARIO, COLOR_SECUNDARIO)
-crear_efecto_hover(btn_limpiar, "#E74C3C", "#C0392B")
-
-# Frame de resultados
-frame_resultados = tk.LabelFrame(frame_izquierda, 
-                                text="📊 RESULTADOS",
-                                font=("Arial", 11, "bold"),
-                                bg=COLOR_FONDO,
-                                fg=COLOR_SECUNDARIO,
-                                padx=15,
-                                pady=15)
-frame_resultados.pack(fill=tk.BOTH, expand=True)
-
-# Variables para resultados
-resultado_var = tk.StringVar(value="$0.00")
-interes_var = tk.StringVar(value="$0.00")
-tiempo_var = tk.StringVar(value="0 años")
-
-# Mostrar resultados
-tk.Label(frame_resultados, text="Monto Final:", bg=COLOR_FONDO, 
-         fg=COLOR_TEXTO, font=("Arial", 10)).grid(row=0, column=0, sticky="w", pady=5)
-tk.Label(frame_resultados, textvariable=resultado_var, bg=COLOR_FONDO, 
-         fg=COLOR_EXITO, font=("Arial", 12, "bold")).grid(row=0, column=1, sticky="w", padx=10)
-
-tk.Label(frame_resultados, text="Interés Generado:", bg=COLOR_FONDO, 
-         fg=COLOR_TEXTO, font=("Arial", 10)).grid(row=1, column=0, sticky="w", pady=5)
-tk.Label(frame_resultados, textvariable=interes_var, bg=COLOR_FONDO, 
-         fg=COLOR_EXITO, font=("Arial", 12, "bold")).grid(row=1, column=1, sticky="w", padx=10)
-
-tk.Label(frame_resultados, text="Tiempo Necesario:", bg=COLOR_FONDO, 
-         fg=COLOR_TEXTO, font=("Arial", 10)).grid(row=2, column=0, sticky="w", pady=5)
-tk.Label(frame_resultados, textvariable=tiempo_var, bg=COLOR_FONDO, 
-         fg=COLOR_EXITO, font=("Arial", 12, "bold")).grid(row=2, column=1, sticky="w", padx=10)
-
-# Gráfico simple
-frame_grafico = tk.Frame(frame_resultados, bg="white", relief=tk.SUNKEN, borderwidth=2)
-frame_grafico.grid(row=3, column=0, columnspan=2, pady=15, sticky="nsew")
-frame_resultados.grid_rowconfigure(3, weight=1)
-frame_resultados.grid_columnconfigure(0, weight=1)
-frame_resultados.grid_columnconfigure(1, weight=1)
-
-canvas_grafico = tk.Canvas(frame_grafico, bg="white", width=400, height=200)
-canvas_grafico.pack(padx=5, pady=5)
-
-# Columna derecha - Explicación
-frame_derecha = tk.Frame(frame_principal, bg=COLOR_FONDO)
-frame_derecha.pack(side=tk.RIGHT, padx=10, fill=tk.BOTH, expand=True)
-
-frame_explicacion = tk.LabelFrame(frame_derecha,
-                                 text="📚 EXPLICACIÓN PASO A PASO",
-                                 font=("Arial", 11, "bold"),
-                                 bg=COLOR_FONDO,
-                                 fg=COLOR_SECUNDARIO,
-                                 padx=15,
-                                 pady=15)
-frame_explicacion.pack(fill=tk.BOTH, expand=True)
-
-# Área de texto para explicación
-texto_explicacion = tk.Text(frame_explicacion,
-                           wrap=tk.WORD,
-                           width=45,
-                           height=20,
-                           font=("Arial", 10),
-                           bg="#FFFFFF",
-                           fg=COLOR_TEXTO,
-                           relief=tk.SOLID,
-                           borderwidth=1,
-                           padx=10,
-                           pady=10)
-texto_explicacion.pack(fill=tk.BOTH, expand=True)
+def configurar_ventana_principal():
+    """Construye la ventana principal y todos sus componentes
 
-# Barra de desplazamiento para el texto
-scrollbar = tk.Scrollbar(texto_explicacion)
-scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-texto_explicacion.config(yscrollcommand=scrollbar.set)
-scrollbar.config(command=texto_explicacion.yview)
-
-# Insertar texto introductorio
-intro_texto = """👋 BIENVENIDO A LA CALCULADORA DE INTERÉS COMPUESTO
+    Se arma dentro de una función para que importar este archivo (por
+    ejemplo desde los procesos de la simulación) no abra ninguna ventana.
+    """
+    global ventana, canvas_grafico, texto_explicacion
+    global entrada_capital, entrada_tasa, entrada_tiempo, entrada_periodos, entrada_objetivo
+    global modo_exacto, entrada_precision, redondeo_var
+    global resultado_var, interes_var, tiempo_var
+    
+    # Crear ventana principal
+    ventana = tk.Tk()
+    ventana.title("Calculadora Educativa de Interés Compuesto")
+    ventana.geometry("900x900")
+    ventana.configure(bg=COLOR_FONDO)
+    ventana.resizable(False, False)
+
+    # Centrar ventana en pantalla
+    ventana.update_idletasks()
+    ancho_ventana = ventana.winfo_width()
+    alto_ventana = ventana.winfo_height()
+    ancho_pantalla = ventana.winfo_screenwidth()
+    alto_pantalla = ventana.winfo_screenheight()
+    x = (ancho_pantalla // 2) - (ancho_ventana // 2)
+    y = (alto_pantalla // 2) - (alto_ventana // 2)
+    ventana.geometry(f'{ancho_ventana}x{alto_ventana}+{x}+{y}')
+
+    # ============================================================================
+    # WIDGETS DE LA INTERFAZ
+    # ============================================================================
+
+    # Título principal
+    frame_titulo = tk.Frame(ventana, bg=COLOR_FONDO)
+    frame_titulo.pack(pady=20)
+
+    titulo = tk.Label(frame_titulo, 
+                      text="💸 CALCULADORA DE INTERÉS COMPUESTO", 
+                      font=("Arial", 20, "bold"),
+                      bg=COLOR_FONDO,
+                      fg=COLOR_SECUNDARIO)
+    titulo.pack()
+
+    subtitulo = tk.Label(frame_titulo,
+                         text="Herramienta educativa para estudiantes de bachillerato",
+                         font=("Arial", 12),
+                         bg=COLOR_FONDO,
+                         fg=COLOR_TEXTO)
+    subtitulo.pack(pady=5)
+
+    # Frame principal con dos columnas
+    frame_principal = tk.Frame(ventana, bg=COLOR_FONDO)
+    frame_principal.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
+
+    # Columna izquierda - Entradas y controles
+    frame_izquierda = tk.Frame(frame_principal, bg=COLOR_FONDO)
+    frame_izquierda.pack(side=tk.LEFT, padx=10, fill=tk.BOTH, expand=True)
+
+    # Frame de entrada de datos
+    frame_entradas = tk.LabelFrame(frame_izquierda, 
+                                   text="📝 DATOS DE ENTRADA",
+                                   font=("Arial", 11, "bold"),
+                                   bg=COLOR_FONDO,
+                                   fg=COLOR_SECUNDARIO,
+                                   padx=15,
+                                   pady=15)
+    frame_entradas.pack(fill=tk.X, pady=(0, 15))
+
+    # Crear campos de entrada
+    entrada_capital = crear_fila_entrada(frame_entradas, "Capital inicial ($):", "", 0)
+    entrada_tasa = crear_fila_entrada(frame_entradas, "Tasa de interés anual (%):", "", 1)
+    entrada_tiempo = crear_fila_entrada(frame_entradas, "Tiempo (años):", "", 2)
+    entrada_periodos = crear_fila_entrada(frame_entradas, "Periodos por año:", "", 3)
+
+    # Configurar valores por defecto
+    entrada_capital.insert(0, "1000")
+    entrada_tasa.insert(0, "5")
+    entrada_tiempo.insert(0, "10")
+    entrada_periodos.insert(0, "12")
+
+    # Modo exacto: Decimal con precisión y redondeo configurables
+    modo_exacto = tk.BooleanVar(value=False)
+    frame_exacto = tk.Frame(frame_entradas, bg=COLOR_FONDO)
+    frame_exacto.grid(row=4, column=0, columnspan=2, sticky="w", pady=5)
+    tk.Checkbutton(frame_exacto, text="Exacto (Decimal), dígitos:", variable=modo_exacto,
+                   bg=COLOR_FONDO, fg=COLOR_TEXTO, font=("Arial", 10),
+                   activebackground=COLOR_FONDO).pack(side=tk.LEFT)
+    entrada_precision = tk.Entry(frame_exacto, width=5, font=("Arial", 10), 
+                                 bg=COLOR_ENTRADA, relief=tk.SOLID, borderwidth=1)
+    entrada_precision.pack(side=tk.LEFT, padx=5)
+    entrada_precision.insert(0, str(PRECISION_EXACTA))
+    redondeo_var = tk.StringVar(value="mitad hacia arriba")
+    ttk.Combobox(frame_exacto, textvariable=redondeo_var, values=list(REDONDEOS),
+                 state="readonly", width=16, font=("Arial", 10)).pack(side=tk.LEFT, padx=5)
+
+    # Campo para objetivo (tiempo)
+    frame_objetivo = tk.Frame(frame_izquierda, bg=COLOR_FONDO)
+    frame_objetivo.pack(fill=tk.X, pady=(0, 15))
+
+    tk.Label(frame_objetivo, text="Objetivo - Calcular tiempo para:", 
+             bg=COLOR_FONDO, fg=COLOR_TEXTO, font=("Arial", 10, "bold")).pack(anchor="w")
+    frame_obj_input = tk.Frame(frame_objetivo, bg=COLOR_FONDO)
+    frame_obj_input.pack(fill=tk.X, pady=5)
+
+    tk.Label(frame_obj_input, text="Monto objetivo ($):", bg=COLOR_FONDO, 
+             fg=COLOR_TEXTO, font=("Arial", 10)).pack(side=tk.LEFT)
+    entrada_objetivo = tk.Entry(frame_obj_input, width=20, font=("Arial", 10), 
+                               bg=COLOR_ENTRADA, relief=tk.SOLID, borderwidth=1)
+    entrada_objetivo.pack(side=tk.LEFT, padx=10)
+    entrada_objetivo.insert(0, "2000")
+
+    # Frame de botones
+    frame_botones = tk.Frame(frame_izquierda, bg=COLOR_FONDO)
+    frame_botones.pack(fill=tk.X, pady=(0, 15))
+
+    # Botones principales
+    btn_calcular = tk.Button(frame_botones, text="Calcular Monto Final", 
+                            font=("Arial", 10, "bold"),
+                            bg=COLOR_BOTON,
+                            fg="white",
+                            relief=tk.RAISED,
+                            borderwidth=2,
+                            width=20,
+                            height=2,
+                            command=calcular_monto_final)
+    btn_calcular.pack(side=tk.LEFT, padx=5, pady=5)
+
+    btn_tiempo = tk.Button(frame_botones, text="Calcular Tiempo", 
+                          font=("Arial", 10, "bold"),
+                          bg=COLOR_TERCIARIO,
+                          fg=COLOR_TEXTO,
+                          relief=tk.RAISED,
+                          borderwidth=2,
+                          width=20,
+                          height=2,
+                          command=calcular_tiempo_objetivo)
+    btn_tiempo.pack(side=tk.LEFT, padx=5, pady=5)
+
+    btn_limpiar = tk.Button(frame_botones, text="Limpiar Todo", 
+                           font=("Arial", 10, "bold"),
+                           bg="#E74C3C",
+                           fg="white",
+                           relief=tk.RAISED,
+                           borderwidth=2,
+                           width=20,
+                           height=2,
+                           command=limpiar_campos)
+    btn_limpiar.pack(side=tk.LEFT, padx=5, pady=5)
+
+    # Aplicar efectos hover
+    crear_efecto_hover(btn_calcular, COLOR_BOTON, COLOR_BOTON_HOVER)
+    crear_efecto_hover(btn_tiempo, COLOR_TERCIARIO, COLOR_SECUNDARIO)
+    crear_efecto_hover(btn_limpiar, "#E74C3C", "#C0392B")
+
+    # Frame de resultados
+    frame_resultados = tk.LabelFrame(frame_izquierda, 
+                                    text="📊 RESULTADOS",
+                                    font=("Arial", 11, "bold"),
+                                    bg=COLOR_FONDO,
+                                    fg=COLOR_SECUNDARIO,
+                                    padx=15,
+                                    pady=15)
+    frame_resultados.pack(fill=tk.BOTH, expand=True)
+
+    # Variables para resultados
+    resultado_var = tk.StringVar(value="$0.00")
+    interes_var = tk.StringVar(value="$0.00")
+    tiempo_var = tk.StringVar(value="0 años")
+
+    # Mostrar resultados
+    tk.Label(frame_resultados, text="Monto Final:", bg=COLOR_FONDO, 
+             fg=COLOR_TEXTO, font=("Arial", 10)).grid(row=0, column=0, sticky="w", pady=5)
+    tk.Label(frame_resultados, textvariable=resultado_var, bg=COLOR_FONDO, 
+             fg=COLOR_EXITO, font=("Arial", 12, "bold")).grid(row=0, column=1, sticky="w", padx=10)
+
+    tk.Label(frame_resultados, text="Interés Generado:", bg=COLOR_FONDO, 
+             fg=COLOR_TEXTO, font=("Arial", 10)).grid(row=1, column=0, sticky="w", pady=5)
+    tk.Label(frame_resultados, textvariable=interes_var, bg=COLOR_FONDO, 
+             fg=COLOR_EXITO, font=("Arial", 12, "bold")).grid(row=1, column=1, sticky="w", padx=10)
+
+    tk.Label(frame_resultados, text="Tiempo Necesario:", bg=COLOR_FONDO, 
+             fg=COLOR_TEXTO, font=("Arial", 10)).grid(row=2, column=0, sticky="w", pady=5)
+    tk.Label(frame_resultados, textvariable=tiempo_var, bg=COLOR_FONDO, 
+             fg=COLOR_EXITO, font=("Arial", 12, "bold")).grid(row=2, column=1, sticky="w", padx=10)
+
+    # Gráfico simple
+    frame_grafico = tk.Frame(frame_resultados, bg="white", relief=tk.SUNKEN, borderwidth=2)
+    frame_grafico.grid(row=3, column=0, columnspan=2, pady=15, sticky="nsew")
+    frame_resultados.grid_rowconfigure(3, weight=1)
+    frame_resultados.grid_columnconfigure(0, weight=1)
+    frame_resultados.grid_columnconfigure(1, weight=1)
+
+    canvas_grafico = tk.Canvas(frame_grafico, bg="white", width=400, height=200)
+    canvas_grafico.pack(padx=5, pady=5)
+
+    # Columna derecha - Explicación
+    frame_derecha = tk.Frame(frame_principal, bg=COLOR_FONDO)
+    frame_derecha.pack(side=tk.RIGHT, padx=10, fill=tk.BOTH, expand=True)
+
+    frame_explicacion = tk.LabelFrame(frame_derecha,
+                                     text="📚 EXPLICACIÓN PASO A PASO",
+                                     font=("Arial", 11, "bold"),
+                                     bg=COLOR_FONDO,
+                                     fg=COLOR_SECUNDARIO,
+                                     padx=15,
+                                     pady=15)
+    frame_explicacion.pack(fill=tk.BOTH, expand=True)
+
+    # Área de texto para explicación
+    texto_explicacion = tk.Text(frame_explicacion,
+                               wrap=tk.WORD,
+                               width=45,
+                               height=20,
+                               font=("Arial", 10),
+                               bg="#FFFFFF",
+                               fg=COLOR_TEXTO,
+                               relief=tk.SOLID,
+                               borderwidth=1,
+                               padx=10,
+                               pady=10)
+    texto_explicacion.pack(fill=tk.BOTH, expand=True)
+
+    # Barra de desplazamiento para el texto
+    scrollbar = tk.Scrollbar(texto_explicacion)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    texto_explicacion.config(yscrollcommand=scrollbar.set)
+    scrollbar.config(command=texto_explicacion.yview)
+
+    # Insertar texto introductorio
+    intro_texto = """👋 BIENVENIDO A LA CALCULADORA DE INTERÉS COMPUESTO
 
 Esta herramienta te ayudará a entender cómo funciona el interés compuesto, uno de los conceptos más importantes en finanzas.
 
@@ -467,38 +1781,83 @@ Prueba diferentes valores para ver cómo cambian los resultados:
 • Más periodos = mayor capitalización
 
 ¡Comienza ingresando tus valores y haz clic en calcular!"""
-texto_explicacion.insert(1.0, intro_texto)
-
-# Frame inferior con botón de información
-frame_inferior = tk.Frame(ventana, bg=COLOR_FONDO)
-frame_inferior.pack(pady=10)
-
-btn_info = tk.Button(frame_inferior, text="📖 ¿Qué es el Interés Compuesto?", 
-                    font=("Arial", 10, "bold"),
-                    bg=COLOR_PRIMARIO,
-                    fg="white",
-                    relief=tk.RAISED,
-                    borderwidth=2,
-                    width=30,
-                    height=2,
-                    command=mostrar_info_interes)
-btn_info.pack(pady=5)
-crear_efecto_hover(btn_info, COLOR_PRIMARIO, COLOR_SECUNDARIO)
-
-# Pie de página
-pie = tk.Label(ventana, 
-               text="Herramienta educativa para bachillerato - © 2024",
-               font=("Arial", 9),
-               bg=COLOR_FONDO,
-               fg=COLOR_TEXTO)
-pie.pack(pady=10)
+    texto_explicacion.insert(1.0, intro_texto)
+
+    # Frame inferior con botón de información
+    frame_inferior = tk.Frame(ventana, bg=COLOR_FONDO)
+    frame_inferior.pack(pady=10)
+
+    btn_info = tk.Button(frame_inferior, text="📖 ¿Qué es el Interés Compuesto?", 
+                        font=("Arial", 10, "bold"),
+                        bg=COLOR_PRIMARIO,
+                        fg="white",
+                        relief=tk.RAISED,
+                        borderwidth=2,
+                        width=30,
+                        height=2,
+                        command=mostrar_info_interes)
+    btn_info.pack(side=tk.LEFT, padx=5, pady=5)
+    crear_efecto_hover(btn_info, COLOR_PRIMARIO, COLOR_SECUNDARIO)
+
+    btn_tabla = tk.Button(frame_inferior, text="📋 Tabla por Periodo", 
+                         font=("Arial", 10, "bold"),
+                         bg=COLOR_TERCIARIO,
+                         fg=COLOR_TEXTO,
+                         relief=tk.RAISED,
+                         borderwidth=2,
+                         width=20,
+                         height=2,
+                         command=mostrar_tabla_periodos)
+    btn_tabla.pack(side=tk.LEFT, padx=5, pady=5)
+    crear_efecto_hover(btn_tabla, COLOR_TERCIARIO, COLOR_SECUNDARIO)
+
+    btn_barrido = tk.Button(frame_inferior, text="🗺️ Barrido de Escenarios", 
+                           font=("Arial", 10, "bold"),
+                           bg=COLOR_TERCIARIO,
+                           fg=COLOR_TEXTO,
+                           relief=tk.RAISED,
+                           borderwidth=2,
+                           width=24,
+                           height=2,
+                           command=mostrar_barrido_escenarios)
+    btn_barrido.pack(side=tk.LEFT, padx=5, pady=5)
+    crear_efecto_hover(btn_barrido, COLOR_TERCIARIO, COLOR_SECUNDARIO)
+
+    btn_montecarlo = tk.Button(frame_inferior, text="🎲 Monte Carlo", 
+                              font=("Arial", 10, "bold"),
+                              bg=COLOR_TERCIARIO,
+                              fg=COLOR_TEXTO,
+                              relief=tk.RAISED,
+                              borderwidth=2,
+                              width=16,
+                              height=2,
+                              command=mostrar_montecarlo)
+    btn_montecarlo.pack(side=tk.LEFT, padx=5, pady=5)
+    crear_efecto_hover(btn_montecarlo, COLOR_TERCIARIO, COLOR_SECUNDARIO)
+
+    # Pie de página
+    pie = tk.Label(ventana, 
+                   text="Herramienta educativa para bachillerato - © 2024",
+                   font=("Arial", 9),
+                   bg=COLOR_FONDO,
+                   fg=COLOR_TEXTO)
+    pie.pack(pady=10)
+    
+    return ventana
 
 # ============================================================================
 # INICIALIZAR APLICACIÓN
 # ============================================================================
 
-# Ejecutar cálculos iniciales para mostrar ejemplo
-ventana.after(100, calcular_monto_final)
-
-# Iniciar loop principal
-ventana.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    # Con argumentos se trabaja sin ventana (por ejemplo: benchmark --tiempo 100 --periodos 365)
+    if len(sys.argv) > 1:
+        sys.exit(ejecutar_linea_de_comandos(sys.argv[1:]))
+    
+    ventana = configurar_ventana_principal()
+    
+    # Ejecutar cálculos iniciales para mostrar ejemplo
+    ventana.after(100, calcular_monto_final)
+    
+    # Iniciar loop principal
+    ventana.mainloop()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BENCHMARK DEL EXPLORADOR DE NÚMEROS PRIMOS
+Descripción: Mide tiempo y memoria pico de las funciones matemáticas de
+             app_primos.py para tamaños crecientes (curvas de escalado),
+             guarda los resultados en JSON y los compara con una base.
+
+Uso:
+    python benchmark_primos.py --salida resultados.json
+    python benchmark_primos.py --base base.json --umbral 0.25
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import app_primos
+
+# ============================================
+# CONFIGURACIÓN
+# ============================================
+EXPONENTE_MINIMO = 3            # n desde 10^3 ...
+EXPONENTE_MAXIMO = 9            # ... hasta 10^9
+DIGITOS_FACTORIZACION = (6, 12, 18, 24, 30)
+NUMEROS_POR_MEDICION = 1000     # es_primo se mide sobre este bloque de enteros
+SEMILLA = 2024                  # los semiprimos de prueba son siempre los mismos
+UMBRAL_REGRESION = 0.25         # 25 % más lento (o más memoria) = regresión
+TIEMPO_MINIMO = 0.005           # por debajo de esto el ruido domina: no se compara
+MEMORIA_MINIMA = 1 << 20        # ídem para la memoria pico (bytes)
+REPETICIONES = 5                # se compara el mejor tiempo de hasta tantas corridas...
+TIEMPO_REPETICIONES = 1.0       # ... mientras el caso no lleve más de estos segundos
+
+# ============================================
+# MEDICIÓN
+# ============================================
+def medir(funcion, repeticiones=REPETICIONES, presupuesto=TIEMPO_REPETICIONES):
+    """Devuelve (mejor tiempo en segundos, memoria pico en bytes) de funcion()
+
+    El tiempo se toma sin tracemalloc (que frena bastante al intérprete) y la
+    memoria pico en una ejecución aparte. Los casos que ya pasaron el
+    presupuesto de segundos no se repiten: en ellos el ruido pesa poco.
+    """
+    mejor = float("inf")
+    gastado = 0.0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        segundos = time.perf_counter() - inicio
+        mejor = min(mejor, segundos)
+        gastado += segundos
+        if gastado >= presupuesto:
+            break
+    tracemalloc.start()
+    try:
+        funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return mejor, pico
+
+def semiprimo(digitos, generador):
+    """Producto de dos primos de digitos/2 cifras cada uno"""
+    mitad = max(digitos // 2, 1)
+    factores = []
+    while len(factores) < 2:
+        candidato = generador.randrange(10 ** (mitad - 1), 10 ** mitad)
+        if app_primos.es_primo(candidato):
+            factores.append(candidato)
+    return factores[0] * factores[1]
+
+def factorizar_con_semilla(n):
+    """factorizacion_prima(n) con el azar de Pollard–Brent y ECM fijado
+
+    Así la base y la corrida actual prueban las mismas semillas y curvas.
+    """
+    random.seed(SEMILLA)
+    return app_primos.factorizacion_prima(n)
+
+def casos(exponente_maximo, digitos_maximos):
+    """Genera (función, tamaño, invocable) para todas las mediciones"""
+    for k in range(EXPONENTE_MINIMO, exponente_maximo + 1):
+        n = 10 ** k
+        yield ("es_primo", n,
+               lambda n=n: [app_primos.es_primo(x) for x in range(n, n + NUMEROS_POR_MEDICION)])
+    for k in range(EXPONENTE_MINIMO, exponente_maximo + 1):
+        n = 10 ** k
+        yield "generar_primos_hasta", n, lambda n=n: app_primos.generar_primos_hasta(n)
+    generador = random.Random(SEMILLA)
+    for digitos in DIGITOS_FACTORIZACION:
+        if digitos > digitos_maximos:
+            break
+        n = semiprimo(digitos, generador)
+        yield "factorizacion_prima", digitos, lambda n=n: factorizar_con_semilla(n)
+
+def ejecutar(exponente_maximo, digitos_maximos, repeticiones):
+    """Corre todas las mediciones y devuelve el informe como diccionario"""
+    resultados = []
+    for nombre, tamaño, funcion in casos(exponente_maximo, digitos_maximos):
+        segundos, pico = medir(funcion, repeticiones)
+        resultados.append({
+            "funcion": nombre,
+            "tamaño": tamaño,
+            "segundos": segundos,
+            "memoria_pico": pico
+        })
+        print(f"{nombre:<22} {tamaño:>12}   {segundos:10.4f} s   {pico / 2 ** 20:10.2f} MiB")
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados
+    }
+
+# ============================================
+# COMPARACIÓN CON LA BASE
+# ============================================
+def comparar(informe, base, umbral=UMBRAL_REGRESION, tiempo_minimo=TIEMPO_MINIMO,
+             memoria_minima=MEMORIA_MINIMA):
+    """Lista de regresiones (texto) del informe respecto de la base"""
+    anteriores = {(r["funcion"], r["tamaño"]): r for r in base["resultados"]}
+    regresiones = []
+    for actual in informe["resultados"]:
+        anterior = anteriores.get((actual["funcion"], actual["tamaño"]))
+        if anterior is None:
+            continue
+        nombre = f"{actual['funcion']}({actual['tamaño']})"
+        if max(actual["segundos"], anterior["segundos"]) >= tiempo_minimo:
+            razon = actual["segundos"] / max(anterior["segundos"], 1e-12)
+            if razon > 1 + umbral:
+                regresiones.append(
+                    f"{nombre}: tiempo x{razon:.2f} "
+                    f"({anterior['segundos']:.4f} s → {actual['segundos']:.4f} s)"
+                )
+        if max(actual["memoria_pico"], anterior["memoria_pico"]) < memoria_minima:
+            continue
+        razon = actual["memoria_pico"] / max(anterior["memoria_pico"], 1)
+        if razon > 1 + umbral:
+            regresiones.append(
+                f"{nombre}: memoria x{razon:.2f} "
+                f"({anterior['memoria_pico']} → {actual['memoria_pico']} bytes)"
+            )
+    return regresiones
+
+# ============================================
+# PUNTO DE INICIO
+# ============================================
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--salida", default="benchmark_primos.json",
+                        help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--base", help="JSON de una corrida anterior para comparar")
+    parser.add_argument("--umbral", type=float, default=UMBRAL_REGRESION,
+                        help="regresión tolerada (0.25 = 25 %%)")
+    parser.add_argument("--max-exponente", type=int, default=EXPONENTE_MAXIMO,
+                        help="mayor k de la serie n = 10^k")
+    parser.add_argument("--max-digitos", type=int, default=DIGITOS_FACTORIZACION[-1],
+                        help="mayor cantidad de dígitos a factorizar")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES,
+                        help="se toma el mejor tiempo de hasta estas repeticiones")
+    opciones = parser.parse_args(argumentos)
+
+    informe = ejecutar(opciones.max_exponente, opciones.max_digitos, opciones.repeticiones)
+    with open(opciones.salida, "w", encoding="utf-8") as archivo:
+        json.dump(informe, archivo, indent=2, ensure_ascii=False)
+    print(f"\nResultados guardados en {opciones.salida}")
+
+    if opciones.base:
+        with open(opciones.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(informe, base, opciones.umbral)
+        if regresiones:
+            print(f"\n❌ {len(regresiones)} regresiones (umbral {opciones.umbral:.0%}):")
+            for regresion in regresiones:
+                print(f"  • {regresion}")
+            return 1
+        print(f"\n✅ Sin regresiones respecto de {opciones.base}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())